@@ -0,0 +1,84 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Awaitable, Iterable, List
+
+from allure import step
+from requests import Session
+
+from api.base_api import BaseApi
+from api.cassette import Cassette
+from api.response_cache import ResponseCache
+from api.retry import RetryPolicy
+
+
+class AsyncBaseApi(BaseApi):
+    def __init__(
+            self,
+            api_base_url,
+            session: Session = None,
+            retry: RetryPolicy = None,
+            cassette: Cassette = None,
+            cache: ResponseCache = None,
+            concurrency: int = 10
+    ):
+        super().__init__(api_base_url=api_base_url, session=session, retry=retry, cassette=cassette, cache=cache)
+        self.concurrency = max(int(concurrency), 1)
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _run_in_executor(self, function, *args, **kwargs):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='api')
+        return asyncio.get_running_loop().run_in_executor(self._executor, partial(function, *args, **kwargs))
+
+    async def send_get(self, url='/', params=None, auth=None, use_cache=True):
+        return await self._run_in_executor(self._get, url, params=params, auth=auth, use_cache=use_cache)
+
+    async def send_post(self, data=None, url='/', files=None, auth=None, is_json=None):
+        return await self._run_in_executor(self._post, data=data, url=url, files=files, auth=auth, is_json=is_json)
+
+    @staticmethod
+    async def gather(*aws: Awaitable) -> list:
+        return list(await asyncio.gather(*aws))
+
+    @staticmethod
+    def _check_no_running_loop():
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        raise RuntimeError('AsyncBaseApi.run нельзя вызывать внутри запущенного event loop, '
+                           'используйте await api.gather(...)')
+
+    @classmethod
+    def run(cls, aw: Awaitable):
+        try:
+            cls._check_no_running_loop()
+        except RuntimeError:
+            if asyncio.iscoroutine(aw):
+                aw.close()
+            raise
+        return asyncio.run(aw)
+
+    def get_many(self, urls: Iterable[str]) -> List:
+        self._check_no_running_loop()
+        urls = list(urls)
+        with step(f'Отправка {len(urls)} GET запросов'):
+            return self.run(self.gather(*(self.send_get(url=url) for url in urls)))
+
+    def post_many(self, url: str, items: Iterable) -> List:
+        self._check_no_running_loop()
+        items = list(items)
+        with step(f'Отправка {len(items)} POST запросов на url - {url}'):
+            return self.run(self.gather(*(self.send_post(data=data, url=url) for data in items)))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
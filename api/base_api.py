@@ -1,37 +1,92 @@
 from allure import step
-from requests import Session, get
+from requests import Request, Response, Session
+
+from api.cassette import Cassette, CassetteError
+from api.response_cache import ResponseCache
+from api.retry import RetryPolicy
+from api.transport import create_session
 
 
 class BaseApi:
-    def __init__(self, api_base_url, session=Session()):
+    def __init__(
+            self,
+            api_base_url,
+            session: Session = None,
+            retry: RetryPolicy = None,
+            cassette: Cassette = None,
+            cache: ResponseCache = None
+    ):
         self.api_base_url = api_base_url
-        self.session = session
+        self.session = session or create_session()
+        self.retry = retry or RetryPolicy()
+        self.cassette = cassette
+        self.cache = cache
+
+    def _request(self, method: str, url: str, **kwargs) -> Response:
+        url = f'{self.api_base_url}/{url}'
+
+        def send() -> Response:
+            return self.retry.call(
+                method,
+                lambda timeout: self.session.request(method=method, url=url, verify=False, timeout=timeout, **kwargs)
+            )
+
+        if self.cassette is None:
+            return send()
+        return self.cassette.request(
+            method, url, send, authorization=self._authorization(url, kwargs.get('auth')), **kwargs
+        )
+
+    def _authorization(self, url: str, auth=None) -> str:
+        request = self.session.prepare_request(Request('GET', url, auth=auth))
+        return request.headers.get('Authorization')
+
+    def _cached_get(self, url: str, params=None, auth=None, use_cache: bool = True) -> Response:
+        if self.cache is None or not use_cache:
+            return self._request('GET', url, params=params, auth=auth)
+        full_url = f'{self.api_base_url}/{url}'
+        return self.cache.get(
+            self.cache.key(
+                url=full_url,
+                params=params,
+                authorization=self._authorization(full_url, auth)
+            ),
+            lambda headers: self._request('GET', url, params=params, auth=auth, headers=headers)
+        )
 
     @step('Отправка GET запроса на url - {url}')
-    def send_get(self, url='/'):
+    def send_get(self, url='/', params=None, auth=None, use_cache=True):
+        return self._get(url, params=params, auth=auth, use_cache=use_cache)
+
+    @step('Отправка POST запроса на url - {url}')
+    def send_post(self, data=None, url='/', files=None, auth=None, is_json=None):
+        return self._post(data=data, url=url, files=files, auth=auth, is_json=is_json)
+
+    def _get(self, url='/', params=None, auth=None, use_cache=True):
         try:
-            return get(url=f'{self.api_base_url}/{url}', verify=False).json()
+            return self._cached_get(url, params=params, auth=auth, use_cache=use_cache).json()
+        except CassetteError:
+            raise
         except Exception as e:
             print('Непредвиденная ошибка:', e)
 
-    @step('Отправка POST запроса на url - {url}')
-    def send_post(self, data=None, url='/', files=None, auth=None):
-        for _ in range(0, 100):
-            if data is None:
-                data = {}
-            if files is None:
-                files = {}
-            try:
-                is_json = isinstance(data, dict)
-                response = self.session.post(
-                    url=f'{self.api_base_url}/{url}',
-                    json=data if is_json else None,
-                    data=None if is_json else data,
-                    files=files,
-                    verify=False,
-                    auth=auth
-                )
-                if response.content != '':
-                    return response.json()
-            except Exception as e:
-                print('Непредвиденная ошибка:', e)
+    def _post(self, data=None, url='/', files=None, auth=None, is_json=None):
+        if data is None:
+            data = {}
+        if is_json is None:
+            is_json = isinstance(data, dict)
+        try:
+            response = self._request(
+                'POST',
+                url,
+                json=data if is_json else None,
+                data=None if is_json else data,
+                files=files or {},
+                auth=auth
+            )
+            if response.content:
+                return response.json()
+        except CassetteError:
+            raise
+        except Exception as e:
+            print('Непредвиденная ошибка:', e)
@@ -0,0 +1,145 @@
+import base64
+import hashlib
+import json
+import os
+from collections import defaultdict
+from os.path import dirname, exists
+from threading import Lock
+from typing import Callable, Optional
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from api.transport import digest, encode_params
+
+MODES = ('record', 'replay', 'strict')
+RESPONSE_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control')
+
+
+class CassetteError(AssertionError):
+    pass
+
+
+class Cassette:
+    def __init__(self, path: str, mode: str):
+        if mode not in MODES:
+            raise ValueError(f'Неизвестный режим кассеты: {mode}. Допустимые значения: {", ".join(MODES)}')
+        self.path = path
+        self.mode = mode
+        self._lock = Lock()
+        self._interactions = []
+        self._replay = defaultdict(list)
+        if mode != 'record' and exists(path):
+            with open(path, encoding='UTF-8') as file:
+                for interaction in json.load(file):
+                    self._replay[self._key(**interaction['request'])].append(interaction['response'])
+
+    @staticmethod
+    def _body(kwargs: dict) -> Optional[str]:
+        if kwargs.get('json') is not None:
+            return json.dumps(kwargs['json'], sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        if kwargs.get('data'):
+            data = kwargs['data']
+            if isinstance(data, bytes):
+                return data.decode('UTF-8', errors='replace')
+            if isinstance(data, dict):
+                return json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+            return str(data)
+        return None
+
+    @staticmethod
+    def _content(value) -> bytes:
+        if hasattr(value, 'read'):
+            position = value.tell()
+            content = value.read()
+            value.seek(position)
+            value = content
+        return value if isinstance(value, bytes) else str(value).encode('UTF-8')
+
+    @classmethod
+    def _files(cls, files) -> Optional[str]:
+        if not files:
+            return None
+        files_hash = hashlib.sha256()
+        for field, value in sorted(files.items() if isinstance(files, dict) else files, key=lambda item: item[0]):
+            if isinstance(value, (list, tuple)):
+                filename, value = value[0], value[1]
+            else:
+                filename = getattr(value, 'name', field)
+            files_hash.update(f'{field}:{filename}:'.encode('UTF-8'))
+            files_hash.update(hashlib.sha256(cls._content(value)).digest())
+        return files_hash.hexdigest()
+
+    @staticmethod
+    def _key(
+            method: str,
+            url: str,
+            body: Optional[str] = None,
+            files: Optional[str] = None,
+            authorization: Optional[str] = None
+    ) -> tuple:
+        return method.upper(), url, body, files, authorization
+
+    @staticmethod
+    def _to_response(data: dict, method: str, url: str) -> Response:
+        response = Response()
+        response.status_code = data['status']
+        response.headers = CaseInsensitiveDict(data.get('headers', {}))
+        if 'body_base64' in data:
+            response._content = base64.b64decode(data['body_base64'])
+        else:
+            response._content = data.get('body', '').encode('UTF-8')
+        response.encoding = 'UTF-8'
+        response.url = url
+        response.reason = 'Replayed'
+        return response
+
+    @staticmethod
+    def _from_response(response: Response) -> dict:
+        data = {
+            'status': response.status_code,
+            'headers': {name: response.headers[name] for name in RESPONSE_HEADERS if name in response.headers}
+        }
+        try:
+            data['body'] = response.content.decode('UTF-8')
+        except UnicodeDecodeError:
+            data['body_base64'] = base64.b64encode(response.content).decode('ascii')
+        return data
+
+    def request(
+            self,
+            method: str,
+            url: str,
+            send: Callable[[], Response],
+            authorization: Optional[str] = None,
+            **kwargs
+    ) -> Response:
+        if kwargs.get('params'):
+            url = f"{url}?{encode_params(kwargs['params'])}"
+        key = self._key(method, url, self._body(kwargs), self._files(kwargs.get('files')), digest(authorization))
+        if self.mode != 'record':
+            with self._lock:
+                responses = self._replay.get(key)
+                data = (responses.pop(0) if len(responses) > 1 else responses[0]) if responses else None
+            if data is not None:
+                return self._to_response(data, method, url)
+            if self.mode == 'strict':
+                raise CassetteError(f'Запрос {method} {url} не найден в кассете {self.path}')
+            print(f'Запрос {method} {url} не найден в кассете {self.path}, отправляется в сеть')
+            return send()
+        response = send()
+        with self._lock:
+            self._interactions.append({
+                'request': dict(zip(('method', 'url', 'body', 'files', 'authorization'), key)),
+                'response': self._from_response(response)
+            })
+        return response
+
+    def save(self):
+        if self.mode != 'record' or not self._interactions:
+            return
+        os.makedirs(dirname(self.path), exist_ok=True)
+        temp = f'{self.path}.{os.getpid()}.tmp'
+        with open(temp, 'w', encoding='UTF-8') as file:
+            json.dump(self._interactions, file, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp, self.path)
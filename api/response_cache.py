@@ -0,0 +1,86 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Mapping, Optional
+
+from requests import Response
+
+from api.transport import digest, encode_params
+
+
+class ResponseCache:
+    def __init__(self, max_size: int = 256, ttl: float = 300, clock: Callable[[], float] = time.monotonic):
+        self.max_size = max(int(max_size), 1)
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    @classmethod
+    def from_settings(cls, settings: Optional[Mapping] = None) -> Optional['ResponseCache']:
+        settings = settings or {}
+        if not settings.get('ENABLED', False):
+            return None
+        return cls(max_size=settings.get('MAX_SIZE', 256), ttl=settings.get('TTL', 300))
+
+    @staticmethod
+    def key(url: str, params=None, authorization: Optional[str] = None) -> tuple:
+        return (
+            url,
+            encode_params(params),
+            digest(authorization)
+        )
+
+    @staticmethod
+    def _cacheable(response: Response) -> bool:
+        return response.status_code == 200 and 'no-store' not in response.headers.get('Cache-Control', '')
+
+    def _lookup(self, key: tuple) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _store(self, key: tuple, response: Response):
+        with self._lock:
+            self._entries[key] = {'response': response, 'stored_at': self._clock()}
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get(self, key: tuple, send: Callable[[dict], Response]) -> Response:
+        entry = self._lookup(key)
+        if entry is not None and self._clock() - entry['stored_at'] < self.ttl:
+            with self._lock:
+                self.hits += 1
+            return entry['response']
+        headers = {}
+        if entry is not None:
+            cached = entry['response']
+            if 'ETag' in cached.headers:
+                headers['If-None-Match'] = cached.headers['ETag']
+            if 'Last-Modified' in cached.headers:
+                headers['If-Modified-Since'] = cached.headers['Last-Modified']
+        response = send(headers)
+        if entry is not None and headers and response.status_code == 304:
+            with self._lock:
+                self.revalidated += 1
+            self._store(key, entry['response'])
+            return entry['response']
+        with self._lock:
+            self.misses += 1
+        if self._cacheable(response):
+            self._store(key, response)
+        return response
+
+    def invalidate(self, url: Optional[str] = None):
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == url]:
+                del self._entries[key]
@@ -0,0 +1,90 @@
+import time
+from threading import Lock
+from typing import Callable, Mapping, Optional
+
+from requests import Response
+from requests.exceptions import ConnectionError, ConnectTimeout, Timeout
+from urllib3.exceptions import NewConnectionError
+
+from core.utils.selene.core import polling
+
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+
+def _is_not_sent(error: Exception) -> bool:
+    if isinstance(error, ConnectTimeout):
+        return True
+    reason = error.args[0] if error.args else None
+    return isinstance(getattr(reason, 'reason', reason), NewConnectionError)
+
+
+class RetryPolicy:
+    def __init__(
+            self,
+            attempts: int = 3,
+            interval: float = 0.3,
+            max_interval: float = 5,
+            jitter: float = 0.3,
+            deadline: float = 30,
+            statuses: tuple = (429, 502, 503, 504),
+            exceptions: tuple = (ConnectionError, Timeout),
+            sleep: Callable[[float], None] = time.sleep
+    ):
+        self.attempts = max(int(attempts), 1)
+        self.deadline = deadline
+        self.statuses = tuple(statuses)
+        self.exceptions = tuple(exceptions)
+        self.delay = polling.exponential(initial=interval, at_most=max_interval)
+        if jitter:
+            self.delay = polling.jittered(self.delay, ratio=jitter)
+        self._sleep = sleep
+        self.retries = 0
+        self.last_attempts = 0
+        self._lock = Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Optional[Mapping] = None) -> 'RetryPolicy':
+        settings = settings or {}
+        return cls(
+            attempts=settings.get('ATTEMPTS', 3),
+            interval=settings.get('INTERVAL', 300) / 1000,
+            max_interval=settings.get('MAX_INTERVAL', 5000) / 1000,
+            jitter=settings.get('JITTER', 0.3),
+            deadline=settings.get('DEADLINE', 30),
+            statuses=tuple(settings.get('STATUSES', (429, 502, 503, 504)))
+        )
+
+    def _is_retryable(self, method: str, error: Optional[Exception], response: Optional[Response]) -> bool:
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        if error is not None:
+            if not isinstance(error, self.exceptions):
+                return False
+            return idempotent or _is_not_sent(error)
+        if response.status_code not in self.statuses:
+            return False
+        return idempotent or response.status_code in (429, 503)
+
+    def call(self, method: str, send: Callable[[float], Response]) -> Response:
+        finish_time = time.monotonic() + self.deadline
+        attempt = 0
+        while True:
+            attempt += 1
+            self.last_attempts = attempt
+            error, response = None, None
+            try:
+                response = send(max(finish_time - time.monotonic(), 0.001))
+            except Exception as e:
+                error = e
+            if attempt >= self.attempts or not self._is_retryable(method, error, response):
+                break
+            delay = self.delay(attempt)
+            if time.monotonic() + delay > finish_time:
+                break
+            with self._lock:
+                self.retries += 1
+            print(f'Повтор запроса {method} ({attempt}/{self.attempts - 1}) через {delay:.2f}с:',
+                  error or response.status_code)
+            self._sleep(delay)
+        if error is not None:
+            raise error
+        return response
@@ -0,0 +1,41 @@
+import hashlib
+from typing import Mapping, Optional
+from urllib.parse import urlencode
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+
+def create_session(settings: Optional[Mapping] = None) -> Session:
+    settings = settings or {}
+    adapter = HTTPAdapter(
+        pool_connections=int(settings.get('POOL_CONNECTIONS', 10)),
+        pool_maxsize=int(settings.get('POOL_MAXSIZE', 10)),
+        pool_block=bool(settings.get('POOL_BLOCK', False))
+    )
+    session = Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.verify = False
+    if not settings.get('KEEP_ALIVE', True):
+        session.headers['Connection'] = 'close'
+    return session
+
+
+def encode_params(params) -> str:
+    if not params:
+        return ''
+    if isinstance(params, bytes):
+        return params.decode('UTF-8')
+    if isinstance(params, str):
+        return params
+    pairs = []
+    for key, values in (params.items() if isinstance(params, Mapping) else params):
+        for value in values if isinstance(values, (list, tuple)) else [values]:
+            if value is not None:
+                pairs.append((str(key), str(value)))
+    return urlencode(sorted(pairs, key=lambda pair: pair[0]))
+
+
+def digest(value: Optional[str]) -> Optional[str]:
+    return hashlib.sha256(value.encode('UTF-8')).hexdigest() if value else None
@@ -12,31 +12,44 @@ from selenium import webdriver
 from testrail_api import TestRailAPI
 from urllib3 import disable_warnings
 from urllib3.exceptions import InsecureRequestWarning
-from webdriver_manager.chrome import ChromeDriverManager
 
+from core.utils.browser_pool import BrowserPool
 from core.utils.helpers import get_settings, get_count_tests, get_fixtures, formatted_time_for_testrail, \
-    copy_files
+    copy_files, get_polling, set_settings, env_flag, env_int
+from core.utils.selene.support import driver_binaries
 from core.utils.selene.support.shared import config, browser as driver
 from core.utils.testrail import TestRail
+from core.utils.testrail_cache import MetadataCache
+from core.utils.testrail_publisher import AllurePublisher
+from core.utils.testrail_reporter import BackgroundReporter
+from core.utils.testrail_results import ResultsBatch
+from core.utils.testrail_spool import ResultsSpool
 
 mode = 'local'
 settings_config = {}
 teamcity_launches = '1'
-testrail = TestRail()
+testrail = TestRail(
+    cache=MetadataCache(folder=join(Path(__file__).parent, '.cache'), ttl=env_int('TESTRAIL_CACHE_TTL')),
+    spool=ResultsSpool(join(Path(__file__).parent, getenv('TESTRAIL_SPOOL'))) if getenv('TESTRAIL_SPOOL') else None
+)
 testrail_test_run = 0
+testrail_results = None
+testrail_reporter = None
+testrail_publisher = None
 testrail_api = TestRailAPI(
     url=getenv('TESTRAIL_URL'),
     email=getenv('TESTRAIL_EMAIL'),
     password=getenv('TESTRAIL_PASSWORD'),
     verify=False
-) if int(getenv('TESTRAIL_ENABLED')) == 1 else None
+) if env_flag('TESTRAIL_ENABLED') else None
 temp_files = join(Path(__file__).parent, getenv("ALLURE_DIR"))
 
 pytest_plugins = get_fixtures()
 
 
 def pytest_sessionstart(session):
-    global settings_config, testrail_api, testrail_test_run, teamcity_launches
+    global settings_config, testrail_api, testrail_test_run, testrail_results, testrail_reporter, testrail_publisher, \
+        teamcity_launches
     marks = session.config.invocation_params.args
     os.makedirs(temp_files, exist_ok=True)
     if '--teamcity_launches' in marks:
@@ -51,19 +64,59 @@ def pytest_sessionstart(session):
             file.write(teamcity_launches)
     disable_warnings(InsecureRequestWarning)
     settings_config = get_settings(environment=getenv('environment'))
-    if int(getenv('TESTRAIL_ENABLED')) == 1 and int(getenv("ALLURE_FOR_TESTRAIL_ENABLED")) == 0 \
+    if hasattr(session.config, 'workerinput'):
+        testrail_test_run = session.config.workerinput.get('testrail_test_run', 0)
+        return
+    if env_flag('TESTRAIL_ENABLED') and not env_flag('ALLURE_FOR_TESTRAIL_ENABLED') \
             and teamcity_launches == getenv('TEAMCITY_LAUNCHES'):
-        testrail_test_run = testrail.create_test_run(tr=testrail_api)
+        testrail_test_run = testrail.open_test_run(tr=testrail_api)
+        testrail_results = ResultsBatch(tr=testrail_api, run_id=testrail_test_run, spool=testrail.spool)
+        testrail_reporter = BackgroundReporter(
+            report=lambda data: testrail.set_status(tr=testrail_api, data=data, batch=testrail_results)
+        )
+    if env_flag('TESTRAIL_ENABLED') and env_flag('ALLURE_FOR_TESTRAIL_ENABLED') \
+            and env_int('TESTRAIL_PUBLISH_INTERVAL') > 0 and teamcity_launches == getenv('TEAMCITY_LAUNCHES'):
+        testrail_publisher = AllurePublisher(
+            testrail=testrail,
+            tr=testrail_api,
+            data={
+                'test_run_id': testrail_test_run,
+                'teamcity_launches': teamcity_launches,
+                'run_mode': session.config.getoption('mode')
+            }
+        )
+        testrail_publisher.start()
     if not os.path.exists(temp_files):
         os.mkdir(temp_files)
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput['testrail_test_run'] = testrail_test_run
+    node.workerinput['settings'] = settings_config.to_dict()
+
+
+def pytest_configure(config):
+    if hasattr(config, 'workerinput') and 'settings' in config.workerinput:
+        set_settings(environment=getenv('environment'), config=config.workerinput['settings'])
+
+
 def pytest_sessionfinish(session):
+    if hasattr(session.config, 'workerinput'):
+        return
+    try:
+        if testrail_reporter is not None:
+            testrail_reporter.close()
+    finally:
+        if testrail_results is not None:
+            testrail_results.close()
     reporter = session.config.pluginmanager.get_plugin('terminalreporter')
     is_full_tests_collections = session.testscollected == get_count_tests(reporter)
-    if is_full_tests_collections and int(getenv('TESTRAIL_ENABLED')) == 1 \
+    if is_full_tests_collections and env_flag('TESTRAIL_ENABLED') \
             and teamcity_launches == getenv('TEAMCITY_LAUNCHES'):
-        if int(getenv('ALLURE_FOR_TESTRAIL_ENABLED')) == 1:
+        if testrail_publisher is not None:
+            testrail_publisher.close()
+        elif env_flag('ALLURE_FOR_TESTRAIL_ENABLED'):
             testrail.set_statuses(
                 tr=testrail_api,
                 data={
@@ -72,13 +125,16 @@ def pytest_sessionfinish(session):
                     'run_mode': mode
                 }
             )
+        if env_flag('ALLURE_FOR_TESTRAIL_ENABLED'):
             try:
                 copy_files(source_folder=temp_files, destination_folder=join(Path(__file__).parent, 'reports'))
             except BaseException:
                 pass
             shutil.rmtree(temp_files, ignore_errors=True)
-        if int(getenv('TESTRAIL_AUTOCLOSE_TESTRUN')) == 1 and testrail_test_run:
-            testrail.close_test_run(tr=testrail_api, run_id=testrail_test_run)
+        if env_flag('TESTRAIL_AUTOCLOSE_TESTRUN') and testrail_test_run:
+            testrail.finish_test_run(tr=testrail_api, run_id=testrail_test_run)
+    elif testrail_publisher is not None:
+        testrail_publisher.close(close_run=False)
     for file in glob(f'{temp_files}/*'):
         filename = file.split('\\')[-1]
         ext = filename.split('.')[-1]
@@ -87,11 +143,27 @@ def pytest_sessionfinish(session):
             os.remove(file)
 
 
+def pytest_collection_finish(session):
+    if testrail_publisher is not None:
+        testrail_publisher.add_testrail_ids(testrail._get_case_ids_for_nodes([item.nodeid for item in session.items]))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_node_collection_finished(node, ids):
+    if testrail_publisher is not None:
+        testrail_publisher.add_testrail_ids(testrail._get_case_ids_for_nodes(ids))
+
+
+def pytest_runtest_logfinish():
+    if testrail_publisher is not None:
+        testrail_publisher.notify()
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     result = yield
     report = result.get_result()
-    if int(getenv('TESTRAIL_ENABLED')) == 0 or int(getenv("ALLURE_FOR_TESTRAIL_ENABLED")) == 1 or call.when != 'call' \
+    if not env_flag('TESTRAIL_ENABLED') or env_flag('ALLURE_FOR_TESTRAIL_ENABLED') or call.when != 'call' \
             or not item.get_closest_marker('testrail_ids'):
         return
     testrail_ids = item.get_closest_marker('testrail_ids').kwargs.get('ids')
@@ -99,20 +171,24 @@ def pytest_runtest_makereport(item, call):
     screenshot = None
     if report.outcome == 'passed':
         status = 1
+    report.testrail_results = []
     for case_id in testrail_ids:
         if item.funcargs.get('browser') is not None:
             screenshot = item.funcargs['browser'].last_screenshot
-        testrail.set_status(
-            tr=testrail_api,
-            data={
-                'case_id': case_id,
-                'status': status,
-                'test_run_id': testrail_test_run,
-                'screenshot': screenshot,
-                'elapsed': formatted_time_for_testrail(ceil(call.duration)),
-                'comment': f'Tests is running to {mode}'
-            }
-        )
+        report.testrail_results.append({
+            'case_id': case_id,
+            'status': status,
+            'screenshot': screenshot,
+            'elapsed': formatted_time_for_testrail(ceil(call.duration)),
+            'comment': f'Tests is running to {mode}'
+        })
+
+
+def pytest_runtest_logreport(report):
+    if testrail_reporter is None:
+        return
+    for data in getattr(report, 'testrail_results', []):
+        testrail_reporter.put({**data, 'test_run_id': testrail_test_run})
 
 
 def pytest_addoption(parser):
@@ -120,10 +196,7 @@ def pytest_addoption(parser):
     parser.addoption('--teamcity_launches', action='store', default='1')
 
 
-@pytest.fixture(scope='function')
-def browser(pytestconfig):
-    global mode
-    mode = pytestconfig.getoption('mode')
+def _create_driver(run_mode):
     options = webdriver.ChromeOptions()
     options.add_argument('--ignore-ssl-errors=yes')
     options.add_argument('--ignore-certificate-errors')
@@ -131,7 +204,7 @@ def browser(pytestconfig):
     options.add_experimental_option('prefs', {
         'profile.default_content_setting_values.notifications': 1
     })
-    if mode == 'selenoid':
+    if run_mode == 'selenoid':
         capabilities = {
             'browserName': settings_config['BROWSER_NAME'],
             'browserVersion': settings_config['SELENOID']['BROWSER_VERSION'],
@@ -147,17 +220,39 @@ def browser(pytestconfig):
         )
     else:
         config.driver = webdriver.Chrome(
-            executable_path=ChromeDriverManager().install(),
+            executable_path=driver_binaries.chrome_driver(pinned=settings_config.get('DRIVER_PATHS', {}).get('chrome')),
             options=options
         )
+    return config.driver
+
+
+@pytest.fixture(scope='session')
+def browser_pool(pytestconfig):
+    pool = BrowserPool(
+        create_driver=lambda: _create_driver(pytestconfig.getoption('mode')),
+        quit_driver=lambda _: config.reset_driver(),
+        max_reuse=settings_config.get('BROWSER_MAX_REUSE', 1)
+    )
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope='function')
+def browser(pytestconfig, browser_pool):
+    global mode
+    mode = pytestconfig.getoption('mode')
+    browser_pool.acquire()
     config.browser_name = settings_config['BROWSER_NAME']
+    config.driver_paths = settings_config.get('DRIVER_PATHS', {})
     config.reports_folder = temp_files
     config.window_width = settings_config['BROWSER_WINDOW_WIDTH']
     config.window_height = settings_config['BROWSER_WINDOW_HEIGHT']
     config.timeout = settings_config['TIMEOUT']
+    config.poll_during_waits = get_polling(settings_config.get('POLLING')) or config.poll_during_waits
+    config.wait_for_conditions_by_js = settings_config.get('WAIT_FOR_CONDITIONS_BY_JS', False)
     config.base_url = settings_config['APPLICATION_URL']
     yield driver
-    driver.quit()
+    browser_pool.release()
 
 
 @pytest.fixture(scope='function')
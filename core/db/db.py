@@ -18,32 +18,35 @@ class DB:
 
     def _connection(self, environment, name):
         engine = None
-        environment[name]['USER'] = getenv(f"DB_USER_{name.upper()}")
-        environment[name]['PASSWORD'] = getenv(f"DB_PASSWORD_{name.upper()}")
-
-        if environment[name]['DB_TYPE'].lower() == 'postgresql':
-            engine = create_engine(f"postgresql://{environment[name]['USER']}:{environment[name]['PASSWORD']}@"
-                                   f"{environment[name]['HOST']}:{environment[name]['PORT']}/"
-                                   f"{environment[name]['DB_NAME']}")
-        elif environment[name]['DB_TYPE'].lower() == 'mysql':
+        settings = {
+            **environment[name],
+            'USER': getenv(f"DB_USER_{name.upper()}"),
+            'PASSWORD': getenv(f"DB_PASSWORD_{name.upper()}"),
+        }
+
+        if settings['DB_TYPE'].lower() == 'postgresql':
+            engine = create_engine(f"postgresql://{settings['USER']}:{settings['PASSWORD']}@"
+                                   f"{settings['HOST']}:{settings['PORT']}/"
+                                   f"{settings['DB_NAME']}")
+        elif settings['DB_TYPE'].lower() == 'mysql':
             engine = create_engine(
-                f"mysql://{environment[name]['USER']}:{environment[name]['PASSWORD']}@{environment[name]['HOST']}/"
-                f"{environment[name]['DB_NAME']}")
-        elif environment[name]['DB_TYPE'].lower() == 'oracle_as_sysdba':
+                f"mysql://{settings['USER']}:{settings['PASSWORD']}@{settings['HOST']}/"
+                f"{settings['DB_NAME']}")
+        elif settings['DB_TYPE'].lower() == 'oracle_as_sysdba':
             engine = create_engine(
-                f"oracle://{environment[name]['USER']}:{environment[name]['PASSWORD']}@{environment[name]['HOST']}:"
-                f"{environment[name]['PORT']}/?service_name={environment[name]['DB_NAME']}&mode=2"
+                f"oracle://{settings['USER']}:{settings['PASSWORD']}@{settings['HOST']}:"
+                f"{settings['PORT']}/?service_name={settings['DB_NAME']}&mode=2"
             )
-        elif environment[name]['DB_TYPE'].lower() == 'oracle_as_normal':
+        elif settings['DB_TYPE'].lower() == 'oracle_as_normal':
             engine = create_engine(
-                f"oracle://{environment[name]['USER']}:{environment[name]['PASSWORD']}@{environment[name]['HOST']}:"
-                f"{environment[name]['PORT']}/?service_name={environment[name]['DB_NAME']}"
+                f"oracle://{settings['USER']}:{settings['PASSWORD']}@{settings['HOST']}:"
+                f"{settings['PORT']}/?service_name={settings['DB_NAME']}"
             )
-        elif environment[name]['DB_TYPE'].lower() == 'mssql':
-            engine = create_engine(f"mssql+pyodbc://{environment[name]['USER']}:{environment[name]['PASSWORD']}@"
-                                   f"{environment[name]['DB_NAME']}")
-        elif environment[name]['DB_TYPE'].lower() == 'sqlite':
-            engine = create_engine(f"sqlite:///{environment[name]['PATH']}")
+        elif settings['DB_TYPE'].lower() == 'mssql':
+            engine = create_engine(f"mssql+pyodbc://{settings['USER']}:{settings['PASSWORD']}@"
+                                   f"{settings['DB_NAME']}")
+        elif settings['DB_TYPE'].lower() == 'sqlite':
+            engine = create_engine(f"sqlite:///{settings['PATH']}")
 
         return engine
 
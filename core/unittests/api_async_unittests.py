@@ -0,0 +1,72 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from api.async_base_api import AsyncBaseApi
+from api.transport import create_session
+
+LATENCY = 0.05
+
+
+class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, payload):
+        time.sleep(LATENCY)
+        content = json.dumps(payload).encode('UTF-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        self._reply({'path': self.path})
+
+    def do_POST(self):
+        self._reply(json.loads(self.rfile.read(int(self.headers['Content-Length']))))
+
+
+class TestAsyncBaseApi(unittest.TestCase):
+    def setUp(self):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.api = AsyncBaseApi(
+            api_base_url=f'http://127.0.0.1:{server.server_address[1]}',
+            session=create_session({'POOL_MAXSIZE': 20}),
+            concurrency=20
+        )
+        self.addCleanup(self.api.close)
+
+    def test_get_many_runs_concurrently_and_keeps_order(self):
+        started = time.perf_counter()
+        results = self.api.get_many(f'posts/{number}' for number in range(100))
+        elapsed = time.perf_counter() - started
+        self.assertEqual(results, [{'path': f'/posts/{number}'} for number in range(100)])
+        self.assertLess(elapsed, 100 * LATENCY / 2)
+
+    def test_post_many(self):
+        self.assertEqual(self.api.post_many('posts', [{'id': 1}, {'id': 2}]), [{'id': 1}, {'id': 2}])
+
+    def test_coroutines_can_be_mixed_in_gather(self):
+        results = self.api.run(self.api.gather(self.api.send_get(url='posts/1'), self.api.send_post(url='posts')))
+        self.assertEqual(results, [{'path': '/posts/1'}, {}])
+
+    def test_run_inside_running_loop_fails_clearly(self):
+        async def inside_loop():
+            with self.assertRaisesRegex(RuntimeError, 'await api.gather'):
+                self.api.get_many(['posts/1'])
+            return await self.api.gather(self.api.send_get(url='posts/1'))
+
+        self.assertEqual(asyncio.run(inside_loop()), [{'path': '/posts/1'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
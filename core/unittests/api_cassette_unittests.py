@@ -0,0 +1,120 @@
+import io
+import json
+import tempfile
+import unittest
+from os.path import join
+from unittest.mock import MagicMock
+
+from requests import Response, Session
+
+from api.base_api import BaseApi
+from api.cassette import Cassette, CassetteError
+from api.retry import RetryPolicy
+
+
+def response(payload, status_code: int = 200) -> Response:
+    result = Response()
+    result.status_code = status_code
+    result.headers['Content-Type'] = 'application/json'
+    result._content = json.dumps(payload).encode('UTF-8')
+    return result
+
+
+class TestCassette(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.path = join(folder.name, 'test_api', 'test_get.json')
+
+    def _api(self, mode: str, session: MagicMock) -> BaseApi:
+        api_session = Session()
+        api_session.request = session.request
+        return BaseApi(
+            'https://example.com',
+            session=api_session,
+            retry=RetryPolicy(jitter=0, sleep=self.fail),
+            cassette=Cassette(self.path, mode)
+        )
+
+    def _record(self):
+        session = MagicMock()
+        session.request.side_effect = [response({'id': 1}), response({'id': 2}), response({'title': 'foo'}, 201)]
+        api = self._api('record', session)
+        api.send_get(url='posts/1')
+        api.send_get(url='posts/1')
+        api.send_post(url='posts', data={'title': 'foo', 'userId': 1})
+        api.cassette.save()
+
+    def test_replay_serves_recorded_responses_without_network(self):
+        self._record()
+        session = MagicMock()
+        api = self._api('replay', session)
+        self.assertEqual(api.send_get(url='posts/1'), {'id': 1})
+        self.assertEqual(api.send_get(url='posts/1'), {'id': 2})
+        self.assertEqual(api.send_get(url='posts/1'), {'id': 2})
+        self.assertEqual(api.send_post(url='posts', data={'userId': 1, 'title': 'foo'}), {'title': 'foo'})
+        session.request.assert_not_called()
+
+    def test_replay_falls_back_to_network_for_unknown_requests(self):
+        self._record()
+        session = MagicMock()
+        session.request.return_value = response({'id': 3})
+        self.assertEqual(self._api('replay', session).send_get(url='posts/3'), {'id': 3})
+
+    def test_strict_fails_on_unknown_requests(self):
+        self._record()
+        api = self._api('strict', MagicMock())
+        with self.assertRaises(CassetteError):
+            api.send_post(url='posts', data={'title': 'bar'})
+
+    def test_binary_bodies_round_trip(self):
+        session = MagicMock()
+        binary = response(None)
+        binary._content = b'\x89PNG\xff'
+        session.request.return_value = binary
+        cassette = Cassette(self.path, 'record')
+        cassette.request('GET', 'https://example.com/logo', session.request)
+        cassette.save()
+        replayed = Cassette(self.path, 'strict').request('GET', 'https://example.com/logo', self.fail)
+        self.assertEqual((replayed.status_code, replayed.content), (200, b'\x89PNG\xff'))
+
+    def test_params_in_any_form_are_matched(self):
+        session = MagicMock()
+        session.request.return_value = response({'id': 1})
+        api = self._api('record', session)
+        api.send_get(url='posts', params=[('id', 1), ('id', 2)])
+        api.cassette.save()
+        self.assertEqual(self._api('strict', MagicMock()).send_get(url='posts', params={'id': [1, 2]}), {'id': 1})
+
+    def test_uploaded_files_are_part_of_the_key(self):
+        session = MagicMock()
+        session.request.side_effect = [response({'name': 'a.txt'}), response({'name': 'b.txt'})]
+        api = self._api('record', session)
+        api.send_post(url='upload', files={'file': ('a.txt', io.BytesIO(b'first'))})
+        api.send_post(url='upload', files={'file': ('a.txt', io.BytesIO(b'second'))})
+        api.cassette.save()
+        api = self._api('strict', MagicMock())
+        self.assertEqual(api.send_post(url='upload', files={'file': ('a.txt', io.BytesIO(b'second'))}),
+                         {'name': 'b.txt'})
+        with self.assertRaises(CassetteError):
+            api.send_post(url='upload', files={'file': ('a.txt', io.BytesIO(b'third'))})
+
+    def test_authorization_is_part_of_the_key(self):
+        session = MagicMock()
+        session.request.side_effect = [response({'user': 'admin'}), response({'user': 'guest'})]
+        api = self._api('record', session)
+        api.send_get(url='me', auth=('admin', 'secret'))
+        api.send_get(url='me', auth=('guest', 'secret'))
+        api.cassette.save()
+        api = self._api('strict', MagicMock())
+        self.assertEqual(api.send_get(url='me', auth=('guest', 'secret')), {'user': 'guest'})
+        with open(self.path, encoding='UTF-8') as file:
+            self.assertNotIn('secret', file.read())
+
+    def test_unknown_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            Cassette(self.path, 'replay-all')
+
+
+if __name__ == '__main__':
+    unittest.main()
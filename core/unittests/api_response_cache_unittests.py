@@ -0,0 +1,92 @@
+import json
+import unittest
+from unittest.mock import MagicMock
+
+from requests import Response, Session
+from requests.auth import HTTPBasicAuth
+
+from api.base_api import BaseApi
+from api.response_cache import ResponseCache
+from api.retry import RetryPolicy
+
+
+def response(payload=None, status_code: int = 200, **headers) -> Response:
+    result = Response()
+    result.status_code = status_code
+    result.headers.update(headers)
+    result._content = json.dumps(payload).encode('UTF-8') if payload is not None else b''
+    return result
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 0
+        self.cache = ResponseCache(max_size=2, ttl=10, clock=lambda: self.now)
+        self.session = Session()
+        self.session.request = MagicMock()
+        self.api = BaseApi('https://example.com', session=self.session, retry=RetryPolicy(), cache=self.cache)
+
+    def test_get_is_fetched_once_within_ttl(self):
+        self.session.request.return_value = response({'id': 1})
+        self.assertEqual(self.api.send_get(url='users/1'), {'id': 1})
+        self.assertEqual(self.api.send_get(url='users/1'), {'id': 1})
+        self.assertEqual(self.session.request.call_count, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_key_includes_params_and_auth(self):
+        self.session.request.return_value = response({'id': 1})
+        self.api.send_get(url='users', params={'page': 1})
+        self.api.send_get(url='users', params={'page': 2})
+        self.api.send_get(url='users', params={'page': 1}, auth=('user', 'password'))
+        self.session.headers['Authorization'] = 'Bearer token'
+        self.api.send_get(url='users', params={'page': 1})
+        self.assertEqual(self.session.request.call_count, 4)
+
+    def test_key_is_stable_for_params_and_auth_objects(self):
+        self.session.request.return_value = response({'id': 1})
+        self.assertEqual(self.api.send_get(url='users', params={'id': [1, 2]}), {'id': 1})
+        self.api.send_get(url='users', params=[('id', 1), ('id', 2)])
+        self.api.send_get(url='users', auth=HTTPBasicAuth('user', 'password'))
+        self.api.send_get(url='users', auth=HTTPBasicAuth('user', 'password'))
+        self.assertEqual(self.session.request.call_count, 2)
+        self.assertNotIn('password', repr(list(self.cache._entries)))
+
+    def test_expired_entry_is_revalidated(self):
+        self.session.request.side_effect = [
+            response({'id': 1}, ETag='"v1"', **{'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}),
+            response(status_code=304)
+        ]
+        self.api.send_get(url='users/1')
+        self.now = 11
+        self.assertEqual(self.api.send_get(url='users/1'), {'id': 1})
+        self.assertEqual(self.session.request.call_args.kwargs['headers'], {
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'
+        })
+        self.assertEqual(self.cache.revalidated, 1)
+        self.now = 15
+        self.assertEqual(self.api.send_get(url='users/1'), {'id': 1})
+        self.assertEqual(self.session.request.call_count, 2)
+
+    def test_bypass_errors_and_eviction(self):
+        self.session.request.return_value = response({'id': 1})
+        self.api.send_get(url='users/1')
+        self.api.send_get(url='users/1', use_cache=False)
+        self.assertNotIn('headers', self.session.request.call_args.kwargs)
+        self.session.request.return_value = response({'error': 'down'}, 500)
+        self.api.send_get(url='users/2')
+        self.api.send_get(url='users/2')
+        self.assertEqual(self.session.request.call_count, 4)
+        self.session.request.return_value = response({'id': 3})
+        self.api.send_get(url='users/3')
+        self.api.send_get(url='users/4')
+        self.api.send_get(url='users/1')
+        self.assertEqual(self.session.request.call_count, 7)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(ResponseCache.from_settings({}))
+        self.assertEqual(ResponseCache.from_settings({'ENABLED': True, 'MAX_SIZE': 5}).max_size, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
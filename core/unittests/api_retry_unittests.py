@@ -0,0 +1,95 @@
+import unittest
+from unittest.mock import MagicMock
+
+from requests.exceptions import ConnectionError, ReadTimeout
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from api.base_api import BaseApi
+from api.retry import RetryPolicy
+
+
+def refused() -> ConnectionError:
+    return ConnectionError(MaxRetryError(None, '/posts', NewConnectionError(None, 'Connection refused')))
+
+
+def aborted() -> ConnectionError:
+    return ConnectionError(ProtocolError('Connection aborted.', ConnectionResetError('reset by peer')))
+
+
+def response(status_code: int) -> MagicMock:
+    return MagicMock(status_code=status_code, content=b'{}')
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def setUp(self):
+        self.delays = []
+        self.policy = RetryPolicy(attempts=4, interval=0.1, max_interval=0.3, jitter=0, sleep=self.delays.append)
+
+    def test_retryable_status_is_retried_with_backoff(self):
+        send = MagicMock(side_effect=[response(503), response(502), response(200)])
+        self.assertEqual(self.policy.call('GET', send).status_code, 200)
+        self.assertEqual(self.delays, [0.1, 0.2])
+        self.assertEqual((self.policy.retries, self.policy.last_attempts), (2, 3))
+
+    def test_attempts_are_bounded(self):
+        send = MagicMock(side_effect=ConnectionError('down'))
+        with self.assertRaises(ConnectionError):
+            self.policy.call('GET', send)
+        self.assertEqual(send.call_count, 4)
+        self.assertEqual(self.delays, [0.1, 0.2, 0.3])
+
+    def test_other_statuses_and_errors_are_not_retried(self):
+        self.assertEqual(self.policy.call('GET', MagicMock(return_value=response(404))).status_code, 404)
+        with self.assertRaises(ValueError):
+            self.policy.call('GET', MagicMock(side_effect=ValueError('bad json')))
+        self.assertEqual(self.policy.retries, 0)
+
+    def test_post_is_not_retried_after_reaching_server(self):
+        send = MagicMock(side_effect=ReadTimeout('slow'))
+        with self.assertRaises(ReadTimeout):
+            self.policy.call('POST', send)
+        self.assertEqual(send.call_count, 1)
+        self.assertEqual(self.policy.call('POST', MagicMock(return_value=response(502))).status_code, 502)
+        send = MagicMock(side_effect=aborted())
+        with self.assertRaises(ConnectionError):
+            self.policy.call('POST', send)
+        self.assertEqual(send.call_count, 1)
+        send = MagicMock(side_effect=[refused(), response(429), response(201)])
+        self.assertEqual(self.policy.call('POST', send).status_code, 201)
+
+    def test_each_attempt_gets_the_remaining_deadline_as_timeout(self):
+        send = MagicMock(side_effect=[response(503), response(200)])
+        RetryPolicy(jitter=0, deadline=10, sleep=lambda _: None).call('GET', send)
+        timeouts = [call.args[0] for call in send.call_args_list]
+        self.assertTrue(10 >= timeouts[0] >= timeouts[1] > 9)
+
+    def test_deadline_stops_retries(self):
+        policy = RetryPolicy(attempts=10, interval=5, jitter=0, deadline=1, sleep=self.delays.append)
+        self.assertEqual(policy.call('GET', MagicMock(return_value=response(503))).status_code, 503)
+        self.assertEqual(self.delays, [])
+
+    def test_from_settings_uses_milliseconds(self):
+        policy = RetryPolicy.from_settings({'ATTEMPTS': 2, 'INTERVAL': 200, 'JITTER': 0, 'STATUSES': [500]})
+        self.assertEqual((policy.attempts, policy.statuses, policy.delay(1)), (2, (500,), 0.2))
+
+
+class TestBaseApiRetry(unittest.TestCase):
+    def test_verbs_share_policy(self):
+        session = MagicMock()
+        session.request.side_effect = [response(503), response(200), response(200)]
+        api = BaseApi('https://example.com', session=session, retry=RetryPolicy(jitter=0, sleep=lambda _: None))
+        api.send_get(url='posts/1')
+        api.send_post(url='posts', data={'title': 'foo'})
+        self.assertEqual(session.request.call_count, 3)
+        self.assertEqual(api.retry.retries, 1)
+
+    def test_down_endpoint_is_not_hammered(self):
+        session = MagicMock()
+        session.request.side_effect = refused()
+        api = BaseApi('https://example.com', session=session, retry=RetryPolicy(jitter=0, sleep=lambda _: None))
+        self.assertIsNone(api.send_post(url='posts', data={}))
+        self.assertEqual(session.request.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+from unittest.mock import ANY, MagicMock
+
+from api.base_api import BaseApi
+from api.transport import create_session
+
+
+class TestApiTransport(unittest.TestCase):
+    def test_session_uses_configured_pool(self):
+        session = create_session({'POOL_CONNECTIONS': 4, 'POOL_MAXSIZE': 16})
+        adapter = session.get_adapter('https://jsonplaceholder.typicode.com')
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 16)
+        self.assertEqual(adapter.max_retries.total, 0)
+        self.assertIs(session.get_adapter('http://localhost'), adapter)
+
+    def test_keep_alive_can_be_disabled(self):
+        self.assertEqual(create_session({'KEEP_ALIVE': False}).headers['Connection'], 'close')
+        self.assertEqual(create_session().headers['Connection'], 'keep-alive')
+
+    def test_instances_without_session_do_not_share_one(self):
+        self.assertIsNot(BaseApi('https://example.com').session, BaseApi('https://example.com').session)
+
+    def test_get_goes_through_session(self):
+        session = MagicMock()
+        session.request.return_value.json.return_value = {'id': 1}
+        self.assertEqual(BaseApi('https://example.com', session=session).send_get(url='posts/1'), {'id': 1})
+        session.request.assert_called_once_with(
+            method='GET', url='https://example.com/posts/1', verify=False, timeout=ANY, params=None, auth=None
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
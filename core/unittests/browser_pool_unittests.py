@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from core.utils.browser_pool import BrowserPool
+
+
+class TestBrowserPool(unittest.TestCase):
+    def setUp(self):
+        self.drivers = []
+
+        def create_driver():
+            driver = MagicMock()
+            driver.window_handles = ['main']
+            self.drivers.append(driver)
+            return driver
+
+        self.create_driver = create_driver
+
+    def test_driver_is_reused_and_reset_between_tests(self):
+        pool = BrowserPool(create_driver=self.create_driver, max_reuse=3)
+        first = pool.acquire()
+        pool.release()
+        self.assertIs(pool.acquire(), first)
+        self.assertEqual(len(self.drivers), 1)
+        first.delete_all_cookies.assert_called_once()
+        first.get.assert_called_once_with('about:blank')
+
+    def test_driver_is_recreated_after_max_reuse(self):
+        pool = BrowserPool(create_driver=self.create_driver, max_reuse=2)
+        for _ in range(3):
+            pool.acquire()
+            pool.release()
+        self.assertEqual(len(self.drivers), 2)
+        self.drivers[0].quit.assert_called_once()
+
+    def test_dead_driver_is_recreated(self):
+        pool = BrowserPool(create_driver=self.create_driver, max_reuse=10)
+        pool.acquire()
+        pool.release()
+        with patch('core.utils.browser_pool.WebHelper.is_browser_still_alive', return_value=False):
+            pool.acquire()
+        self.assertEqual(len(self.drivers), 2)
+
+    def test_driver_that_cannot_be_reset_is_quit(self):
+        pool = BrowserPool(create_driver=self.create_driver, max_reuse=10)
+        driver = pool.acquire()
+        driver.delete_all_cookies.side_effect = Exception('session deleted')
+        pool.release()
+        driver.quit.assert_called_once()
+        self.assertIsNot(pool.acquire(), driver)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from core.utils.selene.support import driver_binaries
+
+
+class TestDriverBinaries(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.folder.name, 'resolved_drivers.json')
+        self.binary = os.path.join(self.folder.name, 'chromedriver')
+        open(self.binary, 'w').close()
+        driver_binaries._resolved.clear()
+        driver_binaries._browser_version.cache_clear()
+
+    def tearDown(self):
+        driver_binaries._resolved.clear()
+        driver_binaries._browser_version.cache_clear()
+        self.folder.cleanup()
+
+    def test_driver_is_installed_once(self):
+        install = MagicMock(return_value=self.binary)
+        for _ in range(3):
+            self.assertEqual(driver_binaries.resolve('chrome', install, cache_file=self.cache_file), self.binary)
+        install.assert_called_once()
+
+    def test_driver_is_taken_from_cache_file_by_another_process(self):
+        driver_binaries.resolve('chrome', lambda: self.binary, cache_file=self.cache_file)
+        driver_binaries._resolved.clear()
+        install = MagicMock(return_value=self.binary)
+        driver_binaries.resolve('chrome', install, cache_file=self.cache_file)
+        install.assert_not_called()
+        self.assertFalse(os.path.exists(f'{self.cache_file}.lock'))
+
+    def test_expired_driver_is_installed_again(self):
+        driver_binaries.resolve('chrome', lambda: self.binary, cache_file=self.cache_file)
+        driver_binaries._resolved.clear()
+        install = MagicMock(return_value=self.binary)
+        driver_binaries.resolve('chrome', install, cache_file=self.cache_file, ttl=-1)
+        install.assert_called_once()
+
+    def test_pinned_driver_is_used_without_install(self):
+        install = MagicMock()
+        self.assertEqual(driver_binaries.resolve('chrome', install, pinned=self.binary), self.binary)
+        install.assert_not_called()
+        with self.assertRaises(FileNotFoundError):
+            driver_binaries.resolve('chrome', install, pinned=f'{self.binary}.missing')
+
+    def test_chrome_driver_is_cached_per_browser_type_and_version(self):
+        resolved = []
+        with patch.object(driver_binaries, 'resolve', side_effect=lambda key, *args: resolved.append(key)), \
+                patch.object(driver_binaries, 'get_browser_version_from_os', side_effect=['96.0.4664', '97.0.4692']):
+            driver_binaries.chrome_driver()
+            driver_binaries.chrome_driver(chrome_type=driver_binaries.ChromeType.CHROMIUM)
+        self.assertEqual(resolved, ['chromedriver:google-chrome:96.0.4664', 'chromedriver:chromium:97.0.4692'])
+
+    def test_browser_version_is_detected_once_per_process(self):
+        with patch.object(driver_binaries, 'resolve'), \
+                patch.object(driver_binaries, 'get_browser_version_from_os', return_value='96.0.4664') as version:
+            for _ in range(3):
+                driver_binaries.chrome_driver()
+        version.assert_called_once_with(driver_binaries.ChromeType.GOOGLE)
+
+    def test_pinned_gecko_driver_skips_version_detection(self):
+        with patch.object(driver_binaries, 'get_browser_version_from_os') as version:
+            self.assertEqual(driver_binaries.gecko_driver(pinned=self.binary), self.binary)
+        version.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
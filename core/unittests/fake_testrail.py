@@ -0,0 +1,229 @@
+import json
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import unquote, urlsplit
+
+ROUTE = re.compile(r'^/api/v2/(?P<method>[a-z_]+)(?P<args>(?:/\d+)*)$')
+
+
+class FakeTestRail:
+    def __init__(self, latency: float = 0, rate_limit: Optional[int] = None):
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.calls = Counter()
+        self.milestones = [{'id': 1, 'name': 'root'}]
+        self.sections = []
+        self.cases = {}
+        self.runs = {}
+        self.tests = {}
+        self._tests_by_case = {}
+        self.results = []
+        self.attachments = []
+        self.case_fields = []
+        self.result_fields = []
+        self._ids = Counter()
+        self._window = []
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self._server.server_address[1]}'
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def start(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                fake._handle(self)
+
+            def do_POST(self):
+                fake._handle(self)
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def _next_id(self, kind: str) -> int:
+        self._ids[kind] += 1
+        return self._ids[kind]
+
+    def add_case(self, section_id: int, title: str, **fields) -> dict:
+        section = next(section for section in self.sections if section['id'] == section_id)
+        case = {
+            'id': self._next_id('case'),
+            'title': title,
+            'section_id': section_id,
+            'suite_id': section['suite_id'],
+            'type_id': 1,
+            'custom_automation_type': 0,
+            **fields
+        }
+        self.cases[case['id']] = case
+        return case
+
+    def add_section(self, name: str) -> dict:
+        section = {'id': self._next_id('section'), 'suite_id': 1, 'name': name}
+        self.sections.append(section)
+        return section
+
+    def _throttled(self) -> bool:
+        if self.rate_limit is None:
+            return False
+        now = time.monotonic()
+        self._window = [moment for moment in self._window if now - moment < 1]
+        if len(self._window) >= self.rate_limit:
+            return True
+        self._window.append(now)
+        return False
+
+    def _handle(self, request: BaseHTTPRequestHandler):
+        route, *query = unquote(urlsplit(request.path).query).split('&')
+        params = dict(item.split('=', 1) for item in query if '=' in item)
+        match = ROUTE.match(route)
+        length = int(request.headers.get('Content-Length') or 0)
+        body = request.rfile.read(length) if length else b''
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            if self._throttled():
+                status, payload = 429, {'error': 'API rate limit exceeded'}
+            elif match is None:
+                status, payload = 404, {'error': f'unknown route {route}'}
+            else:
+                method = match.group('method')
+                args = [int(arg) for arg in match.group('args').split('/') if arg]
+                self.calls[method] += 1
+                data = {}
+                if body and request.headers.get('Content-Type', '').startswith('application/json'):
+                    data = json.loads(body)
+                try:
+                    status, payload = 200, getattr(self, f'_{method}')(*args, data=data, params=params)
+                except (AttributeError, KeyError, StopIteration) as e:
+                    status, payload = 400, {'error': f'{method}: {e!r}'}
+        content = json.dumps(payload).encode('UTF-8')
+        request.send_response(status)
+        request.send_header('Content-Type', 'application/json')
+        request.send_header('Content-Length', str(len(content)))
+        if status == 429:
+            request.send_header('Retry-After', '1')
+        request.end_headers()
+        request.wfile.write(content)
+
+    @staticmethod
+    def _page(items: list, params: dict) -> list:
+        offset = int(params.get('offset', 0))
+        limit = int(params.get('limit', 250))
+        return items[offset:offset + limit]
+
+    def _get_milestones(self, project_id, data, params):
+        return self._page(self.milestones, params)
+
+    def _get_sections(self, project_id, data, params):
+        return self._page(self.sections, params)
+
+    def _add_section(self, project_id, data, params):
+        return self.add_section(data['name'])
+
+    def _get_cases(self, project_id, data, params):
+        cases = [
+            case for case in self.cases.values()
+            if 'section_id' not in params or case['section_id'] == int(params['section_id'])
+        ]
+        return self._page(cases, params)
+
+    def _get_case(self, case_id, data, params):
+        return self.cases[case_id]
+
+    def _add_case(self, section_id, data, params):
+        return self.add_case(section_id, **data)
+
+    def _update_case(self, case_id, data, params):
+        self.cases[case_id].update(data)
+        return self.cases[case_id]
+
+    def _get_case_fields(self, data, params):
+        return self.case_fields
+
+    def _get_result_fields(self, data, params):
+        return self.result_fields
+
+    def _get_runs(self, project_id, data, params):
+        runs = list(self.runs.values())
+        if 'is_completed' in params:
+            runs = [run for run in runs if int(run['is_completed']) == int(params['is_completed'])]
+        return self._page(runs, params)
+
+    def _add_run(self, project_id, data, params):
+        run = {'id': self._next_id('run'), 'name': data.get('name', ''), 'is_completed': False}
+        self.runs[run['id']] = run
+        case_ids = list(self.cases) if data.get('include_all', True) else [int(case) for case in data['case_ids']]
+        self.tests[run['id']] = [
+            {'id': self._next_id('test'), 'case_id': case_id, 'run_id': run['id']} for case_id in case_ids
+        ]
+        for test in self.tests[run['id']]:
+            self._tests_by_case[(run['id'], test['case_id'])] = test
+        return run
+
+    def _get_run(self, run_id, data, params):
+        return self.runs[run_id]
+
+    def _close_run(self, run_id, data, params):
+        self.runs[run_id]['is_completed'] = True
+        return self.runs[run_id]
+
+    def _get_tests(self, run_id, data, params):
+        return self._page(self.tests[run_id], params)
+
+    def _test_for(self, run_id: int, case_id: int) -> dict:
+        return self._tests_by_case[(run_id, int(case_id))]
+
+    def _add_result(self, run_id: int, result: dict) -> dict:
+        test = self._test_for(run_id, result['case_id'])
+        created = {'id': self._next_id('result'), 'test_id': test['id'], **result}
+        self.results.append(created)
+        return created
+
+    def _get_results_for_run(self, run_id, data, params):
+        tests = {test['id'] for test in self.tests[run_id]}
+        return self._page([result for result in reversed(self.results) if result['test_id'] in tests], params)
+
+    def _get_results_for_case(self, run_id, case_id, data, params):
+        test = self._test_for(run_id, case_id)
+        return self._page([result for result in reversed(self.results) if result['test_id'] == test['id']], params)
+
+    def _add_result_for_case(self, run_id, case_id, data, params):
+        return self._add_result(run_id, {'case_id': case_id, **data})
+
+    def _add_results_for_cases(self, run_id, data, params):
+        return [self._add_result(run_id, result) for result in data['results']]
+
+    def _add_attachment_to_result(self, result_id, data, params):
+        attachment = {'attachment_id': self._next_id('attachment'), 'result_id': result_id}
+        self.attachments.append(attachment)
+        return attachment
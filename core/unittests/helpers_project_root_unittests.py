@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+from os.path import join
+from unittest.mock import patch
+
+from core.utils import helpers
+
+
+class TestProjectRoot(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.root = os.path.realpath(self.folder.name)
+        for path in ('config', 'tests/UI/web', 'raw_reports/nested'):
+            os.makedirs(join(self.root, path))
+        open(join(self.root, 'pytest.ini'), 'w').close()
+        helpers._find_project_root.cache_clear()
+        helpers._find_folder.cache_clear()
+        self.addCleanup(helpers._find_project_root.cache_clear)
+        self.addCleanup(helpers._find_folder.cache_clear)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_folder_is_found_from_nested_directory(self):
+        with patch.object(helpers, 'getcwd', return_value=join(self.root, 'tests', 'UI', 'web')):
+            self.assertEqual(helpers.get_project_root(), self.root)
+            self.assertEqual(helpers.get_current_folder('config'), join(self.root, 'config'))
+
+    def test_missing_folder_resolves_under_root(self):
+        with patch.object(helpers, 'getcwd', return_value=join(self.root, 'tests')):
+            self.assertEqual(helpers.get_current_folder('reports'), join(self.root, 'reports'))
+
+    def test_lookup_does_not_walk_subtrees(self):
+        with patch.object(helpers, 'getcwd', return_value=self.root), patch('os.walk') as walk:
+            helpers.get_current_folder('config')
+            helpers.get_current_folder('config')
+        walk.assert_not_called()
+        self.assertEqual(helpers._find_folder.cache_info().hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
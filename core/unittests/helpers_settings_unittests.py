@@ -0,0 +1,74 @@
+import json
+import os
+import tempfile
+import unittest
+from os.path import join
+from unittest.mock import patch
+
+from core.utils import helpers
+
+
+class TestSettings(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        os.makedirs(join(self.folder.name, 'config'))
+        with open(join(self.folder.name, 'config', 'config.json'), 'w', encoding='UTF-8') as file:
+            json.dump({'test': {'TIMEOUT': 60, 'SELENOID': {'HUB': 'http://selenoid:4444/wd/hub'}, 'LIST': [1]}}, file)
+        patcher = patch.dict(helpers._settings, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(helpers, 'get_current_folder', return_value=join(self.folder.name, 'config'))
+        self.get_current_folder = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_config_is_read_once_per_process(self):
+        settings = helpers.get_settings(environment='test')
+        self.assertIs(helpers.get_settings(environment='test'), settings)
+        self.get_current_folder.assert_called_once()
+
+    def test_settings_are_immutable(self):
+        settings = helpers.get_settings(environment='test')
+        with self.assertRaises(TypeError):
+            settings['TIMEOUT'] = 1
+        with self.assertRaises(TypeError):
+            settings['SELENOID']['HUB'] = ''
+        self.assertEqual(settings['LIST'], (1,))
+
+    def test_environment_overlay_and_typed_accessors(self):
+        with patch.dict(os.environ, {'PTF_CONFIG_TIMEOUT': '30', 'PTF_CONFIG_SELENOID__HUB': 'http://localhost:4444'}):
+            settings = helpers.get_settings(environment='test')
+        self.assertEqual(settings.get_int('TIMEOUT'), 30)
+        self.assertEqual(settings['SELENOID'].get_str('HUB'), 'http://localhost:4444')
+        self.assertFalse(settings.get_bool('MISSING'))
+
+    def test_environment_overlay_accepts_only_existing_keys(self):
+        for name in ('TIMEOUTS', 'SELENOID__PORT', 'TIMEOUT__VALUE', 'LIST__0'):
+            name = f'{helpers.SETTINGS_ENV_PREFIX}{name}'
+            with self.subTest(name=name), patch.dict(os.environ, {name: '1'}):
+                with self.assertRaisesRegex(ValueError, name):
+                    helpers.get_settings(environment='test')
+
+    def test_unrelated_config_variables_are_ignored(self):
+        with patch.dict(os.environ, {'CONFIG_SITE': '/etc/config.site', 'CONFIG_SHELL': '/bin/bash'}):
+            self.assertNotIn('SITE', helpers.get_settings(environment='test'))
+
+    def test_settings_can_be_handed_to_workers(self):
+        settings = helpers.get_settings(environment='test')
+        helpers._settings.clear()
+        self.assertEqual(helpers.set_settings('test', settings.to_dict()), settings)
+        self.assertIs(helpers.get_settings(environment='test'), helpers._settings['test'])
+        self.get_current_folder.assert_called_once()
+
+    def test_env_flags(self):
+        with patch.dict(os.environ, {'FLAG_ON': '1', 'FLAG_OFF': '0', 'FLAG_EMPTY': ''}):
+            self.assertTrue(helpers.env_flag('FLAG_ON'))
+            self.assertFalse(helpers.env_flag('FLAG_OFF'))
+            self.assertFalse(helpers.env_flag('FLAG_EMPTY'))
+            self.assertEqual(helpers.env_int('FLAG_MISSING', 5), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
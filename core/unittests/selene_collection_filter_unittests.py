@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import MagicMock
+
+from selenium.common.exceptions import WebDriverException
+
+from core.utils.selene.core import match
+from core.utils.selene.core.configuration import Config
+from core.utils.selene.core.entity import Collection
+from core.utils.selene.core.locator import Locator
+
+
+def _collection(driver, webelements):
+    return Collection(Locator('collection', lambda: webelements), Config(driver=lambda: driver))
+
+
+class TestSeleneCollectionFilter(unittest.TestCase):
+    def test_filtered_by_js_condition_uses_one_script(self):
+        driver = MagicMock()
+        driver.execute_script.return_value = [0, 2]
+        webelements = [MagicMock(), MagicMock(), MagicMock()]
+
+        filtered = _collection(driver, webelements).filtered_by(match.element_has_css_class('active'))
+
+        self.assertEqual(filtered(), [webelements[0], webelements[2]])
+        self.assertEqual(driver.execute_script.call_count, 1)
+        self.assertIn('classList.contains("active")', driver.execute_script.call_args[0][0])
+        for webelement in webelements:
+            webelement.get_attribute.assert_not_called()
+
+    def test_element_by_js_condition_returns_first_match(self):
+        driver = MagicMock()
+        driver.execute_script.return_value = [1]
+        webelements = [MagicMock(), MagicMock()]
+
+        element = _collection(driver, webelements).element_by(match.element_is_visible)
+
+        self.assertIs(element(), webelements[1])
+
+    def test_filtered_by_falls_back_to_webelements(self):
+        driver = MagicMock()
+        driver.execute_script.side_effect = WebDriverException('scripts are not supported')
+        visible, hidden = MagicMock(), MagicMock()
+        visible.is_displayed.return_value = True
+        hidden.is_displayed.return_value = False
+
+        filtered = _collection(driver, [visible, hidden]).filtered_by(match.element_is_visible)
+
+        self.assertEqual(filtered(), [visible])
+
+    def test_filtered_by_callable_does_not_use_script(self):
+        driver = MagicMock()
+        webelements = [MagicMock(), MagicMock()]
+
+        def is_first(element):
+            if element() is not webelements[0]:
+                raise AssertionError('not first')
+
+        self.assertEqual(_collection(driver, webelements).filtered_by(is_first)(), [webelements[0]])
+        driver.execute_script.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import MagicMock
+
+from selenium.common.exceptions import WebDriverException
+
+from core.utils.selene.core import match, query
+from core.utils.selene.core.configuration import Config
+from core.utils.selene.core.entity import Collection
+from core.utils.selene.core.locator import Locator
+
+
+def _collection(driver, webelements):
+    return Collection(Locator('collection', lambda: webelements), Config(driver=lambda: driver))
+
+
+def _webelement(text, visible=True):
+    webelement = MagicMock()
+    webelement.text = text
+    webelement.is_displayed.return_value = visible
+    webelement.get_attribute.return_value = text
+    return webelement
+
+
+class TestSeleneCollectionSnapshot(unittest.TestCase):
+    def test_visible_texts_are_fetched_by_one_script(self):
+        driver = MagicMock()
+        driver.execute_script.return_value = [
+            {'text': 'a', 'visible': True, 'attributes': {}, 'rect': {}},
+            {'text': '', 'visible': False, 'attributes': {}, 'rect': {}},
+            {'text': 'c', 'visible': True, 'attributes': {}, 'rect': {}},
+        ]
+        webelements = [_webelement('a'), _webelement('b', visible=False), _webelement('c')]
+
+        match.collection_has_exact_texts('a', 'c').call(_collection(driver, webelements))
+
+        self.assertEqual(driver.execute_script.call_count, 1)
+        for webelement in webelements:
+            webelement.is_displayed.assert_not_called()
+
+    def test_snapshot_falls_back_to_webelements(self):
+        driver = MagicMock()
+        driver.execute_script.side_effect = WebDriverException('scripts are not supported')
+        webelements = [_webelement('a'), _webelement('b', visible=False)]
+
+        self.assertEqual(query.visible_texts(_collection(driver, webelements)), ['a'])
+
+    def test_snapshot_reads_attributes_like_webelements(self):
+        self.assertIn(query.JS_ATTRIBUTE_OF.strip(), query._SNAPSHOT_SCRIPT)
+
+    def test_snapshot_of_empty_collection_does_not_call_driver(self):
+        driver = MagicMock()
+        self.assertEqual(query.snapshot('value')(_collection(driver, [])), [])
+        driver.execute_script.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
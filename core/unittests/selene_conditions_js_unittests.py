@@ -0,0 +1,71 @@
+import unittest
+from unittest.mock import MagicMock
+
+from core.utils.selene.core import match, query
+from core.utils.selene.core.condition import Condition
+from core.utils.selene.core.configuration import Config
+from core.utils.selene.core.entity import Element
+from core.utils.selene.core.locator import Locator
+
+
+class TestSeleneConditionsJs(unittest.TestCase):
+    def test_text_conditions_have_js(self):
+        self.assertIn('indexOf("foo")', match.element_has_text('foo').js)
+        self.assertIn('=== "foo"', match.element_has_exact_text('foo').js)
+
+    def test_not_condition_negates_js(self):
+        self.assertEqual(match.element_is_hidden.js, f'!({match.element_is_visible.js})')
+
+    def test_and_condition_requires_js_in_all_parts(self):
+        self.assertIn('&&', match.element_is_clickable.js)
+        self.assertIsNone(match.element_is_visible.and_(match.element_is_present).js)
+
+    def test_attribute_js_uses_webdriver_attribute_semantics(self):
+        self.assertIn('"disabled"', query.JS_ATTRIBUTE_OF)
+        self.assertEqual(
+            match.element_has_attribute('disabled').js,
+            f'({query.JS_ATTRIBUTE_OF.strip()})(element, "disabled") !== null'
+        )
+
+    def test_state_js_follows_webdriver_semantics(self):
+        self.assertEqual(match.element_is_enabled.js, '!element.matches(":disabled")')
+        self.assertIn('node.parentElement', match.element_is_visible.js)
+        self.assertIn('.opacity) === 0', match.element_is_visible.js)
+
+    def test_attribute_value_ignoring_case_has_no_js(self):
+        with self.assertWarns(FutureWarning):
+            condition = match.element_has_attribute('title').value('Foo', ignore_case=True)
+        self.assertIsNone(condition.js)
+
+    def test_should_with_timeout_keeps_js_waiting(self):
+        configs = []
+        element = Element(Locator('element', MagicMock), Config(timeout=1, wait_for_conditions_by_js=True))
+        with self.assertWarns(DeprecationWarning):
+            element.should(Condition('is checked', lambda entity: configs.append(entity.config)), timeout=3)
+        self.assertEqual((configs[-1].timeout, configs[-1].wait_for_conditions_by_js), (3, True))
+
+    def test_observed_condition_rechecks_after_js_matched(self):
+        calls = []
+
+        def fn(entity):
+            calls.append(entity)
+            if len(calls) == 1:
+                raise AssertionError('not yet')
+
+        element = MagicMock()
+        element._wait_for_js_condition.return_value = True
+        Element._observed_by_js(Condition('is ready', fn, 'true')).call(element)
+        self.assertEqual(len(calls), 2)
+
+    def test_observed_condition_falls_back_to_original_error(self):
+        def fn(entity):
+            raise AssertionError('not yet')
+
+        element = MagicMock()
+        element._wait_for_js_condition.side_effect = Exception('async scripts are not supported')
+        with self.assertRaisesRegex(AssertionError, 'not yet'):
+            Element._observed_by_js(Condition('is ready', fn, 'true')).call(element)
+
+
+if __name__ == '__main__':
+    unittest.main()
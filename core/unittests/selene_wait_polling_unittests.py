@@ -0,0 +1,56 @@
+import unittest
+from unittest.mock import patch
+
+from core.utils.selene.core import polling
+from core.utils.selene.core.exceptions import TimeoutException
+from core.utils.selene.core.wait import Wait
+
+
+class TestSeleneWaitPolling(unittest.TestCase):
+    def test_fixed_polling(self):
+        self.assertEqual(polling.fixed(0.2)(5), 0.2)
+
+    def test_exponential_polling_is_capped(self):
+        strategy = polling.exponential(initial=0.1, factor=2, at_most=0.3)
+        self.assertEqual([strategy(attempt) for attempt in range(1, 5)], [0.1, 0.2, 0.3, 0.3])
+
+    def test_jittered_polling_bounds(self):
+        self.assertAlmostEqual(polling.jittered(polling.fixed(1), ratio=0.5, rand=lambda: 0)(1), 0.5)
+        self.assertAlmostEqual(polling.jittered(polling.fixed(1), ratio=0.5, rand=lambda: 1)(1), 1.5)
+
+    def test_to_polling_from_milliseconds(self):
+        self.assertEqual(polling.to_polling(250)(1), 0.25)
+        self.assertIsNone(polling.to_polling(0))
+
+    def test_wait_sleeps_between_polls_and_counts_them(self):
+        attempts = []
+
+        def fn(entity):
+            attempts.append(entity)
+            if len(attempts) < 3:
+                raise AssertionError('not yet')
+            return 'done'
+
+        wait = Wait('entity', at_most=10, polling=polling.fixed(0.01))
+        with patch('core.utils.selene.core.wait.time.sleep') as sleep:
+            self.assertEqual(wait.for_(fn), 'done')
+        self.assertEqual(wait.polls, 3)
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_wait_timeout_reports_polls(self):
+        def fn(entity):
+            raise AssertionError('never')
+
+        wait = Wait('entity', at_most=0.05, polling=polling.fixed(0.01))
+        with self.assertRaises(TimeoutException) as error:
+            wait.for_(fn)
+        self.assertIn(f'({wait.polls} polls)', error.exception.msg)
+
+    def test_wait_keeps_polling_when_reconfigured(self):
+        wait = Wait('entity', at_most=1, polling=polling.fixed(0.01))
+        self.assertIs(wait.at_most(2).polling, wait.polling)
+        self.assertIs(wait.or_fail_with(None).polling, wait.polling)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import json
+import tempfile
+import types
+import unittest
+from os.path import join
+from unittest.mock import patch
+
+from core.utils.testrail import TestRail
+
+
+class TestAllureResultsStreaming(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        results = {
+            'b-result.json': {'name': 'second', 'labels': [{'name': 'tag', 'value': "testrail_ids(ids=('C2',))"}]},
+            'a-result.json': {'name': 'first', 'labels': [{'name': 'tag', 'value': "testrail_ids(ids=('C1',))"}]},
+            'c-result.json': {'name': 'new', 'labels': []},
+            'd-container.json': {'name': 'container'},
+        }
+        for name, value in results.items():
+            with open(join(self.folder.name, name), 'w', encoding='UTF-8') as file:
+                json.dump(value, file)
+        self.testrail = TestRail()
+        patcher = patch.object(TestRail, '_get_path', return_value=self.folder.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_results_are_streamed_in_file_order(self):
+        raw_data = self.testrail._get_allure_result()
+        self.assertIsInstance(raw_data['results'], types.GeneratorType)
+        self.assertEqual([value['name'] for value in raw_data['results']], ['first', 'second', 'new'])
+
+    def test_testrail_ids_are_collected_from_labels(self):
+        self.assertEqual(self.testrail._get_allure_result()['testrail_ids'], ['1', '2'])
+
+    def test_results_can_be_filtered_by_testrail_ids(self):
+        files = self.testrail._get_allure_files()
+        values = self.testrail._iter_allure_results(files, with_testrail_ids=True)
+        self.assertEqual([value['name'] for value in values], ['first', 'second'])
+
+
+if __name__ == '__main__':
+    unittest.main()
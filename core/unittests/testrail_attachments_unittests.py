@@ -0,0 +1,76 @@
+import tempfile
+import unittest
+from os.path import join
+from unittest.mock import MagicMock, patch
+
+from testrail_api import StatusCodeError
+
+from core.utils import testrail_attachments
+from core.utils.testrail_attachments import AttachmentUploader
+
+
+class TestAttachmentUploader(unittest.TestCase):
+    def setUp(self):
+        self.tr = MagicMock()
+        self.folder = tempfile.TemporaryDirectory()
+        self.first = join(self.folder.name, 'first.png')
+        self.copy = join(self.folder.name, 'copy.png')
+        for path in (self.first, self.copy):
+            with open(path, 'wb') as file:
+                file.write(b'screenshot')
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_identical_files_are_uploaded_once_per_result(self):
+        uploader = AttachmentUploader(tr=self.tr, workers=2)
+        uploader.submit(1, self.first)
+        uploader.submit(1, self.copy)
+        uploader.submit(2, self.copy)
+        uploader.close()
+        self.assertEqual(self.tr.attachments.add_attachment_to_result.call_count, 2)
+
+    def test_failed_upload_is_retried(self):
+        self.tr.attachments.add_attachment_to_result.side_effect = [ConnectionError('reset'), {'attachment_id': 1}]
+        uploader = AttachmentUploader(tr=self.tr, retries=3, backoff=0)
+        uploader.submit(1, self.first)
+        uploader.close()
+        self.assertEqual(self.tr.attachments.add_attachment_to_result.call_count, 2)
+        self.assertEqual(uploader.failed, [])
+
+    def test_gives_up_after_retries(self):
+        self.tr.attachments.add_attachment_to_result.side_effect = ConnectionError('reset')
+        uploader = AttachmentUploader(tr=self.tr, retries=2, backoff=0)
+        uploader.submit(1, self.first)
+        uploader.close()
+        self.assertEqual(uploader.failed, [(1, self.first)])
+
+    def test_client_errors_are_not_retried(self):
+        self.tr.attachments.add_attachment_to_result.side_effect = StatusCodeError(400, 'Bad Request', '', b'')
+        uploader = AttachmentUploader(tr=self.tr, retries=3, backoff=0)
+        uploader.submit(1, self.first)
+        uploader.close()
+        self.tr.attachments.add_attachment_to_result.assert_called_once()
+        self.assertEqual(uploader.failed, [(1, self.first)])
+
+    def test_missing_pillow_is_reported_once(self):
+        uploader = AttachmentUploader(tr=self.tr, max_size=100)
+        with patch.object(testrail_attachments, 'Image', None), \
+                patch.object(testrail_attachments, '_pillow_warned', False), \
+                patch('builtins.print') as report:
+            uploader.submit(1, self.first)
+            uploader.submit(2, self.first)
+            uploader.close()
+        report.assert_called_once()
+        self.assertEqual(self.tr.attachments.add_attachment_to_result.call_count, 2)
+
+    def test_missing_files_are_skipped(self):
+        uploader = AttachmentUploader(tr=self.tr)
+        self.assertIsNone(uploader.submit(1, None))
+        self.assertIsNone(uploader.submit(1, join(self.folder.name, 'missing.png')))
+        uploader.close()
+        self.tr.attachments.add_attachment_to_result.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
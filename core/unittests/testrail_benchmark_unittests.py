@@ -0,0 +1,133 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from math import ceil
+from os.path import join
+from unittest.mock import patch
+
+from testrail_api import TestRailAPI
+
+from core.unittests.fake_testrail import FakeTestRail
+from core.utils.testrail import TestRail
+from core.utils.testrail_results import PAGE_LIMIT, ResultsBatch
+
+SIZES = [int(size) for size in os.getenv('TESTRAIL_BENCHMARK_SIZES', '10,1000,10000').split(',')]
+LATENCY = float(os.getenv('TESTRAIL_BENCHMARK_LATENCY', '0'))
+ENVIRONMENT = {
+    'TESTRAIL_PROJECT_ID': '1',
+    'TESTRAIL_MILESTONE': 'root',
+    'TESTRAIL_TITLE_RUN': 'benchmark',
+    'TESTRAIL_PASSED_STATUS': '1',
+    'TESTRAIL_FAILED_STATUS': '5',
+    'TESTRAIL_BLOCKED_STATUS': '2',
+    'TESTRAIL_AUTOMATED_TYPE_NONE': '0',
+    'TESTRAIL_AUTOMATED_TYPE_API': '5',
+    'TESTRAIL_AUTOMATED_TYPE_GUI': '6',
+    'TESTRAIL_TYPE_AUTOMATED': '3',
+    'TESTRAIL_BROWSER': '1',
+    'TESTRAIL_RESULTS_CHUNK_SIZE': '100',
+    'TESTRAIL_AUTOCLOSE_TESTRUN': '1',
+    'TEAMCITY_LAUNCHES': '1',
+    'ALLURE_DIR': 'raw_reports',
+}
+
+
+class TestTestRailReportingBenchmark(unittest.TestCase):
+    def setUp(self):
+        environment = patch.dict(os.environ, ENVIRONMENT)
+        environment.start()
+        self.addCleanup(environment.stop)
+        platform = patch('core.utils.testrail.system', return_value='linux')
+        platform.start()
+        self.addCleanup(platform.stop)
+
+    def _fake(self, cases: int) -> FakeTestRail:
+        fake = FakeTestRail(latency=LATENCY)
+        section = fake.add_section('benchmark')
+        for number in range(cases):
+            fake.add_case(section['id'], f'test_{number}')
+        fake.start()
+        self.addCleanup(fake.stop)
+        return fake
+
+    @staticmethod
+    def _api(fake: FakeTestRail) -> TestRailAPI:
+        return TestRailAPI(url=fake.url, email='user@example.com', password='password', warn_ignore=True)
+
+    @staticmethod
+    def _report(name: str, size: int, fake: FakeTestRail, elapsed: float):
+        print(f'\n{name}: {size} results, {fake.total_calls} API calls, {elapsed:.2f}s, {dict(fake.calls)}')
+
+    def test_per_test_reporting(self):
+        for size in SIZES:
+            with self.subTest(size=size):
+                fake = self._fake(size)
+                tr = self._api(fake)
+                testrail = TestRail()
+                started = time.perf_counter()
+                with patch.object(TestRail, '_get_test_case_ids', return_value=[]), \
+                        patch.dict(os.environ, {'ALLURE_FOR_TESTRAIL_ENABLED': '0'}):
+                    run_id = testrail.create_test_run(tr=tr)
+                batch = ResultsBatch(tr=tr, run_id=run_id)
+                for case_id in range(1, size + 1):
+                    testrail.set_status(
+                        tr=tr,
+                        data={
+                            'case_id': f'C{case_id}',
+                            'status': 1 if case_id % 10 else 5,
+                            'test_run_id': run_id,
+                            'elapsed': '1s',
+                            'comment': 'benchmark'
+                        },
+                        batch=batch
+                    )
+                batch.close()
+                testrail.close_test_run(tr=tr, run_id=run_id)
+                self._report('per-test', size, fake, time.perf_counter() - started)
+
+                self.assertEqual(len(fake.results), size)
+                self.assertEqual(fake.calls['add_results_for_cases'], ceil(size / 100))
+                self.assertLessEqual(
+                    fake.calls['get_tests'] + fake.calls['get_results_for_run'], 2 * (size // PAGE_LIMIT + 1)
+                )
+                self.assertEqual(fake.calls['add_result_for_case'] + fake.calls['get_results_for_case'], 0)
+
+    def test_allure_reporting(self):
+        for size in SIZES:
+            with self.subTest(size=size), tempfile.TemporaryDirectory() as folder:
+                fake = self._fake(size)
+                tr = self._api(fake)
+                for case_id in range(1, size + 1):
+                    with open(join(folder, f'{case_id:06}-result.json'), 'w', encoding='UTF-8') as file:
+                        json.dump({
+                            'name': f'test_{case_id}',
+                            'status': 'passed' if case_id % 10 else 'failed',
+                            'labels': [{'name': 'tag', 'value': f"testrail_ids(ids=('C{case_id}',))"}],
+                            'steps': [{'name': 'step', 'status': 'passed', 'start': 0, 'stop': 1000}],
+                            'fullName': f'tests.API.test_benchmark.TestBenchmark#test_{case_id}'
+                        }, file)
+                testrail = TestRail()
+                started = time.perf_counter()
+                with patch.object(TestRail, '_get_path', return_value=folder), \
+                        patch.dict(os.environ, {'ALLURE_FOR_TESTRAIL_ENABLED': '1'}):
+                    testrail.set_statuses(tr=tr, data={'test_run_id': 0, 'teamcity_launches': '1'})
+                self._report('allure', size, fake, time.perf_counter() - started)
+
+                self.assertEqual(len(fake.results), size)
+                self.assertTrue(all(run['is_completed'] for run in fake.runs.values()))
+                self.assertEqual(fake.calls['add_results_for_cases'], ceil(size / 100))
+                self.assertLessEqual(fake.total_calls, ceil(size / 100) + 2 * (size // PAGE_LIMIT + 1) + 10)
+
+    def test_rate_limited_server_is_retried(self):
+        fake = FakeTestRail(rate_limit=2)
+        fake.start()
+        self.addCleanup(fake.stop)
+        tr = self._api(fake)
+        for _ in range(5):
+            self.assertEqual(tr.milestones.get_milestones(project_id=1), fake.milestones)
+
+
+if __name__ == '__main__':
+    unittest.main()
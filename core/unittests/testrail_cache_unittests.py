@@ -0,0 +1,39 @@
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from core.utils.testrail_cache import MetadataCache
+
+
+class TestMetadataCache(unittest.TestCase):
+    def test_loads_once_per_run(self):
+        load = MagicMock(return_value=[{'id': 1}])
+        cache = MetadataCache()
+        self.assertEqual(cache.get('sections', load), [{'id': 1}])
+        self.assertEqual(cache.get('sections', load), [{'id': 1}])
+        load.assert_called_once()
+
+    def test_invalidate_reloads(self):
+        load = MagicMock(side_effect=[[1], [1, 2]])
+        cache = MetadataCache()
+        cache.get('cases:1:2', load)
+        cache.invalidate('cases:1:2')
+        self.assertEqual(cache.get('cases:1:2', load), [1, 2])
+
+    def test_disk_cache_is_shared_between_instances(self):
+        with tempfile.TemporaryDirectory() as folder:
+            MetadataCache(folder=folder, ttl=60).get('milestones', lambda: [{'id': 3}])
+            load = MagicMock()
+            self.assertEqual(MetadataCache(folder=folder, ttl=60).get('milestones', load), [{'id': 3}])
+            load.assert_not_called()
+
+    def test_disk_cache_disabled_without_ttl(self):
+        with tempfile.TemporaryDirectory() as folder:
+            MetadataCache(folder=folder).get('milestones', lambda: [{'id': 3}])
+            load = MagicMock(return_value=[])
+            self.assertEqual(MetadataCache(folder=folder).get('milestones', load), [])
+            load.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from os.path import join
+from unittest.mock import patch
+
+from core.utils.testrail import TestRail
+from core.utils.testrail_index import TestRailIndex, parse_tests
+
+SOURCE = '''from core.utils.testrail import TestRail
+
+
+class TestExample:
+    @TestRail.suite('API: example')
+    @TestRail.id('C12')
+    def test_with_id(self):
+        pass
+
+    @TestRail.suite('API: example')
+    @TestRail.id('id_test_case')
+    def test_without_id(self):
+        pass
+
+
+def test_module_level():
+    pass
+'''
+
+
+class TestTestRailIndex(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.tests = join(self.folder.name, 'tests')
+        os.makedirs(join(self.tests, 'API'))
+        self.file = join(self.tests, 'API', 'test_example.py')
+        with open(self.file, 'w', encoding='UTF-8') as file:
+            file.write(SOURCE)
+        self.cache_file = join(self.folder.name, '.cache', 'testrail_index.json')
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_markers_are_parsed(self):
+        tests = parse_tests(SOURCE)
+        self.assertEqual(tests['TestExample::test_with_id'], {'ids': [12], 'suite': 'API: example', 'line': 7})
+        self.assertEqual(tests['TestExample::test_without_id']['ids'], [])
+        self.assertIn('test_module_level', tests)
+
+    def test_unchanged_files_are_not_parsed_again(self):
+        self.assertEqual(TestRailIndex(self.tests, self.cache_file).case_ids(), [12])
+        with patch('core.utils.testrail_index.parse_tests') as parse:
+            self.assertEqual(TestRailIndex(self.tests, self.cache_file).case_ids(), [12])
+        parse.assert_not_called()
+
+    def test_unwritable_cache_is_ignored(self):
+        with patch('core.utils.testrail_index.os.makedirs', side_effect=PermissionError('read-only')):
+            self.assertEqual(TestRailIndex(self.tests, self.cache_file).case_ids(), [12])
+
+    def test_case_ids_for_xdist_nodes(self):
+        testrail = TestRail()
+        testrail._tests_index = TestRailIndex(self.tests, self.cache_file)
+        self.assertEqual(testrail._get_case_ids_for_nodes([
+            'tests/API/test_example.py::TestExample::test_with_id[1]',
+            'tests/API/test_example.py::TestExample::test_with_id[2]',
+            'tests/API/test_example.py::TestExample::test_without_id',
+            'tests/API/test_missing.py::test_module_level',
+        ]), ['12'])
+
+    def test_ids_are_written_per_file_in_one_pass(self):
+        testrail = TestRail()
+        testrail._tests_index = TestRailIndex(self.tests, self.cache_file)
+        full_name = 'tests.API.test_example.TestExample#test_without_id'
+        testrail._add_testrail_id_in_file_before_test(id=34, full_name=full_name)
+        testrail._add_testrail_id_in_file_before_test(id=34, full_name=full_name)
+        testrail._add_testrail_id_in_file_before_test(id=56, full_name='tests.API.test_example#test_module_level')
+        with patch('core.utils.testrail_index.os.replace', wraps=os.replace) as replace:
+            self.assertEqual(testrail.write_testrail_ids(), 2)
+        self.assertEqual([call.args[1] for call in replace.call_args_list].count(self.file), 1)
+        with open(self.file, 'r', encoding='UTF-8') as file:
+            source = file.read()
+        self.assertEqual(source.count("    @TestRail.id('C34')\n    def test_without_id(self):"), 1)
+        self.assertIn("@TestRail.id('C56')\ndef test_module_level():", source)
+        self.assertEqual(sorted(testrail._get_test_case_ids()), [12, 34, 56])
+        self.assertEqual(testrail.write_testrail_ids(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
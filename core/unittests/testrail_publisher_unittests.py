@@ -0,0 +1,106 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from os.path import join
+from unittest.mock import MagicMock, patch
+
+from core.utils.testrail_publisher import AllurePublisher
+
+
+class TestAllurePublisher(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.testrail = MagicMock()
+        self.testrail.spool = None
+        self.testrail._get_path.return_value = self.folder.name
+        self.testrail._get_testrail_id.side_effect = lambda value: value.get('id')
+        self.testrail._get_result_fields.return_value = {}
+        self.testrail.open_test_run.return_value = 7
+        self.tr = MagicMock()
+        self.tr.tests.get_tests.return_value = []
+        self.tr.results.get_results_for_run.return_value = []
+        self.tr.results.add_results_for_cases.return_value = []
+        self.publisher = AllurePublisher(testrail=self.testrail, tr=self.tr, data={'test_run_id': 0}, interval=60)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def _write(self, name, content):
+        with open(join(self.folder.name, name), 'w', encoding='UTF-8') as file:
+            file.write(content)
+
+    def test_each_result_file_is_published_once(self):
+        self._write('a-result.json', json.dumps({'id': '1'}))
+        self.assertEqual(self.publisher.publish(), 1)
+        self._write('b-result.json', json.dumps({'id': '2'}))
+        self.assertEqual(self.publisher.publish(), 1)
+        self.assertEqual(self.testrail.set_allure_status.call_count, 2)
+        self.testrail.open_test_run.assert_called_once()
+        self.assertEqual(self.publisher.testrail_ids, ['1', '2'])
+
+    def test_known_entries_are_not_read_again(self):
+        self._write('a-result.json', json.dumps({'id': '1'}))
+        self._write('a-attachment.png', '')
+        self.publisher.publish()
+        with patch('core.utils.testrail_publisher.open') as read:
+            self.assertEqual(self.publisher.publish(), 0)
+        read.assert_not_called()
+        self.assertEqual(self.publisher._seen, {'a-result.json', 'a-attachment.png'})
+
+    def test_notifications_are_debounced(self):
+        publisher = AllurePublisher(testrail=self.testrail, tr=self.tr, data={}, interval=60, min_gap=0.2)
+        with patch.object(AllurePublisher, 'publish', return_value=0) as publish:
+            publisher.start()
+            for _ in range(20):
+                publisher.notify()
+                time.sleep(0.01)
+            publisher._stopped = True
+            publisher._stop.set()
+            publisher._event.set()
+            publisher._thread.join()
+        self.assertLessEqual(publish.call_count, 2)
+
+    def test_incomplete_file_is_retried_later(self):
+        self._write('a-result.json', '{"id": ')
+        self.assertEqual(self.publisher.publish(), 0)
+        self._write('a-result.json', json.dumps({'id': '1'}))
+        self.assertEqual(self.publisher.publish(), 1)
+
+    def test_failed_result_is_published_again(self):
+        self._write('a-result.json', json.dumps({'id': '1'}))
+        self.testrail.set_allure_status.side_effect = [ConnectionError('TestRail is down'), None]
+        with self.assertRaises(ConnectionError):
+            self.publisher.publish()
+        self.assertEqual(self.publisher.publish(), 1)
+        self.assertEqual(self.testrail.set_allure_status.call_count, 2)
+
+    def test_run_is_opened_with_ids_collected_by_workers(self):
+        self.publisher.add_testrail_ids(['3', 4])
+        self.publisher.add_testrail_ids(['3'])
+        self._write('a-result.json', json.dumps({'id': '1'}))
+        self.publisher.publish()
+        self.assertEqual(self.publisher.testrail_ids, ['3', '4', '1'])
+
+    def test_close_flushes_results_and_closes_run(self):
+        self._write('a-result.json', json.dumps({'id': '1'}))
+        self.publisher.start()
+        with patch.dict(os.environ, {'TESTRAIL_AUTOCLOSE_TESTRUN': '1'}):
+            self.publisher.close()
+        self.testrail.set_allure_status.assert_called_once()
+        self.testrail.finish_test_run.assert_called_once_with(tr=self.tr, run_id=7)
+
+    def test_unpublished_results_are_spooled_when_testrail_is_down(self):
+        self._write('a-result.json', json.dumps({'id': '1'}))
+        self.testrail.spool = MagicMock()
+        self.testrail.set_allure_status.side_effect = OSError('TestRail is down')
+        self.testrail._iter_allure_results.side_effect = lambda files: [{'id': '1'} for _ in files]
+        self.publisher.close()
+        self.testrail._spool_allure_results.assert_called_once_with(
+            data=self.publisher.data, values=[{'id': '1'}], testrail_ids=['1']
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
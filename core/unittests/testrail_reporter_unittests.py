@@ -0,0 +1,66 @@
+import threading
+import unittest
+
+from core.utils.testrail_reporter import BackgroundReporter
+
+
+class TestBackgroundReporter(unittest.TestCase):
+    def test_results_are_reported_off_the_calling_thread(self):
+        threads = []
+        reporter = BackgroundReporter(report=lambda data: threads.append(threading.current_thread().name), max_size=2)
+        for case_id in range(5):
+            reporter.put({'case_id': case_id})
+        reporter.close()
+        self.assertEqual(threads, ['testrail-reporter'] * 5)
+
+    def test_close_drains_queue_in_order(self):
+        reported = []
+        release = threading.Event()
+
+        def report(data):
+            release.wait()
+            reported.append(data['case_id'])
+
+        reporter = BackgroundReporter(report=report, max_size=10)
+        for case_id in range(3):
+            reporter.put({'case_id': case_id})
+        self.assertEqual(reported, [])
+        release.set()
+        reporter.close()
+        self.assertEqual(reported, [0, 1, 2])
+
+    def test_failures_do_not_stop_reporting(self):
+        reported = []
+
+        def report(data):
+            if data['case_id'] == 1:
+                raise ConnectionError('TestRail is down')
+            reported.append(data['case_id'])
+
+        reporter = BackgroundReporter(report=report)
+        for case_id in range(3):
+            reporter.put({'case_id': case_id})
+        with self.assertRaises(RuntimeError):
+            reporter.close()
+        self.assertEqual(reported, [0, 2])
+        self.assertEqual(reporter.failed, [{'case_id': 1}])
+
+    def test_failed_results_are_retried_on_close(self):
+        reported = []
+        errors = [ConnectionError('TestRail is down')]
+
+        def report(data):
+            if errors:
+                raise errors.pop()
+            reported.append(data['case_id'])
+
+        reporter = BackgroundReporter(report=report)
+        for case_id in range(2):
+            reporter.put({'case_id': case_id})
+        reporter.close()
+        self.assertEqual(reported, [1, 0])
+        self.assertEqual(reporter.failed, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from core.utils.testrail_results import ResultsBatch, ResultsIndex, paginated
+
+
+class TestTestRailResultsBatch(unittest.TestCase):
+    def setUp(self):
+        self.tr = MagicMock()
+        self.tr.tests.get_tests.return_value = []
+        self.tr.results.get_results_for_run.return_value = []
+        self.tr.results.add_results_for_cases.side_effect = lambda run_id, results: [
+            {'id': index} for index, _ in enumerate(results)
+        ]
+
+    def test_results_are_sent_in_chunks(self):
+        batch = ResultsBatch(tr=self.tr, run_id=1, chunk_size=2)
+        for case_id in range(5):
+            batch.add(case_id=case_id, status_id=1)
+        self.assertEqual(self.tr.results.add_results_for_cases.call_count, 2)
+        self.assertEqual(len(batch), 1)
+        batch.flush()
+        self.assertEqual(self.tr.results.add_results_for_cases.call_count, 3)
+        self.assertEqual(len(batch), 0)
+
+    def test_attachments_are_uploaded_to_created_results(self):
+        with tempfile.NamedTemporaryFile(suffix='.png') as screenshot:
+            batch = ResultsBatch(tr=self.tr, run_id=1, chunk_size=10)
+            batch.add(case_id=1, status_id=1)
+            batch.add(case_id=2, status_id=5, attachments=[screenshot.name, None, 'missing.png'])
+            batch.close()
+            self.tr.attachments.add_attachment_to_result.assert_called_once_with(1, screenshot.name)
+
+    def test_latest_status_of_case_is_known_before_flush(self):
+        batch = ResultsBatch(tr=self.tr, run_id=1, chunk_size=10)
+        batch.add(case_id='7', status_id='5')
+        self.assertEqual(batch.status(7), 5)
+        self.assertEqual(batch.status(8), 0)
+        self.tr.results.add_results_for_cases.assert_not_called()
+
+    def test_posted_results_update_index(self):
+        batch = ResultsBatch(tr=self.tr, run_id=1, chunk_size=10)
+        batch.add(case_id=3, status_id=5)
+        batch.flush()
+        self.assertEqual(batch.index.status(3), 5)
+
+
+class TestTestRailResultsIndex(unittest.TestCase):
+    def test_index_is_loaded_once_with_latest_status_per_case(self):
+        tr = MagicMock()
+        tr.tests.get_tests.return_value = [{'id': 10, 'case_id': 1}, {'id': 20, 'case_id': 2}]
+        tr.results.get_results_for_run.return_value = [
+            {'test_id': 10, 'status_id': 1},
+            {'test_id': 10, 'status_id': 5},
+            {'test_id': 20, 'status_id': None},
+        ]
+        index = ResultsIndex(tr=tr, run_id=1)
+        self.assertEqual(index.status(1), 1)
+        self.assertEqual(index.status(2), 0)
+        self.assertEqual(index.status(3), 0)
+        tr.tests.get_tests.assert_called_once()
+        tr.results.get_results_for_run.assert_called_once()
+        tr.results.get_results_for_case.assert_not_called()
+
+    def test_paginated_follows_next_links(self):
+        pages = [
+            {'tests': [{'id': 1}], '_links': {'next': '/api/v2/get_tests/1&offset=1'}},
+            {'tests': [{'id': 2}], '_links': {'next': None}},
+        ]
+        method = MagicMock(side_effect=pages)
+        self.assertEqual(paginated(method, 'tests', 1), [{'id': 1}, {'id': 2}])
+        self.assertEqual(method.call_args_list[1].kwargs['offset'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import os
+import tempfile
+import unittest
+from os.path import isfile, join
+from unittest.mock import MagicMock, patch
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from testrail_api import StatusCodeError
+
+from core.utils.testrail import TestRail
+from core.utils.testrail_results import ResultsBatch
+from core.utils.testrail_spool import ResultsSpool
+
+
+class TestResultsSpool(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.spool = ResultsSpool(join(self.folder.name, 'testrail_spool.jsonl'))
+        self.screenshot = join(self.folder.name, '1.png')
+        with open(self.screenshot, 'wb') as file:
+            file.write(b'screenshot')
+        self.tr = MagicMock()
+        self.tr.tests.get_tests.return_value = []
+        self.tr.results.get_results_for_run.return_value = []
+        self.tr.results.add_results_for_cases.side_effect = lambda run_id, results: [
+            {'id': index} for index, _ in enumerate(results)
+        ]
+        self.testrail = MagicMock()
+        self.testrail.create_test_run.return_value = 42
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_failed_upload_is_spooled_with_attachments(self):
+        self.tr.results.add_results_for_cases.side_effect = ConnectionError('TestRail is down')
+        batch = ResultsBatch(tr=self.tr, run_id=3, spool=self.spool)
+        batch.add(case_id=1, status_id=5, attachments=[self.screenshot])
+        batch.close()
+        os.remove(self.screenshot)
+        record = list(self.spool.records())[0]
+        self.assertEqual(record['run_id'], 3)
+        self.assertEqual(record['results'], [{'case_id': 1, 'status_id': 5}])
+        self.assertTrue(isfile(record['attachments'][0][0]))
+
+    def test_offline_run_is_created_on_replay(self):
+        run_id = self.spool.create_run(testrail_ids=['1'])
+        batch = ResultsBatch(tr=self.tr, run_id=run_id, spool=self.spool)
+        self.assertEqual(batch.status(1), 0)
+        batch.add(case_id=1, status_id=1)
+        batch.close()
+        self.spool.close_run(run_id)
+        self.tr.results.add_results_for_cases.assert_not_called()
+
+        self.assertEqual(self.spool.replay(tr=self.tr, testrail=self.testrail), 1)
+        self.testrail.create_test_run.assert_called_once_with(tr=self.tr, testrail_ids=['1'])
+        self.tr.results.add_results_for_cases.assert_called_once_with(
+            run_id=42, results=[{'case_id': 1, 'status_id': 1}]
+        )
+        self.testrail.close_test_run.assert_called_once_with(tr=self.tr, run_id=42)
+        self.assertFalse(isfile(self.spool.path))
+
+    def test_failed_replay_keeps_remaining_records(self):
+        run_id = self.spool.create_run()
+        self.spool.add_results(run_id, [{'case_id': 1, 'status_id': 1}], [[]])
+        self.tr.results.add_results_for_cases.side_effect = ConnectionError('TestRail is down')
+        self.assertEqual(self.spool.replay(tr=self.tr, testrail=self.testrail), 0)
+        records = list(self.spool.records())
+        self.assertEqual([record['kind'] for record in records], ['results'])
+        self.assertEqual(records[0]['run_id'], 42)
+
+    def test_posted_results_are_not_posted_again(self):
+        self.spool.add_results(3, [{'case_id': case_id, 'status_id': 1} for case_id in (1, 2)], [[], []])
+        self.tr.results.add_results_for_cases.side_effect = [[{'id': 1}], ConnectionError('TestRail is down')]
+        self.assertEqual(self.spool.replay(tr=self.tr, testrail=self.testrail, chunk_size=1), 1)
+        self.assertEqual(list(self.spool.records())[0]['posted'], 1)
+
+        self.tr.results.add_results_for_cases.side_effect = None
+        self.tr.results.add_results_for_cases.return_value = [{'id': 2}]
+        self.assertEqual(self.spool.replay(tr=self.tr, testrail=self.testrail, chunk_size=1), 1)
+        self.tr.results.add_results_for_cases.assert_called_with(run_id=3, results=[{'case_id': 2, 'status_id': 1}])
+        self.assertFalse(isfile(self.spool.path))
+
+    def test_only_unavailable_testrail_is_spooled(self):
+        testrail = TestRail(spool=self.spool)
+        error = StatusCodeError(400, 'Bad Request', 'add_run', b'Field :milestone_id is not a valid milestone.')
+        with patch.object(TestRail, 'create_test_run', side_effect=error):
+            with self.assertRaises(StatusCodeError):
+                testrail.open_test_run(tr=self.tr)
+        with patch.object(TestRail, 'create_test_run', side_effect=StatusCodeError(503, 'Unavailable', '', b'')):
+            self.assertTrue(self.spool.is_offline(testrail.open_test_run(tr=self.tr)))
+
+    def test_allure_results_are_spooled_when_metadata_is_unavailable(self):
+        testrail = TestRail(spool=self.spool)
+        value = {
+            'name': 'test_1',
+            'status': 'failed',
+            'steps': [{'name': 'step', 'status': 'failed', 'start': 0, 'stop': 1, 'attachments': [{'source': '1.png'}]}]
+        }
+        with patch.object(TestRail, '_get_custom_case_field', side_effect=RequestsConnectionError('down')), \
+                patch.object(TestRail, '_get_path', return_value=self.screenshot), \
+                patch.dict(os.environ, {'ALLURE_FOR_TESTRAIL_ENABLED': '1', 'TEAMCITY_LAUNCHES': '1',
+                                        'TESTRAIL_AUTOCLOSE_TESTRUN': '1'}):
+            testrail.set_allure_statuses(tr=self.tr, data={'test_run_id': 0}, results=[value], testrail_ids=['1'])
+        os.remove(self.screenshot)
+        run, record, close = list(self.spool.records())
+        self.assertEqual((close['kind'], close['run_id']), ('close_run', run['key']))
+        self.assertEqual((run['kind'], run['testrail_ids']), ('run', ['1']))
+        self.assertEqual((record['kind'], record['run_id'], record['testrail_ids']), ('allure', run['key'], ['1']))
+        self.assertTrue(isfile(record['results'][0]['spooled_files']['1.png']))
+
+        with patch.dict(os.environ, {'ALLURE_FOR_TESTRAIL_ENABLED': '0'}):
+            self.assertEqual(self.spool.replay(tr=self.tr, testrail=self.testrail), 1)
+        self.testrail.create_test_run.assert_called_once_with(tr=self.tr, testrail_ids=['1'])
+        self.assertEqual(self.testrail.set_allure_statuses.call_args.kwargs['data']['test_run_id'], 42)
+        self.testrail.close_test_run.assert_called_once_with(tr=self.tr, run_id=42)
+        self.assertFalse(isfile(self.spool.path))
+
+    def test_allure_record_without_run_opens_run_on_replay(self):
+        self.spool.add_allure_results(0, data={'test_run_id': 0}, values=[{'name': 'test_1'}], testrail_ids=['1'])
+        self.testrail.set_allure_statuses.side_effect = ConnectionError('TestRail is down')
+        self.assertEqual(self.spool.replay(tr=self.tr, testrail=self.testrail), 0)
+        self.assertEqual(list(self.spool.records())[0]['run_id'], 42)
+
+        self.testrail.set_allure_statuses.side_effect = None
+        self.assertEqual(self.spool.replay(tr=self.tr, testrail=self.testrail), 1)
+        self.testrail.create_test_run.assert_called_once_with(tr=self.tr, testrail_ids=['1'])
+        self.assertEqual(self.testrail.set_allure_statuses.call_args.kwargs['data']['test_run_id'], 42)
+        self.assertFalse(isfile(self.spool.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
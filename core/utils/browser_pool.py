@@ -0,0 +1,70 @@
+from typing import Callable, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from core.utils.selene.core.configuration import Config
+from core.utils.selene.core.entity import Browser
+from core.utils.selene.support.webdriver import WebHelper
+
+
+class BrowserPool:
+    def __init__(
+            self,
+            create_driver: Callable[[], WebDriver],
+            quit_driver: Optional[Callable[[WebDriver], None]] = None,
+            max_reuse: int = 1
+    ):
+        self._create_driver = create_driver
+        self._quit_driver = quit_driver or (lambda driver: driver.quit())
+        self._max_reuse = max(int(max_reuse), 1)
+        self._driver = None
+        self._uses = 0
+
+    @property
+    def uses(self) -> int:
+        return self._uses
+
+    def _quit(self):
+        driver, self._driver, self._uses = self._driver, None, 0
+        try:
+            self._quit_driver(driver)
+        except Exception as e:
+            print('Не удалось закрыть браузер:', e)
+
+    def _reset(self, driver: WebDriver) -> bool:
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            try:
+                Browser(Config(driver=driver)).clear_local_storage().clear_session_storage()
+            except Exception:
+                pass
+            if hasattr(driver, 'execute_cdp_cmd'):
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            driver.delete_all_cookies()
+            driver.get('about:blank')
+            return True
+        except Exception as e:
+            print('Не удалось очистить состояние браузера:', e)
+            return False
+
+    def acquire(self) -> WebDriver:
+        if self._driver is not None and not WebHelper(self._driver).is_browser_still_alive():
+            self._quit()
+        if self._driver is None:
+            self._driver = self._create_driver()
+        self._uses += 1
+        return self._driver
+
+    def release(self):
+        if self._driver is None:
+            return
+        if self._uses >= self._max_reuse or not self._reset(self._driver):
+            self._quit()
+
+    def close(self):
+        if self._driver is not None:
+            self._quit()
@@ -1,18 +1,128 @@
 import json
 import os
 import shutil
-from os import getcwd
+from collections.abc import Mapping
+from functools import lru_cache
+from os import getcwd, getenv
 from os.path import join
 from pathlib import Path
 
 from pytest import PytestWarning
 
+from core.utils.selene.core import polling
 
-def get_settings(environment):
-    CONFIG_PATH = join(get_current_folder(folder='config'), 'config.json')
-    with open(CONFIG_PATH) as data:
-        config = json.load(data)
-        return config[environment]
+
+SETTINGS_ENV_PREFIX = 'PTF_CONFIG_'
+
+_settings = {}
+
+
+class Settings(Mapping):
+    def __init__(self, data: dict):
+        self._data = {key: self._freeze(value) for key, value in data.items()}
+
+    @classmethod
+    def _freeze(cls, value):
+        if isinstance(value, dict):
+            return cls(value)
+        if isinstance(value, list):
+            return tuple(cls._freeze(item) for item in value)
+        return value
+
+    def __getitem__(self, key: str):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f'Settings({self.to_dict()!r})'
+
+    def get_int(self, key: str, default: int = 0) -> int:
+        value = self.get(key)
+        return default if value in (None, '') else int(value)
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        value = self.get(key)
+        if value in (None, ''):
+            return default
+        if isinstance(value, str):
+            return value.strip().lower() in ('1', 'true', 'yes')
+        return bool(value)
+
+    def get_str(self, key: str, default: str = '') -> str:
+        value = self.get(key)
+        return default if value is None else str(value)
+
+    def to_dict(self) -> dict:
+        def thaw(value):
+            if isinstance(value, Settings):
+                return value.to_dict()
+            if isinstance(value, tuple):
+                return [thaw(item) for item in value]
+            return value
+
+        return {key: thaw(value) for key, value in self._data.items()}
+
+
+def _overlay(config: dict) -> dict:
+    for name, raw in os.environ.items():
+        if not name.startswith(SETTINGS_ENV_PREFIX):
+            continue
+        path = name[len(SETTINGS_ENV_PREFIX):].split('__')
+        target = config
+        for depth, key in enumerate(path):
+            if not isinstance(target, dict) or key not in target:
+                raise ValueError(f'Переменная окружения {name} не соответствует настройке в config.json: '
+                                 f'ключ {"__".join(path[:depth + 1])} не найден')
+            if depth < len(path) - 1:
+                target = target[key]
+        try:
+            target[key] = json.loads(raw)
+        except ValueError:
+            target[key] = raw
+    return config
+
+
+def get_settings(environment) -> Settings:
+    if environment not in _settings:
+        config_path = join(get_current_folder(folder='config'), 'config.json')
+        with open(config_path, encoding='UTF-8') as data:
+            _settings[environment] = Settings(_overlay(json.load(data)[environment]))
+    return _settings[environment]
+
+
+def set_settings(environment, config: dict) -> Settings:
+    _settings[environment] = Settings(config)
+    return _settings[environment]
+
+
+def env_int(name: str, default: int = 0) -> int:
+    value = getenv(name)
+    return default if value in (None, '') else int(value)
+
+
+def env_flag(name: str) -> bool:
+    return env_int(name) == 1
+
+
+def get_polling(settings: dict):
+    if not settings:
+        return None
+    interval = settings.get('INTERVAL', 100) / 1000
+    strategy = str(settings.get('STRATEGY', 'fixed')).lower()
+    if strategy == 'exponential':
+        result = polling.exponential(initial=interval, at_most=settings.get('MAX_INTERVAL', 1000) / 1000)
+    elif strategy == 'fixed':
+        result = polling.fixed(interval)
+    else:
+        raise ValueError(f'Неизвестная стратегия ожидания: {strategy}')
+    if settings.get('JITTER'):
+        result = polling.jittered(result, ratio=settings['JITTER'])
+    return result
 
 
 def copy_files(source_folder, destination_folder):
@@ -45,17 +155,34 @@ def get_count_tests(reporter):
     return tests_count
 
 
-def get_current_folder(folder: str) -> str:
-    current = getcwd()
+ROOT_MARKERS = ('pytest.ini', 'setup.cfg')
+
+
+@lru_cache(maxsize=None)
+def _find_project_root(start: str) -> str:
+    for path in (Path(start), *Path(start).parents):
+        if any((path / marker).is_file() for marker in ROOT_MARKERS):
+            return str(path)
+    return str(Path(__file__).parent.parent.parent)
+
 
-    def find_folder(path: str or Path) -> str:
-        for _, f, _ in os.walk(path):
-            if folder in f:
-                return join(path, folder)
-        else:
-            return find_folder(path=Path(path).parent)
+def get_project_root() -> str:
+    return _find_project_root(getcwd())
 
-    return find_folder(path=current)
+
+@lru_cache(maxsize=None)
+def _find_folder(start: str, folder: str) -> str:
+    root = _find_project_root(start)
+    if os.path.isdir(join(root, folder)):
+        return join(root, folder)
+    for path in (Path(start), *Path(start).parents):
+        if (path / folder).is_dir():
+            return str(path / folder)
+    return join(root, folder)
+
+
+def get_current_folder(folder: str) -> str:
+    return _find_folder(getcwd(), folder)
 
 
 def get_fixtures():
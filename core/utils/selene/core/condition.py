@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, TypeVar, Callable
+from typing import List, TypeVar, Callable, Optional
 
 from core.utils.selene.core.exceptions import ConditionNotMatchedError
 from core.utils.selene.core.wait import Predicate, Lambda
@@ -16,7 +16,13 @@ class Condition(Callable[[E], None]):
             for condition in conditions:
                 condition.call(entity)
 
-        return cls(' and '.join(map(str, conditions)), fn)
+        return cls(
+            ' and '.join(map(str, conditions)),
+            fn,
+            ' && '.join(f'({condition.js})' for condition in conditions)
+            if all(condition.js for condition in conditions)
+            else None,
+        )
 
     @classmethod
     def by_or(cls, *conditions):
@@ -30,7 +36,13 @@ class Condition(Callable[[E], None]):
                     errors.append(e)
             raise AssertionError('; '.join(map(str, errors)))
 
-        return cls(' or '.join(map(str, conditions)), fn)
+        return cls(
+            ' or '.join(map(str, conditions)),
+            fn,
+            ' || '.join(f'({condition.js})' for condition in conditions)
+            if all(condition.js for condition in conditions)
+            else None,
+        )
 
     @classmethod
     def as_not(
@@ -49,21 +61,27 @@ class Condition(Callable[[E], None]):
                 return
             raise ConditionNotMatchedError()
 
-        return cls(new_description, fn)
+        return cls(
+            new_description, fn, f'!({condition.js})' if condition.js else None
+        )
 
     @classmethod
     def raise_if_not(
-            cls, description: str, predicate: Predicate[E]
+            cls, description: str, predicate: Predicate[E], js: Optional[str] = None
     ) -> Condition[E]:
         def fn(entity: E) -> None:
             if not predicate(entity):
                 raise ConditionNotMatchedError()
 
-        return cls(description, fn)
+        return cls(description, fn, js)
 
     @classmethod
     def raise_if_not_actual(
-            cls, description: str, query: Lambda[E, R], predicate: Predicate[R]
+            cls,
+            description: str,
+            query: Lambda[E, R],
+            predicate: Predicate[R],
+            js: Optional[str] = None,
     ) -> Condition[E]:
         def fn(entity: E) -> None:
             query_to_str = str(query)
@@ -76,15 +94,22 @@ class Condition(Callable[[E], None]):
             if not predicate(actual):
                 raise AssertionError(f'actual {result}: {actual}')
 
-        return cls(description, fn)
+        return cls(description, fn, js)
 
-    def __init__(self, description: str, fn: Lambda[E, None]):
+    def __init__(
+            self, description: str, fn: Lambda[E, None], js: Optional[str] = None
+    ):
         self._description = description
         self._fn = fn
+        self._js = js
 
     def call(self, entity: E) -> None:
         self._fn(entity)
 
+    @property
+    def js(self) -> Optional[str]:
+        return self._js
+
     @property
     def predicate(self) -> Lambda[E, bool]:
         def fn(entity):
@@ -6,6 +6,7 @@ from selenium.webdriver.remote.webdriver import WebDriver
 
 from core.utils.selene.common.none_object import _NoneObject
 from core.utils.selene.core.exceptions import TimeoutException
+from core.utils.selene.core.polling import Polling, to_polling
 from core.utils.selene.core.wait import Wait
 
 
@@ -28,6 +29,8 @@ class Config:
             window_width: Optional[int] = None,
             window_height: Optional[int] = None,
             log_outer_html_on_failure: bool = False,
+            poll_during_waits: Optional[Union[int, Polling]] = None,
+            wait_for_conditions_by_js: bool = False,
     ):
         self._driver = driver
         self._timeout = timeout
@@ -41,6 +44,8 @@ class Config:
         self._window_width = window_width
         self._window_height = window_height
         self._log_outer_html_on_failure = log_outer_html_on_failure
+        self._poll_during_waits = poll_during_waits
+        self._wait_for_conditions_by_js = wait_for_conditions_by_js
 
     def as_dict(self, skip_empty=True):
         return {
@@ -82,7 +87,10 @@ class Config:
 
     def wait(self, entity):
         return Wait(
-            entity, at_most=self.timeout, or_fail_with=self.hook_wait_failure
+            entity,
+            at_most=self.timeout,
+            or_fail_with=self.hook_wait_failure,
+            polling=to_polling(self.poll_during_waits),
         )
 
     @property
@@ -112,3 +120,11 @@ class Config:
     @property
     def log_outer_html_on_failure(self) -> bool:
         return self._log_outer_html_on_failure
+
+    @property
+    def poll_during_waits(self) -> Optional[Union[int, Polling]]:
+        return self._poll_during_waits
+
+    @property
+    def wait_for_conditions_by_js(self) -> bool:
+        return self._wait_for_conditions_by_js
@@ -4,6 +4,7 @@ import warnings
 from abc import abstractmethod, ABC
 from typing import TypeVar, Union, List, Dict, Any, Callable, Tuple
 
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -97,6 +98,25 @@ class Element(WaitingEntity):
 
         return log_webelement_outer_html
 
+    @staticmethod
+    def _observed_by_js(
+            condition: Condition[[], Element]
+    ) -> Condition[[], Element]:
+        def fn(element: Element) -> None:
+            try:
+                condition.call(element)
+                return
+            except Exception as reason:
+                try:
+                    matched = element._wait_for_js_condition(condition.js)
+                except Exception:
+                    matched = False
+                if not matched:
+                    raise reason
+            condition.call(element)
+
+        return Condition(str(condition), fn, condition.js)
+
     def __init__(self, locator: Locator[WebElement], config: Config):
         self._locator = locator
         super().__init__(config)
@@ -180,6 +200,65 @@ class Element(WaitingEntity):
             extra_args,
         )
 
+    def _execute_async_script(
+            self,
+            script_on_self_element_args_and_done: str,
+            *extra_args,
+    ):
+        driver: WebDriver = self.config.driver
+        webelement = self()
+        return driver.execute_async_script(
+            f'''
+                return (function(element, args, done) {{
+                    {script_on_self_element_args_and_done}
+                }})(arguments[0], arguments[1], arguments[arguments.length - 1])
+            ''',
+            webelement,
+            extra_args,
+        )
+
+    def _wait_for_js_condition(self, js: str) -> bool:
+        return self._execute_async_script(
+            f'''
+                var timeoutMs = args[0];
+                var matches = function() {{
+                    try {{
+                        return !!({js});
+                    }} catch (e) {{
+                        return false;
+                    }}
+                }};
+
+                if (matches()) {{
+                    done(true);
+                    return;
+                }}
+
+                var observer = new MutationObserver(function() {{
+                    if (matches()) {{
+                        finish(true);
+                    }}
+                }});
+                var timer = setTimeout(function() {{
+                    finish(matches());
+                }}, timeoutMs);
+
+                function finish(result) {{
+                    observer.disconnect();
+                    clearTimeout(timer);
+                    done(result);
+                }}
+
+                observer.observe(document, {{
+                    attributes: true,
+                    childList: true,
+                    characterData: true,
+                    subtree: true
+                }});
+            ''',
+            int(min(self.config.timeout, 2) * 1000),
+        )
+
     def set_value(self, value: Union[str, int]) -> Element:
         def fn(element: Element):
             webelement = (
@@ -379,7 +458,10 @@ class Element(WaitingEntity):
                 "or just `...with_(timeout=6).should(...` style instead",
                 DeprecationWarning,
             )
-            return self.with_(Config(timeout=timeout)).should(condition)
+            return self.with_(timeout=timeout).should(condition)
+
+        if self.config.wait_for_conditions_by_js and getattr(condition, 'js', None):
+            condition = Element._observed_by_js(condition)
 
         super().should(condition)
         return self
@@ -837,6 +919,53 @@ class Collection(WaitingEntity):
     def to(self, stop: int) -> Collection:
         return self[:stop]
 
+    def _indices_matching_by_js(
+            self, webelements: List[WebElement], js: str
+    ) -> List[int]:
+        driver: WebDriver = self.config.driver
+        return driver.execute_script(
+            f'''
+                return (function(webelements) {{
+                    var matches = function(element) {{
+                        try {{
+                            return !!({js});
+                        }} catch (e) {{
+                            return false;
+                        }}
+                    }};
+                    var indices = [];
+                    webelements.forEach(function(element, index) {{
+                        if (matches(element)) {{
+                            indices.push(index);
+                        }}
+                    }});
+                    return indices;
+                }})(arguments[0])
+            ''',
+            webelements,
+        )
+
+    def _filter_webelements(
+            self, condition: Condition[[], Element]
+    ) -> List[WebElement]:
+        if condition.js:
+            webelements = self()
+            if not webelements:
+                return []
+            try:
+                return [
+                    webelements[index]
+                    for index in self._indices_matching_by_js(
+                        webelements, condition.js
+                    )
+                ]
+            except WebDriverException:
+                pass
+
+        return [
+            element() for element in self.cached if element.matching(condition)
+        ]
+
     def filtered_by(
             self, condition: Union[Condition[[], Element], Callable[[E], None]]
     ) -> Collection:
@@ -849,11 +978,7 @@ class Collection(WaitingEntity):
         return Collection(
             Locator(
                 f'{self}.filtered_by({condition})',
-                lambda: [
-                    element()
-                    for element in self.cached
-                    if element.matching(condition)
-                ],
+                lambda: self._filter_webelements(condition),
             ),
             self.config,
         )
@@ -888,9 +1013,14 @@ class Collection(WaitingEntity):
         def find() -> WebElement:
             cached = self.cached
 
-            for element in cached:
-                if element.matching(condition):
-                    return element()
+            if condition.js:
+                matched = cached._filter_webelements(condition)
+                if matched:
+                    return matched[0]
+            else:
+                for element in cached:
+                    if element.matching(condition):
+                        return element()
 
             from core.utils.selene.core import query
 
@@ -1007,7 +1137,7 @@ class Collection(WaitingEntity):
                         "or just `...with_(timeout=6).should(...` style instead",
                         DeprecationWarning,
                     )
-                    element.with_(Config(timeout=timeout)).should(condition)
+                    element.with_(timeout=timeout).should(condition)
                 element.should(condition)
         else:
             if timeout:
@@ -1017,7 +1147,7 @@ class Collection(WaitingEntity):
                     "or just `...with_(timeout=6).should(...` style instead",
                     DeprecationWarning,
                 )
-                self.with_(Config(timeout=timeout)).should(condition)
+                self.with_(timeout=timeout).should(condition)
             super().should(condition)
         return self
 
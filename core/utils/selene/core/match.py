@@ -1,3 +1,4 @@
+import json
 import warnings
 from typing import List, Any
 
@@ -11,8 +12,28 @@ from core.utils.selene.core.conditions import (
 )
 from core.utils.selene.core.entity import Collection, Element, Browser
 
+
+def _js_attribute(name: str) -> str:
+    return f'({query.JS_ATTRIBUTE_OF.strip()})(element, {json.dumps(name)})'
+
+
+_js_is_visible = (
+    '(function(element) {'
+    ' if (!(element.offsetWidth || element.offsetHeight || element.getClientRects().length)) { return false; }'
+    ' if (window.getComputedStyle(element).visibility !== "visible") { return false; }'
+    ' for (var node = element; node && node.nodeType === 1; node = node.parentElement) {'
+    ' if (parseFloat(window.getComputedStyle(node).opacity) === 0) { return false; }'
+    ' }'
+    ' return true;'
+    ' })(element)'
+)
+
+_js_text = (
+    f'(({_js_is_visible}) ? (element.innerText || "").replace(/\\u00a0/g, " ").trim() : "")'
+)
+
 element_is_visible: Condition[[], Element] = ElementCondition.raise_if_not(
-    'is visible', lambda element: element().is_displayed()
+    'is visible', lambda element: element().is_displayed(), _js_is_visible
 )
 
 element_is_hidden: Condition[[], Element] = ElementCondition.as_not(
@@ -20,7 +41,7 @@ element_is_hidden: Condition[[], Element] = ElementCondition.as_not(
 )
 
 element_is_enabled: Condition[[], Element] = ElementCondition.raise_if_not(
-    'is enabled', lambda element: element().is_enabled()
+    'is enabled', lambda element: element().is_enabled(), '!element.matches(":disabled")'
 )
 
 element_is_disabled: Condition[[], Element] = ElementCondition.as_not(
@@ -43,6 +64,7 @@ element_is_focused: Condition[[], Element] = ElementCondition.raise_if_not(
     'is focused',
     lambda element: element()
                     == element._webdriver.execute_script('return document.activeElement'),
+    'element === document.activeElement',
 )
 
 
@@ -50,16 +72,25 @@ def element_has_text(
         expected: str,
         describing_matched_to='has text',
         compared_by_predicate_to=predicate.includes,
+        js: str = None,
 ) -> Condition[[], Element]:
     return ElementCondition.raise_if_not_actual(
         describing_matched_to + ' ' + expected,
         query.text,
         compared_by_predicate_to(expected),
+        js
+        if js is not None or compared_by_predicate_to is not predicate.includes
+        else f'{_js_text}.indexOf({json.dumps(expected)}) !== -1',
     )
 
 
 def element_has_exact_text(expected: str) -> Condition[[], Element]:
-    return element_has_text(expected, 'has exact text', predicate.equals)
+    return element_has_text(
+        expected,
+        'has exact text',
+        predicate.equals,
+        f'{_js_text} === {json.dumps(expected)}',
+    )
 
 
 def element_has_js_property(name: str):
@@ -159,10 +190,16 @@ def element_has_attribute(name: str):
         return element().get_attribute(name)
 
     def attribute_values(collection: Collection) -> List[str]:
-        return [element.get_attribute(name) for element in collection()]
+        return [
+            item['attributes'][name]
+            for item in query.snapshot(name)(collection)
+        ]
 
     raw_attribute_condition = ElementCondition.raise_if_not_actual(
-        'has attribute ' + name, attribute_value, predicate.is_truthy
+        'has attribute ' + name,
+        attribute_value,
+        predicate.is_truthy,
+        f'{_js_attribute(name)} !== null',
     )
 
     class ConditionWithValues(ElementCondition):
@@ -178,6 +215,9 @@ def element_has_attribute(name: str):
                 f"has attribute '{name}' with value '{expected}'",
                 attribute_value,
                 predicate.equals(expected, ignore_case),
+                None
+                if ignore_case
+                else f'{_js_attribute(name)} === {json.dumps(expected)}',
             )
 
         def value_containing(
@@ -192,6 +232,9 @@ def element_has_attribute(name: str):
                 f"has attribute '{name}' with value containing '{expected}'",
                 attribute_value,
                 predicate.includes(expected, ignore_case),
+                None
+                if ignore_case
+                else f'({_js_attribute(name)} || "").indexOf({json.dumps(expected)}) !== -1',
             )
 
         def values(self, *expected: str) -> Condition[[], Collection]:
@@ -209,7 +252,9 @@ def element_has_attribute(name: str):
             )
 
     return ConditionWithValues(
-        str(raw_attribute_condition), raw_attribute_condition.call
+        str(raw_attribute_condition),
+        raw_attribute_condition.call,
+        raw_attribute_condition.js,
     )
 
 
@@ -234,6 +279,7 @@ def element_has_css_class(expected: str) -> Condition[[], Element]:
         f"has css class '{expected}'",
         class_attribute_value,
         predicate.includes_word(expected),
+        f'element.classList.contains({json.dumps(expected)})',
     )
 
 
@@ -251,6 +297,9 @@ def element_has_tag(
         f'{describing_matched_to} + {expected}',
         query.tag,
         compared_by_predicate_to(expected),
+        f'element.tagName.toLowerCase() === {json.dumps(expected.lower())}'
+        if compared_by_predicate_to is predicate.equals
+        else None,
     )
 
 
@@ -320,31 +369,17 @@ def collection_has_size_less_than_or_equal(
 
 
 def collection_has_texts(*expected: str) -> Condition[[], Collection]:
-    def visible_texts(collection: Collection) -> List[str]:
-        return [
-            webelement.text
-            for webelement in collection()
-            if webelement.is_displayed()
-        ]
-
     return CollectionCondition.raise_if_not_actual(
         f'has texts {expected}',
-        visible_texts,
+        query.visible_texts,
         predicate.equals_by_contains_to_list(expected),
     )
 
 
 def collection_has_exact_texts(*expected: str) -> Condition[[], Collection]:
-    def visible_texts(collection: Collection) -> List[str]:
-        return [
-            webelement.text
-            for webelement in collection()
-            if webelement.is_displayed()
-        ]
-
     return CollectionCondition.raise_if_not_actual(
         f'has exact texts {expected}',
-        visible_texts,
+        query.visible_texts,
         predicate.equals_to_list(expected),
     )
 
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import random
+from typing import Callable, Union, Optional
+
+Polling = Callable[[int], float]
+
+
+class fixed:
+    def __init__(self, interval: float):
+        self._interval = interval
+
+    def __call__(self, attempt: int) -> float:
+        return self._interval
+
+    def __str__(self):
+        return f'fixed({self._interval}s)'
+
+
+class exponential:
+    def __init__(self, initial: float = 0.05, factor: float = 2, at_most: float = 1):
+        self._initial = initial
+        self._factor = factor
+        self._at_most = at_most
+
+    def __call__(self, attempt: int) -> float:
+        try:
+            delay = self._initial * self._factor ** max(attempt - 1, 0)
+        except OverflowError:
+            return self._at_most
+        return min(delay, self._at_most)
+
+    def __str__(self):
+        return f'exponential({self._initial}s * {self._factor}^n, at most {self._at_most}s)'
+
+
+class jittered:
+    def __init__(self, polling: Polling, ratio: float = 0.5, rand: Callable[[], float] = random.random):
+        self._polling = polling
+        self._ratio = ratio
+        self._rand = rand
+
+    def __call__(self, attempt: int) -> float:
+        delay = self._polling(attempt)
+        return delay * (1 - self._ratio + 2 * self._ratio * self._rand())
+
+    def __str__(self):
+        return f'jittered({self._polling}, ±{int(self._ratio * 100)}%)'
+
+
+def to_polling(value: Union[int, float, Polling, None]) -> Optional[Polling]:
+    if value is None or callable(value):
+        return value
+    return fixed(value / 1000) if value > 0 else None
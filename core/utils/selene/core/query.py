@@ -1,5 +1,8 @@
+import json
 from typing import List, Dict, Any, Union
 
+from selenium.common.exceptions import WebDriverException
+
 from core.utils.selene.core.entity import Browser, Element, Collection
 from core.utils.selene.core.wait import Query
 
@@ -35,6 +38,99 @@ size: Union[Query[Element, Dict[str, Any]], Query[Collection, int]] = Query(
     else len(entity()),
 )
 
+_BOOLEAN_ATTRIBUTES = (
+    'async', 'autofocus', 'autoplay', 'checked', 'compact', 'complete', 'controls', 'declare',
+    'defaultchecked', 'defaultselected', 'defer', 'disabled', 'draggable', 'ended', 'formnovalidate',
+    'hidden', 'indeterminate', 'iscontenteditable', 'ismap', 'itemscope', 'loop', 'multiple', 'muted',
+    'nohref', 'noresize', 'noshade', 'novalidate', 'nowrap', 'open', 'paused', 'pubdate', 'readonly',
+    'required', 'reversed', 'scoped', 'seamless', 'seeking', 'selected', 'spellcheck', 'truespeed',
+    'willvalidate',
+)
+
+# mirrors WebElement.get_attribute: boolean attributes are "true" or null, other properties are strings
+JS_ATTRIBUTE_OF = '''
+    function(element, name) {
+        var lowerName = name.toLowerCase();
+        var propertyName = {'class': 'className', 'readonly': 'readOnly'}[lowerName] || name;
+        if (lowerName === 'style') {
+            return element.getAttribute('style') === null ? null : element.style.cssText;
+        }
+        if (%s.indexOf(lowerName) !== -1) {
+            return element.getAttribute(name) !== null || element[propertyName] === true ? 'true' : null;
+        }
+        var property = element[propertyName];
+        var value = property === undefined || property === null
+                    || typeof property === 'object' || typeof property === 'function'
+                    ? element.getAttribute(name)
+                    : property;
+        return value === undefined || value === null ? null : String(value);
+    }
+''' % json.dumps(list(_BOOLEAN_ATTRIBUTES))
+
+_SNAPSHOT_SCRIPT = '''
+    return (function(webelements, attributes) {
+        var attributeOf = ''' + JS_ATTRIBUTE_OF.strip() + ''';
+
+        return webelements.map(function(element) {
+            var isVisible = !!(
+                element.offsetWidth
+                || element.offsetHeight
+                || element.getClientRects().length
+            ) && window.getComputedStyle(element).visibility !== 'hidden';
+            var rect = element.getBoundingClientRect();
+            var values = {};
+            attributes.forEach(function(name) {
+                values[name] = attributeOf(element, name);
+            });
+
+            return {
+                text: isVisible ? (element.innerText || '').replace(/\u00a0/g, ' ').trim() : '',
+                visible: isVisible,
+                attributes: values,
+                rect: {
+                    x: rect.left + window.pageXOffset,
+                    y: rect.top + window.pageYOffset,
+                    width: rect.width,
+                    height: rect.height
+                }
+            };
+        });
+    })(arguments[0], arguments[1]);
+'''
+
+
+def _snapshot_of(webelement, attributes) -> Dict[str, Any]:
+    visible = webelement.is_displayed()
+    return {
+        'text': webelement.text if visible else '',
+        'visible': visible,
+        'attributes': {name: webelement.get_attribute(name) for name in attributes},
+        'rect': webelement.rect,
+    }
+
+
+def snapshot(*attributes: str) -> Query[Collection, List[Dict[str, Any]]]:
+    def fn(collection: Collection) -> List[Dict[str, Any]]:
+        webelements = collection()
+        if not webelements:
+            return []
+        try:
+            return collection.config.driver.execute_script(
+                _SNAPSHOT_SCRIPT, webelements, list(attributes)
+            )
+        except WebDriverException:
+            return [_snapshot_of(webelement, attributes) for webelement in webelements]
+
+    return Query(f'snapshot {attributes}' if attributes else 'snapshot', fn)
+
+
+visible_texts: Query[Collection, List[str]] = Query(
+    'visible texts',
+    lambda collection: [
+        item['text'] for item in snapshot()(collection) if item['visible']
+    ],
+)
+
 location: Query[Element, Dict[str, int]] = Query(
     'location', lambda element: element().location
 )
@@ -5,6 +5,7 @@ from typing import Generic, Callable, TypeVar, Optional
 
 from core.utils.selene.common.fp import identity
 from core.utils.selene.core.exceptions import TimeoutException
+from core.utils.selene.core.polling import Polling
 
 T = TypeVar('T')
 R = TypeVar('R')
@@ -40,19 +41,25 @@ class Wait(Generic[E]):
             entity: E,
             at_most: int,
             or_fail_with: Optional[Callable[[TimeoutException], Exception]] = None,
+            polling: Optional[Polling] = None,
     ):
         self._entity = entity
         self._timeout = at_most
         self._hook_failure = or_fail_with or identity
+        self._polling = polling
+        self._polls = 0
 
     def at_most(self, timeout: int) -> Wait[E]:
-        return Wait(self._entity, timeout, self._hook_failure)
+        return Wait(self._entity, timeout, self._hook_failure, self._polling)
 
     def or_fail_with(
             self, hook_failure: Optional[Callable[[TimeoutException], Exception]]
     ) -> Wait[E]:
 
-        return Wait(self._entity, self._timeout, hook_failure)
+        return Wait(self._entity, self._timeout, hook_failure, self._polling)
+
+    def polling_with(self, polling: Optional[Polling]) -> Wait[E]:
+        return Wait(self._entity, self._timeout, self._hook_failure, polling)
 
     @property
     def hook_failure(
@@ -60,26 +67,38 @@ class Wait(Generic[E]):
     ) -> Optional[Callable[[TimeoutException], Exception]]:
         return self._hook_failure
 
+    @property
+    def polling(self) -> Optional[Polling]:
+        return self._polling
+
+    @property
+    def polls(self) -> int:
+        return self._polls
+
     def for_(self, fn: Callable[[E], R]) -> R:
         finish_time = time.time() + self._timeout
+        self._polls = 0
 
         while True:
+            self._polls += 1
             try:
                 return fn(self._entity)
             except Exception as reason:
-                if time.time() > finish_time:
+                now = time.time()
+                if now > finish_time:
                     reason_message = str(reason)
 
                     reason_string = '{name}: {message}'.format(
                         name=reason.__class__.__name__, message=reason_message
                     )
                     timeout = self._timeout
+                    polls = self._polls
                     entity = self._entity
 
                     failure = TimeoutException(
                         f'''
 
-Timed out after {timeout}s, while waiting for:
+Timed out after {timeout}s ({polls} polls), while waiting for:
 {entity}.{fn}
 
 Reason: {reason_string}'''
@@ -87,6 +106,9 @@ Reason: {reason_string}'''
 
                     raise self._hook_failure(failure)
 
+                if self._polling:
+                    time.sleep(max(min(self._polling(self._polls), finish_time - now), 0))
+
     def until(self, fn: Callable[[E], R]) -> bool:
         try:
             self.for_(fn)
@@ -0,0 +1,114 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Optional, Dict
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.utils import ChromeType, get_browser_version_from_os
+
+CACHE_FILE = os.path.join(os.path.expanduser('~'), '.wdm', 'resolved_drivers.json')
+CACHE_TTL = 24 * 60 * 60
+
+_resolved: Dict[str, str] = {}
+
+
+@contextmanager
+def _file_lock(path: str, timeout: float = 120):
+    lock = f'{path}.lock'
+    finish_time = time.time() + timeout
+    while True:
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock) > timeout:
+                    os.remove(lock)
+                    continue
+            except OSError:
+                continue
+            if time.time() > finish_time:
+                raise TimeoutError(f'could not acquire lock {lock} in {timeout}s')
+            time.sleep(0.1)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        try:
+            os.remove(lock)
+        except OSError:
+            pass
+
+
+def _read_cache(path: str) -> dict:
+    try:
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(path: str, cache: dict):
+    temp = f'{path}.{os.getpid()}.tmp'
+    with open(temp, 'w', encoding='utf-8') as file:
+        json.dump(cache, file, indent=4)
+    os.replace(temp, path)
+
+
+def resolve(
+        key: str,
+        install: Callable[[], str],
+        pinned: Optional[str] = None,
+        cache_file: str = CACHE_FILE,
+        ttl: int = CACHE_TTL,
+) -> str:
+    if pinned:
+        if not os.path.isfile(pinned):
+            raise FileNotFoundError(f'pinned driver binary for {key} not found: {pinned}')
+        return pinned
+
+    if key in _resolved and os.path.isfile(_resolved[key]):
+        return _resolved[key]
+
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    with _file_lock(cache_file):
+        cache = _read_cache(cache_file)
+        entry = cache.get(key)
+        if not entry or not os.path.isfile(entry['path']) or time.time() - entry['resolved_at'] > ttl:
+            entry = {'path': install(), 'resolved_at': time.time()}
+            cache[key] = entry
+            _write_cache(cache_file, cache)
+
+    _resolved[key] = entry['path']
+    return entry['path']
+
+
+@lru_cache(maxsize=None)
+def _browser_version(browser_type: str) -> str:
+    try:
+        return get_browser_version_from_os(browser_type) or 'unknown'
+    except Exception:
+        return 'unknown'
+
+
+def _versioned(key: str, browser_type: str, pinned: Optional[str]) -> str:
+    return key if pinned else f'{key}:{_browser_version(browser_type)}'
+
+
+def chrome_driver(pinned: Optional[str] = None, chrome_type: str = ChromeType.GOOGLE) -> str:
+    return resolve(
+        _versioned(f'chromedriver:{chrome_type}', chrome_type, pinned),
+        lambda: ChromeDriverManager(chrome_type=chrome_type).install(),
+        pinned,
+    )
+
+
+def gecko_driver(pinned: Optional[str] = None) -> str:
+    return resolve(
+        _versioned('geckodriver', 'firefox', pinned),
+        lambda: GeckoDriverManager().install(),
+        pinned,
+    )
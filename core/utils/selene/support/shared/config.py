@@ -13,14 +13,14 @@ from selenium.webdriver import ChromeOptions, Chrome, Firefox
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.remote.webdriver import WebDriver
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
 from webdriver_manager.utils import ChromeType
 
 from core.utils.selene.common.fp import pipe
 from core.utils.selene.core.configuration import Config
 from core.utils.selene.core.exceptions import TimeoutException
+from core.utils.selene.core.polling import Polling, to_polling
 from core.utils.selene.core.wait import Wait
+from core.utils.selene.support import driver_binaries
 from core.utils.selene.support.webdriver import WebHelper
 
 T = TypeVar('T')
@@ -134,10 +134,12 @@ class SharedConfig(Config):
             set_driver: Callable[[], WebDriver] = None,
             source: _LazyDriver = None,
             browser_name: str = 'chrome',
+            driver_paths: Optional[dict] = None,
             hold_browser_open: bool = False,
             save_screenshot_on_failure: bool = True,
             save_page_source_on_failure: bool = True,
-            poll_during_waits: int = 100,
+            poll_during_waits: Union[int, Polling] = 100,
+            wait_for_conditions_by_js: bool = False,
             counter=None,
             reports_folder: Optional[str] = None,
             last_screenshot: Union[Optional[str], Source[str]] = None,
@@ -145,6 +147,7 @@ class SharedConfig(Config):
     ):
 
         self._browser_name = browser_name
+        self._driver_paths = driver_paths or {}
         self._hold_browser_open = hold_browser_open
         self._source = source or _LazyDriver(self)
         self._log_outer_html_on_failure = log_outer_html_on_failure
@@ -160,7 +163,6 @@ class SharedConfig(Config):
 
         self._save_screenshot_on_failure = save_screenshot_on_failure
         self._save_page_source_on_failure = save_page_source_on_failure
-        self._poll_during_waits = poll_during_waits
         self._counter = counter or itertools.count(
             start=int(round(time.time() * 1000))
         )
@@ -191,22 +193,29 @@ class SharedConfig(Config):
             window_height=window_height,
             hook_wait_failure=hook_wait_failure,
             log_outer_html_on_failure=log_outer_html_on_failure,
+            poll_during_waits=poll_during_waits,
+            wait_for_conditions_by_js=wait_for_conditions_by_js,
         )
 
     def _set_chrome_or_firefox_from_webdriver_manager(self):
         def get_chrome():
             return Chrome(
                 service=ChromeService(
-                    ChromeDriverManager(
-                        chrome_type=ChromeType.CHROMIUM
-                    ).install()
+                    driver_binaries.chrome_driver(
+                        pinned=self.driver_paths.get('chrome'),
+                        chrome_type=ChromeType.CHROMIUM,
+                    )
                 ),
                 options=ChromeOptions(),
             )
 
         def get_firefox():
             return Firefox(
-                service=FirefoxService(GeckoDriverManager().install())
+                service=FirefoxService(
+                    driver_binaries.gecko_driver(
+                        pinned=self.driver_paths.get('firefox')
+                    )
+                )
             )
 
         return {'chrome': get_chrome, 'firefox': get_firefox}.get(
@@ -302,7 +311,12 @@ PageSource: file://{path}'''
         hook = self._inject_screenshot_and_page_source_pre_hooks(
             self.hook_wait_failure
         )
-        return Wait(entity, at_most=self.timeout, or_fail_with=hook)
+        return Wait(
+            entity,
+            at_most=self.timeout,
+            or_fail_with=hook,
+            polling=to_polling(self.poll_during_waits),
+        )
 
     @Config.timeout.setter
     def timeout(self, value: int):
@@ -332,6 +346,10 @@ PageSource: file://{path}'''
     def window_height(self, value: Optional[int]):
         self._window_height = value
 
+    @Config.wait_for_conditions_by_js.setter
+    def wait_for_conditions_by_js(self, value: bool):
+        self._wait_for_conditions_by_js = value
+
     @Config.log_outer_html_on_failure.setter
     def log_outer_html_on_failure(self, value: bool):
         self._log_outer_html_on_failure = value
@@ -391,6 +409,14 @@ PageSource: file://{path}'''
     def browser_name(self, value: str):
         self._browser_name = value
 
+    @property
+    def driver_paths(self) -> dict:
+        return self._driver_paths
+
+    @driver_paths.setter
+    def driver_paths(self, value: Optional[dict]):
+        self._driver_paths = value or {}
+
     @property
     def cash_elements(self) -> bool:
         warnings.warn(
@@ -444,20 +470,8 @@ PageSource: file://{path}'''
             FutureWarning,
         )
 
-    @property
-    def poll_during_waits(self) -> int:
-        warnings.warn(
-            'browser.poll_during_waits might be deprecated',
-            PendingDeprecationWarning,
-        )
-        return self._poll_during_waits or 100
-
-    @poll_during_waits.setter
-    def poll_during_waits(self, value: int):
-        warnings.warn(
-            'browser.poll_during_waits= might be deprecated',
-            PendingDeprecationWarning,
-        )
+    @Config.poll_during_waits.setter
+    def poll_during_waits(self, value: Union[int, Polling]):
         self._poll_during_waits = value
 
     @property
@@ -1,17 +1,31 @@
 import os
+import re
 from datetime import datetime
 from json import loads
 from os import getenv
-from os.path import join, isfile
+from os.path import join
 from pathlib import Path
 from platform import system
-from typing import Optional, Any
+from typing import Optional, Any, Iterator
 
 from pytest import mark
 from testrail_api import TestRailAPI
 
+from core.utils.helpers import get_project_root
+from core.utils.testrail_cache import MetadataCache
+from core.utils.testrail_index import TestRailIndex
+from core.utils.testrail_results import ResultsBatch, paginated
+from core.utils.testrail_errors import is_unavailable
+from core.utils.testrail_spool import ResultsSpool
+
 
 class TestRail:
+    def __init__(self, cache: MetadataCache = None, spool: ResultsSpool = None):
+        self.cache = cache or MetadataCache()
+        self.spool = spool
+        self._tests_index = None
+        self._new_ids = {}
+
     @staticmethod
     def id(*ids: str) -> mark:
         return mark.testrail_ids(ids=ids)
@@ -33,7 +47,9 @@ class TestRail:
         return int(case[0]['status_id'])
 
     def _get_milestone_id(self, tr: TestRailAPI) -> int:
-        mls = tr.milestones.get_milestones(project_id=int(getenv('TESTRAIL_PROJECT_ID')))
+        mls = self.cache.get('milestones', lambda: paginated(
+            tr.milestones.get_milestones, 'milestones', project_id=int(getenv('TESTRAIL_PROJECT_ID'))
+        ))
         for ml in mls:
             if ml['name'] == str(getenv('TESTRAIL_MILESTONE')):
                 return ml['id']
@@ -44,42 +60,64 @@ class TestRail:
                 return run['id']
         return None
 
+    @property
+    def tests_index(self) -> TestRailIndex:
+        if self._tests_index is None:
+            tests = self._get_path({'is_tests': True, 'nested_path': 'tests'})
+            self._tests_index = TestRailIndex(
+                folder=tests,
+                cache_file=join(get_project_root(), '.cache', 'testrail_index.json')
+            )
+        return self._tests_index
+
     def _get_test_case_ids(self) -> list:
-        test_case_ids = []
-        tests = self._get_path({'is_tests': True, 'nested_path': 'tests'})
-        for root, dirs, files in os.walk(tests, topdown=False):
-            for name in files:
-                if name.split('.')[-1] == 'pyc':
-                    continue
-                file = open(os.path.join(root, name), 'r', encoding='UTF-8')
-                text = str(file.read())
-                while text.find("@TestRail.id('") != -1:
-                    start_with = text.find("@TestRail.id('") + 15
-                    id = text[start_with::].split("')")[0]
-                    if id != '' and len(id) > 2:
-                        test_case_ids.append(int(id))
-                    text = text[start_with::]
-        return test_case_ids
+        return self.tests_index.case_ids()
 
-    def _get_allure_result(self) -> dict:
-        results = []
-        testrail_ids = []
-        files = self._get_path({'is_nested_path': False})
-        for root, _, files in os.walk(files, topdown=False):
-            for file in files:
-                if 'result.json' in file:
-                    with open(os.path.join(root, file), 'r', encoding='UTF-8') as f:
-                        results.append(loads(f.read()))
+    def _get_case_ids_for_nodes(self, nodeids: list) -> list:
+        case_ids = []
+        for nodeid in nodeids:
+            file, _, node = re.sub(r'\[.*\]$', '', nodeid).partition('::')
+            parts = file.split('/')
+            if 'tests' in parts:
+                file = '/'.join(parts[parts.index('tests') + 1:])
+            test = self.tests_index.find(file, node) or {}
+            for case_id in test.get('ids', []):
+                if str(case_id) not in case_ids:
+                    case_ids.append(str(case_id))
+        return case_ids
+
+    @staticmethod
+    def _get_testrail_id(value: dict) -> Optional[str]:
         start = "testrail_ids(ids=('C"
         end = "',))"
-        for value in results:
-            if 'labels' in value.keys():
-                for label in value['labels']:
-                    if str(label['value']).startswith(start):
-                        testrail_ids.append(label['value'][len(start):-len(end)])
+        for label in value.get('labels', []):
+            if str(label['value']).startswith(start):
+                return label['value'][len(start):-len(end)]
+        return None
+
+    def _get_allure_files(self) -> list:
+        result_files = []
+        for root, _, files in os.walk(self._get_path({'is_nested_path': False})):
+            for file in files:
+                if 'result.json' in file:
+                    result_files.append(os.path.join(root, file))
+        return sorted(result_files)
+
+    def _iter_allure_results(self, files: list, with_testrail_ids: bool = False) -> Iterator[dict]:
+        for file in files:
+            with open(file, 'r', encoding='UTF-8') as f:
+                value = loads(f.read())
+            if with_testrail_ids and self._get_testrail_id(value) is None:
+                continue
+            yield value
+
+    def _get_allure_result(self) -> dict:
+        files = self._get_allure_files()
         return {
-            'results': results,
-            'testrail_ids': testrail_ids
+            'results': self._iter_allure_results(files),
+            'testrail_ids': [
+                self._get_testrail_id(value) for value in self._iter_allure_results(files, with_testrail_ids=True)
+            ]
         }
 
     def _get_comment(self, result, mode) -> str:
@@ -138,13 +176,17 @@ class TestRail:
         return files
 
     def _get_suites(self, tr: TestRailAPI, name: str) -> Optional[dict[str, Any]]:
-        for suite in tr.sections.get_sections(project_id=int(getenv('TESTRAIL_PROJECT_ID'))):
+        sections = self.cache.get('sections', lambda: paginated(
+            tr.sections.get_sections, 'sections', project_id=int(getenv('TESTRAIL_PROJECT_ID'))
+        ))
+        for suite in sections:
             if str(suite['name']).lower() == name.lower():
                 return {
                     'id': suite['id'],
                     'suite_id': suite['suite_id'],
                 }
         suite = tr.sections.add_section(project_id=int(getenv('TESTRAIL_PROJECT_ID')), name=name)
+        self.cache.invalidate('sections')
         return {
             'id': suite['id'],
             'suite_id': suite['suite_id'],
@@ -152,40 +194,28 @@ class TestRail:
 
     def _add_testrail_id_in_file_before_test(self, id: int, full_name: str):
         test_name = full_name.split('#')[-1]
-        class_name = full_name.split('#')[0].split('.')[-1]
-        full_test_path = '/'.join(full_name.split('#')[0].replace('.', '/').split('/')[1:-1]) \
-            if system().lower() in ['linux', 'darwin'] else \
-            '\\'.join(full_name.split('#')[0].replace('.', '/').split('/')[1:-1])
-        tests = self._get_path({'is_tests': True, 'nested_path': 'tests'})
-        readed_files = []
-        for root, dirs, files in os.walk(tests, topdown=False):
-            for name in files:
-                if name.split('.')[-1] == 'pyc':
-                    continue
-                file = open(os.path.join(root, name), 'r', encoding='UTF-8')
-                text = str(file.read())
-                file.close()
-                if class_name in text and test_name in text:
-                    readed_name = f'{full_test_path}/{class_name}/{test_name}'
-                    if readed_name in readed_files:
-                        continue
-                    readed_files.append(readed_name)
-                    with open(f'{tests}/{full_test_path}.py', 'r+', encoding='UTF-8') as file:
-                        src = file.readlines()
-                        file.seek(0)
-                        for line in src:
-                            test__name = str(line).split('def ')[1].split('(')[0] if test_name in line else ''
-                            if line.find(test_name) != -1 and test__name == test_name:
-                                file.write(f"    @TestRail.id('C{id}')\n{line}")
-                            else:
-                                file.write(line)
+        module_path = full_name.split('#')[0].split('.')
+        candidates = [
+            ('/'.join(module_path[1:-1]) + '.py', f'{module_path[-1]}::{test_name}'),
+            ('/'.join(module_path[1:]) + '.py', test_name),
+        ]
+        for file, node in candidates:
+            if self.tests_index.find(file, node) is not None:
+                self._new_ids.setdefault(file, {}).setdefault(node, []).append(int(id))
+                return
+
+    def write_testrail_ids(self) -> int:
+        new_ids, self._new_ids = self._new_ids, {}
+        return sum(self.tests_index.add_ids(file, ids) for file, ids in new_ids.items())
 
     def _get_test_cases_by_suite(self, tr: TestRailAPI, suite_id: int, section_id: int, case_name: str) -> dict:
-        cases = tr.cases.get_cases(
+        cases = self.cache.get(f'cases:{suite_id}:{section_id}', lambda: paginated(
+            tr.cases.get_cases,
+            'cases',
             project_id=int(getenv('TESTRAIL_PROJECT_ID')),
             suite_id=suite_id,
             section_id=section_id
-        )
+        ))
         data = {
             'result': False,
             'data': {}
@@ -202,7 +232,7 @@ class TestRail:
 
     def _get_custom_result_field(self, tr: TestRailAPI) -> dict:
         fields_list = {}
-        fields = tr.result_fields.get_result_fields()
+        fields = self.cache.get('result_fields', tr.result_fields.get_result_fields)
         for field in fields:
             if str(field['system_name']).startswith('custom_'):
                 fields_list[field['system_name']] = field['configs'][0]['options'][
@@ -211,7 +241,7 @@ class TestRail:
 
     def _get_custom_case_field(self, tr: TestRailAPI) -> dict:
         fields_list = {}
-        fields = tr.case_fields.get_case_fields()
+        fields = self.cache.get('case_fields', tr.case_fields.get_case_fields)
         for field in fields:
             if str(field['system_name']).startswith('custom_'):
                 fields_list[field['system_name']] = field['configs'][0]['options'][
@@ -233,6 +263,7 @@ class TestRail:
         custom_steps.append('\n\n\n')
         custom_steps.append(params_rest)
         tr.cases.update_case(case_id=case['id'], custom_steps=''.join(custom_steps))
+        self.cache.invalidate(f'case:{case["id"]}', f'cases:{case.get("suite_id")}:{case.get("section_id")}')
 
     def _create_test_case(self, tr: TestRailAPI, case_info: list, custom_fields: dict):
         result = {
@@ -294,6 +325,7 @@ class TestRail:
             title=result['title'],
             **custom_fields
         )
+        self.cache.invalidate(f'cases:{suite_id["suite_id"]}:{suite_id["id"]}')
         if 'fullName' in dict(case_info).keys():
             automated_type = self._get_test_type(value=dict(case_info).get('fullName'))
             self.set_automation_status(tr=tr, case_id=created_case['id'], automated_type=automated_type)
@@ -307,15 +339,18 @@ class TestRail:
     def set_automation_status(self, tr: TestRailAPI, case_id: int, automated_type: int):
         if system().lower() in ['linux', 'darwin']:
             return
-        case_info = tr.cases.get_case(case_id=case_id)
+        case_info = self.cache.get(f'case:{case_id}', lambda: tr.cases.get_case(case_id=case_id))
         if int(case_info['type_id']) != int(getenv('TESTRAIL_TYPE_AUTOMATED')):
             tr.cases.update_case(case_id=case_id, type_id=getenv('TESTRAIL_TYPE_AUTOMATED'))
+            self.cache.invalidate(f'case:{case_id}')
         if int(case_info['custom_automation_type']) != int(getenv('TESTRAIL_AUTOMATED_TYPE_API')) \
                 and int(automated_type) == int(getenv('TESTRAIL_AUTOMATED_TYPE_API')):
             tr.cases.update_case(case_id=case_id, custom_automation_type=automated_type)
+            self.cache.invalidate(f'case:{case_id}')
         if int(case_info['custom_automation_type']) != int(getenv('TESTRAIL_AUTOMATED_TYPE_GUI')) \
                 and int(automated_type) == int(getenv('TESTRAIL_AUTOMATED_TYPE_GUI')):
             tr.cases.update_case(case_id=case_id, custom_automation_type=automated_type)
+            self.cache.invalidate(f'case:{case_id}')
 
     def create_test_run(self, tr: TestRailAPI, testrail_ids=None) -> Optional[dict[int, Any]]:
         if testrail_ids is None:
@@ -347,14 +382,45 @@ class TestRail:
             return
         tr.runs.close_run(run_id=run_id)
 
-    def set_status(self, tr: TestRailAPI, data: dict):
+    def open_test_run(self, tr: TestRailAPI, testrail_ids=None):
+        try:
+            return self.create_test_run(tr=tr, testrail_ids=testrail_ids)
+        except Exception as e:
+            if self.spool is None or not is_unavailable(e):
+                raise
+            print(f'Не удалось создать прогон в TestRail, он будет создан из {self.spool.path}:', e)
+            return self.spool.create_run(testrail_ids=testrail_ids)
+
+    def finish_test_run(self, tr: TestRailAPI, run_id):
+        if self.spool is not None and self.spool.is_offline(run_id):
+            self.spool.close_run(run_id=run_id)
+            return
+        try:
+            self.close_test_run(tr=tr, run_id=run_id)
+        except Exception as e:
+            if self.spool is None or not is_unavailable(e):
+                raise
+            print(f'Не удалось закрыть прогон в TestRail, он будет закрыт из {self.spool.path}:', e)
+            self.spool.close_run(run_id=run_id)
+
+    def set_status(self, tr: TestRailAPI, data: dict, batch: ResultsBatch = None):
         test_run_id = data['test_run_id']
         case_id = int(str(data['case_id'][1:]))
         if test_run_id is None:
             return
-        if self._get_status(tr, case_id, test_run_id) == getenv('TESTRAIL_FAILED_STATUS'):
+        current_status = batch.status(case_id) if batch is not None else self._get_status(tr, case_id, test_run_id)
+        if str(current_status) == getenv('TESTRAIL_FAILED_STATUS'):
             print(f'Тест кейс с ID {data["case_id"]} уже находится в статусе Failed')
             return
+        if batch is not None:
+            batch.add(
+                case_id=case_id,
+                status_id=int(data['status']),
+                attachments=[data.get('screenshot')],
+                elapsed=data['elapsed'],
+                comment=data['comment']
+            )
+            return
         result = tr.results.add_result_for_case(
             run_id=int(test_run_id),
             case_id=int(case_id),
@@ -378,9 +444,7 @@ class TestRail:
             return '0.1s'
         return f'{seconds}s'
 
-    def set_statuses(self, tr, data):
-        raw_data = self._get_allure_result()
-        custom_case_fields = self._get_custom_case_field(tr=tr)
+    def _get_result_fields(self, tr: TestRailAPI) -> dict:
         custom_result_fields = self._get_custom_result_field(tr=tr)
         custom_browser = getenv('TESTRAIL_BROWSER')
         if custom_browser is not None:
@@ -388,109 +452,163 @@ class TestRail:
         for field in custom_result_fields.keys():
             if field == 'custom_browser' and custom_browser is not None:
                 custom_result_fields[field] = custom_browser
-        if int(getenv("ALLURE_FOR_TESTRAIL_ENABLED")) == 1 and len(raw_data['testrail_ids']) > 0 \
-                and data['teamcity_launches'] == getenv('TEAMCITY_LAUNCHES'):
-            data['test_run_id'] = self.create_test_run(tr=tr, testrail_ids=raw_data['testrail_ids'])
+        return custom_result_fields
+
+    def set_statuses(self, tr, data):
+        raw_data = self._get_allure_result()
+        self.set_allure_statuses(tr=tr, data=data, results=raw_data['results'], testrail_ids=raw_data['testrail_ids'])
+
+    def _get_step_image_path(self, value: dict, image: str) -> str:
+        return value.get('spooled_files', {}).get(image) \
+            or self._get_path({'is_tests': True, 'nested_path': f'{getenv("ALLURE_DIR")}/{image}'})
+
+    def _spool_allure_results(self, data: dict, values: list, testrail_ids: list):
+        if not data.get('test_run_id'):
+            data['test_run_id'] = self.spool.create_run(testrail_ids=testrail_ids)
+        for value in values:
+            value['spooled_files'] = {
+                step['attachments'][0]['source']: self._get_step_image_path(value, step['attachments'][0]['source'])
+                for step in value.get('steps', []) if step.get('attachments')
+            }
+        self.spool.add_allure_results(
+            run_id=data.get('test_run_id'), data=data, values=values, testrail_ids=testrail_ids
+        )
+
+    def set_allure_statuses(self, tr: TestRailAPI, data: dict, results: Iterator[dict], testrail_ids: list):
+        results = iter(results)
+        value = None
+        batch = None
         data['run_mode'] = data.get('run_mode', 'local')
         data['teamcity_launches'] = data.get('teamcity_launches', getenv('TEAMCITY_LAUNCHES') if getenv(
             'TEAMCITY_LAUNCHES') is not None else '1')
-        for value in raw_data['results']:
-            result = {
-                'case_id': None,
-                'case_name': '',
-                'case_status': '',
-                'case_description': '',
-                'case_time': 0,
-                'steps': [],
-                'attachments': [],
-                'upload_files': [],
-                'params': [],
-                'error': {
-                    'message': '',
-                    'trace': ''
-                }
+        is_own_run = int(getenv("ALLURE_FOR_TESTRAIL_ENABLED")) == 1 and len(testrail_ids) > 0 \
+            and data['teamcity_launches'] == getenv('TEAMCITY_LAUNCHES')
+        try:
+            custom_case_fields = self._get_custom_case_field(tr=tr)
+            custom_result_fields = self._get_result_fields(tr=tr)
+            if is_own_run and not data.get('test_run_id'):
+                data['test_run_id'] = self.open_test_run(tr=tr, testrail_ids=testrail_ids)
+            batch = ResultsBatch(tr=tr, run_id=data['test_run_id'], spool=self.spool)
+            for value in results:
+                self.set_allure_status(
+                    tr=tr,
+                    value=value,
+                    data=data,
+                    batch=batch,
+                    custom_case_fields=custom_case_fields,
+                    custom_result_fields=custom_result_fields
+                )
+                value = None
+        except Exception as e:
+            if self.spool is None or not is_unavailable(e):
+                raise
+            print(f'TestRail недоступен, результаты allure сохранены в {self.spool.path}:', e)
+            if batch is not None:
+                batch.close()
+            self.write_testrail_ids()
+            self._spool_allure_results(data=data, values=([value] if value else []) + list(results),
+                                       testrail_ids=testrail_ids)
+            if int(getenv('TESTRAIL_AUTOCLOSE_TESTRUN')) == 1 and is_own_run:
+                self.spool.close_run(run_id=data['test_run_id'])
+            return
+        batch.close()
+        self.write_testrail_ids()
+        if int(getenv('TESTRAIL_AUTOCLOSE_TESTRUN')) == 1 and is_own_run:
+            self.finish_test_run(tr=tr, run_id=data['test_run_id'])
+
+    def set_allure_status(
+            self,
+            tr: TestRailAPI,
+            value: dict,
+            data: dict,
+            batch: ResultsBatch,
+            custom_case_fields: dict,
+            custom_result_fields: dict
+    ):
+        result = {
+            'case_id': None,
+            'case_name': '',
+            'case_status': '',
+            'case_description': '',
+            'case_time': 0,
+            'steps': [],
+            'attachments': [],
+            'upload_files': [],
+            'params': [],
+            'error': {
+                'message': '',
+                'trace': ''
             }
-            result['case_name'] = value['name'] if 'name' in value.keys() else ''
-            result['case_status'] = value['status']
-            result['case_description'] = value['description'] if 'description' in value.keys() else ''
-            start = "testrail_ids(ids=('C"
-            end = "',))"
-            step_data = {}
-            if result['case_status'].lower() == 'broken':
+        }
+        result['case_name'] = value['name'] if 'name' in value.keys() else ''
+        result['case_status'] = value['status']
+        result['case_description'] = value['description'] if 'description' in value.keys() else ''
+        step_data = {}
+        if result['case_status'].lower() == 'broken':
+            return
+        result['case_id'] = self._get_testrail_id(value)
+        if result['case_id'] is None:
+            self._create_test_case(tr=tr, case_info=value, custom_fields=custom_case_fields)
+            return
+        if 'statusDetails' in value.keys():
+            result['error']['message'] = value['statusDetails']['message']
+            result['error']['trace'] = value['statusDetails']['trace']
+        if 'parameters' in value.keys():
+            result['params'].append('**Параметры**:\n')
+            result['params'].append('|||:Название|:Значение\n')
+            for parametr in value['parameters']:
+                result['params'].append(f'|| {parametr["name"]} | {parametr["value"]}\n')
+        if 'steps' in value.keys():
+            for step in value['steps']:
+                image = {
+                    'img': None,
+                    'name': ''
+                }
+                if 'parameters' in step.keys():
+                    for param in step['parameters']:
+                        if param['name'] == 'data' and param['value']:
+                            step_data['data'] = param['value']
+                        if param['name'] == 'expected_data' and param['value']:
+                            step_data['expected_data'] = param['value']
+                        if param['name'] == 'asserts_data' and param['value']:
+                            step_data['asserts_data'] = param['value']
+                if 'attachments' in step.keys():
+                    image['img'] = step["attachments"][0]["source"]
+                result['steps'].append({
+                    'name': step['name'],
+                    'status': step['status'],
+                    'time': self.formatted_time_for_testrail(round((step['stop'] - step['start']) / 1000, 3)),
+                    'data': step_data,
+                    'image': image
+                })
+                result['case_time'] += (step['stop'] - step['start']) / 1000
+        result['case_time'] = self.formatted_time_for_testrail(round(result['case_time'], 3))
+        if 'attachments' in value.keys():
+            for attachment in value['attachments']:
+                result['attachments'].append(attachment["source"])
+        for key, val in enumerate(result['steps']):
+            if val['status'] == 'passed':
                 continue
-            if 'labels' in value.keys():
-                for label in value['labels']:
-                    if str(label['value']).startswith(start):
-                        result['case_id'] = label['value'][len(start):-len(end)]
-            if result['case_id'] is None:
-                self._create_test_case(tr=tr, case_info=value, custom_fields=custom_case_fields)
+            # if len(result['steps']) != key + 1:
+            #     continue
+            if val['image']['img'] is None:
                 continue
-            if 'statusDetails' in value.keys():
-                result['error']['message'] = value['statusDetails']['message']
-                result['error']['trace'] = value['statusDetails']['trace']
-            if 'parameters' in value.keys():
-                result['params'].append('**Параметры**:\n')
-                result['params'].append('|||:Название|:Значение\n')
-                for parametr in value['parameters']:
-                    result['params'].append(f'|| {parametr["name"]} | {parametr["value"]}\n')
-            if 'steps' in value.keys():
-                for step in value['steps']:
-                    image = {
-                        'img': None,
-                        'name': ''
-                    }
-                    if 'parameters' in step.keys():
-                        for param in step['parameters']:
-                            if param['name'] == 'data' and param['value']:
-                                step_data['data'] = param['value']
-                            if param['name'] == 'expected_data' and param['value']:
-                                step_data['expected_data'] = param['value']
-                            if param['name'] == 'asserts_data' and param['value']:
-                                step_data['asserts_data'] = param['value']
-                    if 'attachments' in step.keys():
-                        image['img'] = step["attachments"][0]["source"]
-                    result['steps'].append({
-                        'name': step['name'],
-                        'status': step['status'],
-                        'time': self.formatted_time_for_testrail(round((step['stop'] - step['start']) / 1000, 3)),
-                        'data': step_data,
-                        'image': image
-                    })
-                    result['case_time'] += (step['stop'] - step['start']) / 1000
-            result['case_time'] = self.formatted_time_for_testrail(round(result['case_time'], 3))
-            if 'attachments' in value.keys():
-                for attachment in value['attachments']:
-                    result['attachments'].append(attachment["source"])
-            for key, val in enumerate(result['steps']):
-                if val['status'] == 'passed':
-                    continue
-                # if len(result['steps']) != key + 1:
-                #     continue
-                if val['image']['img'] is None:
-                    continue
-                result['steps'][key]['image']['name'] = val["image"]["img"]
-                result['upload_files'].append(
-                    self._get_path({'is_tests': True, 'nested_path': f'{getenv("ALLURE_DIR")}/{val["image"]["img"]}'}))
-            case_status_id_current = int(self._get_status(tr, int(result['case_id']), int(data['test_run_id'])))
-            status_id = getenv('TESTRAIL_PASSED_STATUS')
-            if case_status_id_current == int(getenv('TESTRAIL_FAILED_STATUS')) or result['case_status'] == 'failed':
-                status_id = getenv('TESTRAIL_FAILED_STATUS')
-            if result['case_status'] == 'skipped':
-                status_id = getenv('TESTRAIL_BLOCKED_STATUS')
-            result_case = tr.results.add_result_for_case(
-                run_id=int(data['test_run_id']),
-                case_id=int(result['case_id']),
-                status_id=status_id,
-                elapsed=result['case_time'],
-                comment=self._get_comment(result, data['run_mode']),
-                **custom_result_fields
-            )
-            for file in result['upload_files']:
-                if isfile(file):
-                    tr.attachments.add_attachment_to_result(result_case["id"], file)
-            if 'fullName' in value.keys():
-                automated_type = self._get_test_type(value=value['fullName'])
-                self.set_automation_status(tr=tr, case_id=result['case_id'], automated_type=automated_type)
-        if int(getenv('TESTRAIL_AUTOCLOSE_TESTRUN')) == 1 and len(raw_data['testrail_ids']) > 0 \
-                and data['teamcity_launches'] == getenv('TEAMCITY_LAUNCHES'):
-            self.close_test_run(tr=tr, run_id=data['test_run_id'])
+            result['steps'][key]['image']['name'] = val["image"]["img"]
+            result['upload_files'].append(self._get_step_image_path(value, val['image']['img']))
+        case_status_id_current = batch.status(result['case_id'])
+        status_id = getenv('TESTRAIL_PASSED_STATUS')
+        if case_status_id_current == int(getenv('TESTRAIL_FAILED_STATUS')) or result['case_status'] == 'failed':
+            status_id = getenv('TESTRAIL_FAILED_STATUS')
+        if result['case_status'] == 'skipped':
+            status_id = getenv('TESTRAIL_BLOCKED_STATUS')
+        batch.add(
+            case_id=int(result['case_id']),
+            status_id=status_id,
+            attachments=result['upload_files'],
+            elapsed=result['case_time'],
+            comment=self._get_comment(result, data['run_mode']),
+            **custom_result_fields
+        )
+        if 'fullName' in value.keys():
+            automated_type = self._get_test_type(value=value['fullName'])
+            self.set_automation_status(tr=tr, case_id=result['case_id'], automated_type=automated_type)
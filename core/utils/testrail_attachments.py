@@ -0,0 +1,135 @@
+import hashlib
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from os import getenv
+from os.path import isfile, join
+from threading import Lock
+from typing import Optional
+
+from testrail_api import TestRailAPI
+
+from core.utils.testrail_errors import is_unavailable
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+_pillow_warned = False
+
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AttachmentUploader:
+    def __init__(
+            self,
+            tr: TestRailAPI,
+            workers: Optional[int] = None,
+            retries: int = 3,
+            backoff: float = 0.5,
+            max_size: Optional[int] = None,
+            quality: Optional[int] = None
+    ):
+        self.tr = tr
+        self.workers = max(int(workers or getenv('TESTRAIL_UPLOAD_WORKERS') or 4), 1)
+        self.retries = max(int(retries), 1)
+        self.backoff = backoff
+        self.max_size = int(max_size or getenv('TESTRAIL_SCREENSHOT_MAX_SIZE') or 0)
+        self.quality = int(quality or getenv('TESTRAIL_SCREENSHOT_QUALITY') or 0)
+        self._executor = None
+        self._futures = []
+        self._uploaded = set()
+        self._prepared = {}
+        self._lock = Lock()
+        self._folder = None
+        self.failed = []
+
+    def _prepare(self, path: str, digest: str) -> str:
+        global _pillow_warned
+        if self.max_size <= 0 and self.quality <= 0:
+            return path
+        if Image is None:
+            if not _pillow_warned:
+                _pillow_warned = True
+                print('TESTRAIL_SCREENSHOT_MAX_SIZE и TESTRAIL_SCREENSHOT_QUALITY не применяются: '
+                      'не установлен пакет Pillow')
+            return path
+        with self._lock:
+            if digest in self._prepared:
+                return self._prepared[digest]
+            if self._folder is None:
+                self._folder = tempfile.mkdtemp(prefix='testrail_attachments_')
+        try:
+            with Image.open(path) as image:
+                if self.max_size > 0:
+                    image.thumbnail((self.max_size, self.max_size))
+                if self.quality > 0:
+                    prepared = join(self._folder, f'{digest}.jpg')
+                    image.convert('RGB').save(prepared, 'JPEG', quality=self.quality, optimize=True)
+                else:
+                    prepared = join(self._folder, f'{digest}.png')
+                    image.save(prepared, 'PNG', optimize=True)
+        except OSError:
+            prepared = path
+        with self._lock:
+            self._prepared[digest] = prepared
+        return prepared
+
+    def _upload(self, result_id: int, path: str, digest: str):
+        file = self._prepare(path, digest)
+        for attempt in range(self.retries):
+            try:
+                return self.tr.attachments.add_attachment_to_result(result_id, file)
+            except Exception as e:
+                if attempt + 1 == self.retries or not is_unavailable(e):
+                    print(f'Не удалось прикрепить файл {path} к результату {result_id}:', e)
+                    self.failed.append((result_id, path))
+                    return None
+                time.sleep(self.backoff * 2 ** attempt)
+
+    def submit(self, result_id: int, path: str) -> Optional[Future]:
+        if path is None or not isfile(path):
+            return None
+        digest = file_hash(path)
+        with self._lock:
+            if (result_id, digest) in self._uploaded:
+                return None
+            self._uploaded.add((result_id, digest))
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='testrail-upload')
+        future = self._executor.submit(self._upload, result_id, path, digest)
+        self._futures.append(future)
+        return future
+
+    def join(self):
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+        if self._folder is not None:
+            for file in self._prepared.values():
+                if file.startswith(self._folder):
+                    try:
+                        os.remove(file)
+                    except OSError:
+                        pass
+            self._prepared = {}
+
+    def close(self):
+        self.join()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._folder is not None:
+            try:
+                os.rmdir(self._folder)
+            except OSError:
+                pass
+            self._folder = None
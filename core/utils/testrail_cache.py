@@ -0,0 +1,58 @@
+import json
+import os
+import time
+from os.path import join
+from typing import Any, Callable, Optional
+
+
+class MetadataCache:
+    def __init__(self, folder: Optional[str] = None, ttl: int = 0):
+        self.folder = folder
+        self.ttl = ttl
+        self._memory = {}
+
+    def _file(self, key: str) -> str:
+        return join(self.folder, 'testrail_cache', f'{key.replace(":", "_")}.json')
+
+    def _read(self, key: str) -> Optional[dict]:
+        if not self.folder or self.ttl <= 0:
+            return None
+        try:
+            with open(self._file(key), 'r', encoding='UTF-8') as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry['saved_at'] > self.ttl:
+            return None
+        return entry
+
+    def _write(self, key: str, value: Any):
+        if not self.folder or self.ttl <= 0:
+            return
+        path = self._file(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp = f'{path}.{os.getpid()}.tmp'
+        with open(temp, 'w', encoding='UTF-8') as file:
+            json.dump({'saved_at': time.time(), 'value': value}, file)
+        os.replace(temp, path)
+
+    def get(self, key: str, load: Callable[[], Any]) -> Any:
+        if key in self._memory:
+            return self._memory[key]
+        entry = self._read(key)
+        if entry is not None:
+            value = entry['value']
+        else:
+            value = load()
+            self._write(key, value)
+        self._memory[key] = value
+        return value
+
+    def invalidate(self, *keys: str):
+        for key in keys:
+            self._memory.pop(key, None)
+            if self.folder:
+                try:
+                    os.remove(self._file(key))
+                except OSError:
+                    pass
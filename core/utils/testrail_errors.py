@@ -0,0 +1,10 @@
+from requests.exceptions import ConnectionError, RequestException, Timeout
+from testrail_api import StatusCodeError
+
+
+def is_unavailable(error: Exception) -> bool:
+    if isinstance(error, StatusCodeError):
+        return bool(error.args) and (error.args[0] == 429 or int(error.args[0]) >= 500)
+    if isinstance(error, (ConnectionError, Timeout)):
+        return True
+    return isinstance(error, OSError) and not isinstance(error, RequestException)
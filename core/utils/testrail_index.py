@@ -0,0 +1,153 @@
+import ast
+import json
+import os
+import re
+from os.path import join, relpath
+from typing import Optional
+
+CASE_ID = re.compile(r'^C?(\d+)$')
+
+
+def _marker(decorator: ast.expr) -> Optional[str]:
+    if not isinstance(decorator, ast.Call) or not isinstance(decorator.func, ast.Attribute):
+        return None
+    if not isinstance(decorator.func.value, ast.Name) or decorator.func.value.id != 'TestRail':
+        return None
+    return decorator.func.attr if decorator.func.attr in ('id', 'suite') else None
+
+
+def _arguments(decorator: ast.Call) -> list:
+    return [arg.value for arg in decorator.args if isinstance(arg, ast.Constant) and isinstance(arg.value, str)]
+
+
+def parse_tests(source: str) -> dict:
+    tests = {}
+
+    def visit(body, prefix):
+        for node in body:
+            if isinstance(node, ast.ClassDef):
+                visit(node.body, f'{prefix}{node.name}::')
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith('test'):
+                test = {'ids': [], 'suite': None, 'line': node.lineno}
+                for decorator in node.decorator_list:
+                    marker = _marker(decorator)
+                    if marker == 'id':
+                        test['ids'].extend(
+                            int(CASE_ID.match(arg).group(1)) for arg in _arguments(decorator) if CASE_ID.match(arg)
+                        )
+                    elif marker == 'suite' and _arguments(decorator):
+                        test['suite'] = _arguments(decorator)[0]
+                tests[f'{prefix}{node.name}'] = test
+
+    visit(ast.parse(source).body, '')
+    return tests
+
+
+class TestRailIndex:
+    def __init__(self, folder: str, cache_file: Optional[str] = None):
+        self.folder = folder
+        self.cache_file = cache_file
+        self._files = None
+
+    def _load(self) -> dict:
+        if self.cache_file is None:
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='UTF-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        if self.cache_file is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            temp = f'{self.cache_file}.{os.getpid()}.tmp'
+            with open(temp, 'w', encoding='UTF-8') as file:
+                json.dump(self._files, file)
+            os.replace(temp, self.cache_file)
+        except OSError as e:
+            print(f'Не удалось сохранить индекс тестов в {self.cache_file}:', e)
+
+    def _parse(self, path: str, stat: os.stat_result) -> dict:
+        try:
+            with open(path, 'r', encoding='UTF-8') as file:
+                tests = parse_tests(file.read())
+        except (OSError, SyntaxError, ValueError):
+            tests = {}
+        return {'mtime': stat.st_mtime, 'size': stat.st_size, 'tests': tests}
+
+    def refresh(self) -> dict:
+        cached = self._files if self._files is not None else self._load()
+        files = {}
+        changed = self._files is None and len(cached) == 0
+        for root, _, names in os.walk(self.folder):
+            for name in names:
+                if not name.endswith('.py'):
+                    continue
+                path = join(root, name)
+                key = relpath(path, self.folder).replace(os.sep, '/')
+                stat = os.stat(path)
+                entry = cached.get(key)
+                if entry is None or entry['mtime'] != stat.st_mtime or entry['size'] != stat.st_size:
+                    entry = self._parse(path, stat)
+                    changed = True
+                files[key] = entry
+        changed = changed or set(files) != set(cached)
+        self._files = files
+        if changed:
+            self._save()
+        return self._files
+
+    def update(self, file: str):
+        if self._files is None:
+            self.refresh()
+            return
+        path = join(self.folder, file)
+        self._files[file] = self._parse(path, os.stat(path))
+        self._save()
+
+    def add_ids(self, file: str, ids: dict) -> int:
+        entry = self.refresh().get(file)
+        if entry is None:
+            return 0
+        inserts = []
+        for node, case_ids in ids.items():
+            test = entry['tests'].get(node)
+            if test is None:
+                continue
+            new_ids = [case_id for case_id in dict.fromkeys(case_ids) if case_id not in test['ids']]
+            if new_ids:
+                inserts.append((test['line'], new_ids))
+        if not inserts:
+            return 0
+        path = join(self.folder, file)
+        with open(path, 'r', encoding='UTF-8') as f:
+            src = f.readlines()
+        for line, case_ids in sorted(inserts, reverse=True):
+            definition = src[line - 1]
+            indent = definition[:len(definition) - len(definition.lstrip())]
+            src[line - 1:line - 1] = [f"{indent}@TestRail.id('C{case_id}')\n" for case_id in case_ids]
+        temp = f'{path}.{os.getpid()}.tmp'
+        with open(temp, 'w', encoding='UTF-8') as f:
+            f.writelines(src)
+        os.replace(temp, path)
+        self.update(file)
+        return sum(len(case_ids) for _, case_ids in inserts)
+
+    def case_ids(self) -> list:
+        return [
+            case_id
+            for entry in self.refresh().values()
+            for test in entry['tests'].values()
+            for case_id in test['ids']
+        ]
+
+    def find(self, file: str, node: str) -> Optional[dict]:
+        if self._files is None:
+            self.refresh()
+        entry = self._files.get(file)
+        if entry is None:
+            return None
+        return entry['tests'].get(node)
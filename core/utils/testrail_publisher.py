@@ -0,0 +1,152 @@
+import os
+from json import loads
+from os import getenv
+from os.path import basename
+from threading import Event, Lock, Thread
+from typing import Optional
+
+from testrail_api import TestRailAPI
+
+from core.utils.testrail import TestRail
+from core.utils.testrail_results import ResultsBatch
+from core.utils.testrail_errors import is_unavailable
+
+
+class AllurePublisher:
+    def __init__(
+            self,
+            testrail: TestRail,
+            tr: TestRailAPI,
+            data: dict,
+            interval: Optional[float] = None,
+            min_gap: float = 1
+    ):
+        self.testrail = testrail
+        self.tr = tr
+        self.data = data
+        self.data['run_mode'] = data.get('run_mode', 'local')
+        self.interval = float(interval or getenv('TESTRAIL_PUBLISH_INTERVAL') or 0) or 30
+        self.min_gap = min(min_gap, self.interval)
+        self.testrail_ids = []
+        self.batch = None
+        self._fields = None
+        self._seen = set()
+        self._lock = Lock()
+        self._event = Event()
+        self._stop = Event()
+        self._stopped = False
+        self._thread = None
+
+    def start(self):
+        self._thread = Thread(target=self._run, name='testrail-publisher', daemon=True)
+        self._thread.start()
+
+    def add_testrail_ids(self, testrail_ids: list):
+        with self._lock:
+            for case_id in testrail_ids:
+                if str(case_id) not in self.testrail_ids:
+                    self.testrail_ids.append(str(case_id))
+
+    def notify(self):
+        self._event.set()
+
+    def _run(self):
+        while not self._stopped:
+            self._event.wait(self.interval)
+            self._event.clear()
+            if self._stopped:
+                return
+            try:
+                self.publish()
+            except Exception as e:
+                print('Не удалось отправить результаты в TestRail во время прогона:', e)
+            self._stop.wait(self.min_gap)
+
+    def _get_fields(self) -> tuple:
+        if self._fields is None:
+            self._fields = (
+                self.testrail._get_custom_case_field(tr=self.tr),
+                self.testrail._get_result_fields(tr=self.tr)
+            )
+        return self._fields
+
+    def _open_run(self, case_id: str) -> ResultsBatch:
+        if case_id not in self.testrail_ids:
+            self.testrail_ids.append(case_id)
+        if self.batch is None:
+            if not self.data.get('test_run_id'):
+                self.data['test_run_id'] = self.testrail.open_test_run(tr=self.tr, testrail_ids=self.testrail_ids)
+            self.batch = ResultsBatch(tr=self.tr, run_id=self.data['test_run_id'], spool=self.testrail.spool)
+        return self.batch
+
+    def _new_files(self) -> list:
+        files = []
+        try:
+            entries = os.scandir(self.testrail._get_path({'is_nested_path': False}))
+        except OSError:
+            return files
+        with entries:
+            for entry in entries:
+                if entry.name in self._seen:
+                    continue
+                if 'result.json' in entry.name:
+                    files.append(entry.path)
+                else:
+                    self._seen.add(entry.name)
+        return sorted(files)
+
+    def publish(self) -> int:
+        published = 0
+        with self._lock:
+            for file in self._new_files():
+                try:
+                    with open(file, 'r', encoding='UTF-8') as f:
+                        value = loads(f.read())
+                except (OSError, ValueError):
+                    continue
+                case_id = self.testrail._get_testrail_id(value)
+                custom_case_fields, custom_result_fields = self._get_fields()
+                self.testrail.set_allure_status(
+                    tr=self.tr,
+                    value=value,
+                    data=self.data,
+                    batch=self._open_run(case_id) if case_id is not None else self.batch,
+                    custom_case_fields=custom_case_fields,
+                    custom_result_fields=dict(custom_result_fields)
+                )
+                self._seen.add(basename(file))
+                published += 1
+        return published
+
+    def _spool_unpublished(self, error: Exception):
+        print(f'TestRail недоступен, результаты allure сохранены в {self.testrail.spool.path}:', error)
+        if self.batch is not None:
+            self.batch.close()
+        self.testrail.write_testrail_ids()
+        files = self._new_files()
+        self.testrail._spool_allure_results(
+            data=self.data,
+            values=list(self.testrail._iter_allure_results(files)),
+            testrail_ids=self.testrail_ids
+        )
+
+    def close(self, close_run: bool = True):
+        self._stopped = True
+        self._stop.set()
+        self._event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        try:
+            self.publish()
+        except Exception as e:
+            if self.testrail.spool is None or not is_unavailable(e):
+                raise
+            self._spool_unpublished(e)
+            return
+        self.testrail.write_testrail_ids()
+        if self.batch is None:
+            return
+        self.batch.close()
+        if close_run and int(getenv('TESTRAIL_AUTOCLOSE_TESTRUN')) == 1:
+            self.testrail.finish_test_run(tr=self.tr, run_id=self.data['test_run_id'])
@@ -0,0 +1,53 @@
+from os import getenv
+from queue import Queue
+from threading import Thread
+from typing import Callable, Optional
+
+_STOP = object()
+
+
+class BackgroundReporter:
+    def __init__(self, report: Callable[[dict], None], max_size: Optional[int] = None):
+        self._report = report
+        self._queue = Queue(maxsize=max(int(max_size or getenv('TESTRAIL_QUEUE_SIZE') or 1000), 1))
+        self._thread = None
+        self.failed = []
+
+    def _run(self):
+        while True:
+            data = self._queue.get()
+            try:
+                if data is _STOP:
+                    return
+                self._report(data)
+            except Exception as e:
+                print('Не удалось отправить результат в TestRail:', e)
+                self.failed.append(data)
+            finally:
+                self._queue.task_done()
+
+    def put(self, data: dict):
+        if self._thread is None:
+            self._thread = Thread(target=self._run, name='testrail-reporter', daemon=True)
+            self._thread.start()
+        self._queue.put(data)
+
+    def _retry_failed(self):
+        failed, self.failed = self.failed, []
+        error = None
+        for data in failed:
+            try:
+                self._report(data)
+            except Exception as e:
+                error = e
+                self.failed.append(data)
+        if self.failed:
+            raise RuntimeError(f'Не удалось отправить в TestRail результатов: {len(self.failed)}') from error
+
+    def close(self):
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+        self._retry_failed()
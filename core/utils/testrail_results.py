@@ -0,0 +1,134 @@
+from os import getenv
+from typing import Optional
+
+from testrail_api import TestRailAPI
+
+from core.utils.testrail_attachments import AttachmentUploader
+from core.utils.testrail_errors import is_unavailable
+from core.utils.testrail_spool import ResultsSpool
+
+
+PAGE_LIMIT = 250
+
+
+def paginated(method, key: str, *args, **kwargs) -> list:
+    items = []
+    offset = 0
+    while True:
+        response = method(*args, limit=PAGE_LIMIT, offset=offset, **kwargs)
+        if isinstance(response, dict):
+            page = response.get(key, [])
+            has_next = response.get('_links', {}).get('next') is not None
+        else:
+            page = response
+            has_next = len(page) == PAGE_LIMIT
+        items.extend(page)
+        if not has_next or len(page) == 0:
+            return items
+        offset += len(page)
+
+
+class ResultsIndex:
+    def __init__(self, tr: TestRailAPI, run_id: int):
+        self.tr = tr
+        self.run_id = run_id
+        self._statuses = None
+
+    def load(self):
+        tests = paginated(self.tr.tests.get_tests, 'tests', int(self.run_id))
+        case_by_test = {test['id']: int(test['case_id']) for test in tests}
+        self._statuses = {}
+        for result in paginated(self.tr.results.get_results_for_run, 'results', int(self.run_id)):
+            case_id = case_by_test.get(result['test_id'])
+            if case_id is None or case_id in self._statuses or result.get('status_id') is None:
+                continue
+            self._statuses[case_id] = int(result['status_id'])
+
+    def status(self, case_id: int) -> int:
+        if self._statuses is None:
+            self.load()
+        return self._statuses.get(int(case_id), 0)
+
+    def reset(self):
+        self._statuses = {}
+
+    def update(self, case_id: int, status_id: int):
+        if self._statuses is None:
+            self.load()
+        self._statuses[int(case_id)] = int(status_id)
+
+
+class ResultsBatch:
+    def __init__(
+            self,
+            tr: TestRailAPI,
+            run_id: int,
+            chunk_size: Optional[int] = None,
+            index: Optional[ResultsIndex] = None,
+            uploader: Optional[AttachmentUploader] = None,
+            spool: Optional[ResultsSpool] = None
+    ):
+        self.tr = tr
+        self.run_id = run_id
+        self.chunk_size = max(int(chunk_size or getenv('TESTRAIL_RESULTS_CHUNK_SIZE') or 100), 1)
+        self.index = index or ResultsIndex(tr=tr, run_id=run_id)
+        self.uploader = uploader or AttachmentUploader(tr=tr)
+        self.spool = spool
+        self._results = []
+        self._attachments = []
+        self._statuses = {}
+
+    def __len__(self):
+        return len(self._results)
+
+    def status(self, case_id: int) -> int:
+        if int(case_id) in self._statuses:
+            return self._statuses[int(case_id)]
+        if self.spool is not None and self.spool.is_offline(self.run_id):
+            return 0
+        try:
+            return self.index.status(case_id)
+        except Exception as e:
+            if self.spool is None:
+                raise
+            print('Не удалось получить статусы прогона из TestRail:', e)
+            self.index.reset()
+            return 0
+
+    def add(self, case_id: int, status_id: int, attachments: list = None, **fields):
+        self._results.append({'case_id': int(case_id), 'status_id': int(status_id), **fields})
+        self._attachments.append([file for file in attachments or [] if file is not None])
+        self._statuses[int(case_id)] = int(status_id)
+        if len(self._results) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> list:
+        posted = []
+        while self._results:
+            results = self._results[:self.chunk_size]
+            attachments = self._attachments[:self.chunk_size]
+            created = None
+            if self.spool is None or not self.spool.is_offline(self.run_id):
+                try:
+                    created = self.tr.results.add_results_for_cases(run_id=int(self.run_id), results=results)
+                except Exception as e:
+                    if self.spool is None or not is_unavailable(e):
+                        raise
+                    print(f'Не удалось отправить результаты в TestRail, они сохранены в {self.spool.path}:', e)
+            del self._results[:self.chunk_size]
+            del self._attachments[:self.chunk_size]
+            if created is None:
+                self.spool.add_results(self.run_id, results, attachments)
+                continue
+            posted.extend(created)
+            for result in results:
+                self.index.update(result['case_id'], result['status_id'])
+            for result, files in zip(created, attachments):
+                for file in files:
+                    self.uploader.submit(result['id'], file)
+        return posted
+
+    def close(self) -> list:
+        posted = self.flush()
+        self.uploader.close()
+        return posted
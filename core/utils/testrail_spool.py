@@ -0,0 +1,194 @@
+import json
+import os
+import shutil
+import sys
+from argparse import ArgumentParser
+from configparser import ConfigParser
+from os.path import basename, isfile, join
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Iterator, Optional
+from uuid import uuid4
+
+from testrail_api import TestRailAPI
+
+from core.utils.testrail_attachments import AttachmentUploader, file_hash
+
+OFFLINE_RUN = 'spool:'
+
+
+class ResultsSpool:
+    def __init__(self, path: str):
+        self.path = path
+        self.files = f'{path}.files'
+        self._lock = Lock()
+
+    @staticmethod
+    def is_offline(run_id) -> bool:
+        return str(run_id).startswith(OFFLINE_RUN)
+
+    def _append(self, record: dict):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._lock, open(self.path, 'a', encoding='UTF-8') as file:
+            file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _keep(self, path: str) -> Optional[str]:
+        if path is None or not isfile(path):
+            return None
+        os.makedirs(self.files, exist_ok=True)
+        kept = join(self.files, f'{file_hash(path)}-{basename(path)}')
+        if not isfile(kept):
+            shutil.copyfile(path, kept)
+        return kept
+
+    def create_run(self, testrail_ids: list = None) -> str:
+        key = f'{OFFLINE_RUN}{uuid4()}'
+        self._append({'kind': 'run', 'key': key, 'testrail_ids': list(testrail_ids or [])})
+        return key
+
+    def add_results(self, run_id, results: list, attachments: list):
+        self._append({
+            'kind': 'results',
+            'run_id': run_id,
+            'results': results,
+            'attachments': [[kept for kept in map(self._keep, files) if kept] for files in attachments]
+        })
+
+    def add_allure_results(self, run_id, data: dict, values: list, testrail_ids: list):
+        for value in values:
+            value['spooled_files'] = {
+                source: kept for source, kept in
+                ((source, self._keep(path)) for source, path in value.get('spooled_files', {}).items()) if kept
+            }
+        self._append({
+            'kind': 'allure',
+            'run_id': run_id,
+            'data': data,
+            'results': values,
+            'testrail_ids': list(testrail_ids)
+        })
+
+    def close_run(self, run_id):
+        self._append({'kind': 'close_run', 'run_id': run_id})
+
+    def records(self) -> Iterator[dict]:
+        if not isfile(self.path):
+            return
+        with open(self.path, 'r', encoding='UTF-8') as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _rewrite(self, records: list):
+        temp = f'{self.path}.{os.getpid()}.tmp'
+        with open(temp, 'w', encoding='UTF-8') as file:
+            for record in records:
+                file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        os.replace(temp, self.path)
+
+    def _mark_done(self, records: list, runs: dict):
+        for record in records:
+            if record.get('run_id') in runs:
+                record['run_id'] = runs[record['run_id']]
+        self._rewrite(records)
+
+    @staticmethod
+    def _post_results(tr: TestRailAPI, run_id, record: dict, chunk_size: int, done: Callable[[], None]):
+        uploader = AttachmentUploader(tr=tr)
+        try:
+            for start in range(record.get('posted', 0), len(record['results']), chunk_size):
+                results = record['results'][start:start + chunk_size]
+                created = tr.results.add_results_for_cases(run_id=int(run_id), results=results)
+                record['posted'] = start + len(results)
+                done()
+                for result, files in zip(created, record['attachments'][start:start + chunk_size]):
+                    for file in files:
+                        uploader.submit(result['id'], file)
+        finally:
+            uploader.close()
+
+    def replay(self, tr: TestRailAPI, testrail, chunk_size: Optional[int] = None) -> int:
+        with self._lock:
+            records = list(self.records())
+        runs = {}
+        posted = 0
+        for position, record in enumerate(records):
+            before = record.get('posted', 0)
+            try:
+                if record['kind'] == 'run':
+                    runs[record['key']] = testrail.create_test_run(tr=tr, testrail_ids=record['testrail_ids'])
+                elif record['kind'] == 'close_run':
+                    testrail.close_test_run(tr=tr, run_id=runs.get(record['run_id'], record['run_id']))
+                elif record['kind'] == 'allure':
+                    run_id = runs.get(record['run_id'], record['run_id'])
+                    if not run_id:
+                        run_id = record['run_id'] = testrail.create_test_run(
+                            tr=tr, testrail_ids=record['testrail_ids']
+                        )
+                        self._mark_done(records[position:], runs)
+                    testrail.set_allure_statuses(
+                        tr=tr,
+                        data={**record['data'], 'test_run_id': run_id},
+                        results=record['results'],
+                        testrail_ids=record['testrail_ids']
+                    )
+                    record['posted'] = len(record['results'])
+                else:
+                    self._post_results(
+                        tr=tr,
+                        run_id=runs.get(record['run_id'], record['run_id']),
+                        record=record,
+                        chunk_size=max(int(chunk_size or len(record['results'])), 1),
+                        done=lambda: self._mark_done(records[position:], runs)
+                    )
+            except Exception as e:
+                print('Не удалось отправить сохранённые результаты в TestRail:', e)
+                self._mark_done(records[position:], runs)
+                return posted + record.get('posted', 0) - before
+            posted += record.get('posted', 0) - before
+            self._mark_done(records[position + 1:], runs)
+        os.remove(self.path)
+        shutil.rmtree(self.files, ignore_errors=True)
+        return posted
+
+
+def _load_pytest_env(ini: str):
+    parser = ConfigParser(interpolation=None)
+    parser.read(ini, encoding='UTF-8')
+    for line in parser.get('pytest', 'env', fallback='').splitlines():
+        if '=' in line:
+            key, value = line.strip().split('=', 1)
+            os.environ.setdefault(key, value)
+
+
+def spool_path(root) -> str:
+    path = os.getenv('TESTRAIL_SPOOL') or join('.cache', 'testrail_spool.jsonl')
+    return path if os.path.isabs(path) else str(join(root, path))
+
+
+def main(argv: list = None) -> int:
+    root = Path(__file__).parent.parent.parent
+    parser = ArgumentParser(description='Отправка сохранённых результатов в TestRail')
+    parser.add_argument('--spool', default=None)
+    parser.add_argument('--ini', default=str(join(root, 'pytest.ini')))
+    args = parser.parse_args(argv)
+    _load_pytest_env(args.ini)
+    spool = ResultsSpool(args.spool or spool_path(root))
+
+    from core.utils.testrail import TestRail
+
+    tr = TestRailAPI(
+        url=os.getenv('TESTRAIL_URL'),
+        email=os.getenv('TESTRAIL_EMAIL'),
+        password=os.getenv('TESTRAIL_PASSWORD'),
+        verify=False
+    )
+    posted = spool.replay(tr=tr, testrail=TestRail())
+    print(f'Отправлено результатов: {posted}')
+    return 1 if isfile(spool.path) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
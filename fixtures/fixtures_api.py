@@ -1,22 +1,81 @@
+import re
 from os import getenv
+from os.path import join, splitext
 
 import pytest
-from requests import Session
 
 from api import ApiJsonplaceholder
-from core.utils.helpers import get_settings
+from api.async_base_api import AsyncBaseApi
+from api.cassette import Cassette
+from api.response_cache import ResponseCache
+from api.retry import RetryPolicy
+from api.transport import create_session
+from core.utils.helpers import get_project_root, get_settings
 
-
-settings_config = get_settings(environment=getenv('environment'))
 api_session = None
+api_retry = RetryPolicy()
+api_concurrency = 10
+api_cache = None
 
 
 @pytest.hookimpl(tryfirst=True)
 def pytest_sessionstart():
-    global api_session
-    api_session = Session()
+    global api_session, api_retry, api_concurrency, api_cache
+    api_settings = get_settings(environment=getenv('environment')).get('API') or {}
+    api_session = create_session(api_settings)
+    api_retry = RetryPolicy.from_settings(api_settings.get('RETRY'))
+    api_concurrency = min(api_settings.get('CONCURRENCY', api_concurrency), api_settings.get('POOL_MAXSIZE', 10))
+    api_cache = ResponseCache.from_settings(api_settings.get('CACHE'))
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish():
+    if api_session is not None:
+        api_session.close()
+    if api_retry.retries:
+        print('Количество повторных API запросов:', api_retry.retries)
+    if api_cache is not None:
+        print(f'Кэш API ответов: {api_cache.hits} из кэша, {api_cache.revalidated} подтверждено сервером, '
+              f'{api_cache.misses} запрошено')
+
+
+@pytest.fixture(scope='function')
+def api_cassette(request):
+    mode = getenv('API_CASSETTE_MODE')
+    if not mode:
+        yield None
+        return
+    module, *names = request.node.nodeid.split('::')
+    names = [re.sub(r'[^\w.-]+', '_', name) for name in names]
+    cassette = Cassette(
+        path=f"{join(get_project_root(), 'data', 'cassettes', splitext(module)[0], *names)}.json",
+        mode=mode
+    )
+    yield cassette
+    cassette.save()
+
+
+@pytest.fixture(scope='function')
+def api_jsonplaceholder(api_cassette):
+    settings_config = get_settings(environment=getenv('environment'))
+    return ApiJsonplaceholder(
+        api_base_url=settings_config['API_URL'],
+        session=api_session,
+        retry=api_retry,
+        cassette=api_cassette,
+        cache=api_cache
+    )
 
 
 @pytest.fixture(scope='function')
-def api_jsonplaceholder():
-    return ApiJsonplaceholder(api_base_url=settings_config['API_URL'], session=api_session)
+def async_api(api_cassette):
+    settings_config = get_settings(environment=getenv('environment'))
+    with AsyncBaseApi(
+            api_base_url=settings_config['API_URL'],
+            session=api_session,
+            retry=api_retry,
+            cassette=api_cassette,
+            cache=api_cache,
+            concurrency=api_concurrency
+    ) as api:
+        yield api